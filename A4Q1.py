@@ -1,47 +1,37 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from solvers.graphical import plot_region, solve_graphical
 
-x1 = np.linspace(-3,5,400)
-
-# Constraint lines
-c1 = (10-x1) / 2          # x1 + 2x2 = 10
-c2 = 6 - x1                 # x1 + x2 = 6
-c3 = x1 - 2                 # x1 - x2 = 2 (feasible side: x2 <= x1 - 2)
-c4 = (x1 - 1) / 2           # x1 - 2x2 = 1 (feasible side: x2 <= (x1 - 1)/2)
-              
-# Plot constraints
-plt.figure(figsize=(10, 8))
-plt.plot(x1, c1, label=r'$x_1 + 2x_2 \leq 10$', color='blue')
-plt.plot(x1, c2, label=r'$x_1 + x_2 \leq 6$', color='green')
-plt.plot(x1, c3, label=r'$x_1 - x_2 \leq 2$', color='orange')
-plt.plot(x1, c4, label=r'$x_1 - 2x_2 \leq 1$', color='purple')
-plt.plot(x1, np.zeros_like(x1), label=r'$x_2 \geq 0$', color='black')
-plt.plot(np.zeros_like(x1), x1, label=r'$x_1 \geq 0$', color='black')
-
-plt.xlim(-1, 5)
-plt.ylim(-1, 5)
-
-# Define vertices of the feasible region
-vertices = np.array([
-    [0, 5],    # Intersection of x1 + 2x2 = 10 and x2-axis
-    [2, 4],    # Intersection of x1 + 2x2 = 10 and x1 + x2 = 6
-    [4, 2],    # Intersection of x1 + x2 = 6 and x1 - x2 = 2
-    [3, 1],    # Intersection of x1 - x2 = 2 and x1 - 2x2 = 1
-    [1, 0],    # Intersection of x1 - 2x2 = 1 and x1-axis
-    [0, 0]     # Origin
+# Maximize Z = 2x1 + x2 subject to A @ x <= b (x >= 0 as the last two rows)
+c = np.array([2, 1])
+A = np.array([
+    [1, 2],     # x1 + 2x2 <= 10
+    [1, 1],     # x1 + x2 <= 6
+    [1, -1],    # x1 - x2 <= 2
+    [1, -2],    # x1 - 2x2 <= 1
+    [0, -1],    # x2 >= 0
+    [-1, 0],    # x1 >= 0
 ])
+b = np.array([10, 6, 2, 1, 0, 0])
+
+labels = [r'$x_1 + 2x_2 \leq 10$', r'$x_1 + x_2 \leq 6$', r'$x_1 - x_2 \leq 2$',
+          r'$x_1 - 2x_2 \leq 1$', r'$x_2 \geq 0$', r'$x_1 \geq 0$']
+colors = ['blue', 'green', 'orange', 'purple', 'black', 'black']
 
-# Shade the feasible region
-plt.fill(vertices[:, 0], vertices[:, 1], color='lightgreen', alpha=0.3, label='Feasible Region')
+def plot_feasible_region(A, b, vertices, optimum):
+    # matplotlib is only loaded when a plot is actually drawn
+    import matplotlib.pyplot as plt
 
-# Highlight the optimal solution
-plt.plot(4, 2, 'ro', markersize=8, label='Optimal Point (4, 2)')
-plt.annotate('(4, 2)', xy=(4, 2), xytext=(4.1, 2.1), color='red')
+    plot_region(A, b, vertices, optimum, labels, colors,
+                title='Graphical Solution of Linear Programming Problem')
+    plt.show()
 
-# Labels and title
-plt.xlabel(r'$x_1$', fontsize=12)
-plt.ylabel(r'$x_2$', fontsize=12)
-plt.title('Graphical Solution of Linear Programming Problem', fontsize=14)
-plt.legend(loc='upper right')
-plt.grid(True, linestyle='--')
-plt.show()
+if __name__ == '__main__':
+    # Vertices of the feasible region from the constraints (every pair of
+    # lines intersected at once, points outside a half-plane dropped), then
+    # Z evaluated over all of them
+    result = solve_graphical(c, A, b, maximize=True)
+    print("Vertices of the feasible region:")
+    for x1, x2 in result.vertices:
+        print(f"({x1:g}, {x2:g})  Z = {c @ (x1, x2):g}")
+    print(f"\nOptimal solution: x1 = {result.x[0]:g}, x2 = {result.x[1]:g}, Z = {result.fun:g}")
+    plot_feasible_region(A, b, result.vertices, result.x)
@@ -1,5 +1,7 @@
 import numpy as np
-from scipy.optimize import linprog
+from solvers.diet import DietModel
+from solvers.interior_point import interior_point
+from solvers.presolve import presolved_linprog
 
 # Define the problem parameters
 # Cost per unit for each food type
@@ -18,6 +20,8 @@ yields = np.array([
 # Minimum daily requirements
 requirements = np.array([800, 200, 700])
 
+nutrient_names = ["Protein", "Fat", "Carbohydrates"]
+
 # Linear Programming Model Formulation
 # Decision variables: x1, x2, x3, x4 (units of each food type)
 # Objective: Minimize cost = 45x1 + 40x2 + 85x3 + 65x4
@@ -27,42 +31,82 @@ requirements = np.array([800, 200, 700])
 #   6x1 + 4x2 + 7x3 + 4x4 >= 700 (carbohydrates)
 #   x1, x2, x3, x4 >= 0 (non-negativity)
 
-# For scipy.linprog, we need to convert ">=" constraints to "<=" by multiplying by -1
-A_ub = -yields.T  # Transpose and negate
-b_ub = -requirements
-
-# Bounds for variables (all non-negative)
-bounds = [(0, None)] * 4
-
-# Solve the linear programming problem
-result = linprog(
-    c=costs,           # Objective function coefficients
-    A_ub=A_ub,         # Inequality constraint coefficients
-    b_ub=b_ub,         # Inequality constraint right-hand side
-    bounds=bounds,     # Variable bounds
-    method='highs'     # Using the highs solver for better precision
-)
-
-# Display results
-print("Optimization Status:", result.message)
-print("\nOptimal Solution:")
-print(f"Food type 1: {result.x[0]:.4f} units")
-print(f"Food type 2: {result.x[1]:.4f} units")
-print(f"Food type 3: {result.x[2]:.4f} units")
-print(f"Food type 4: {result.x[3]:.4f} units")
-print(f"\nMinimum Cost: {result.fun:.2f} BDT")
-
-# Calculate actual nutrients obtained
-nutrients_obtained = yields.T @ result.x
-print("\nNutrients Obtained:")
-print(f"Proteins:       {nutrients_obtained[0]:.2f} (required: {requirements[0]})")
-print(f"Fat:            {nutrients_obtained[1]:.2f} (required: {requirements[1]})")
-print(f"Carbohydrates:  {nutrients_obtained[2]:.2f} (required: {requirements[2]})")
-
-# Check if any constraints are binding (at their limit)
-tolerance = 1e-6
-binding = np.isclose(nutrients_obtained, requirements, atol=tolerance)
-print("\nBinding Constraints:")
-nutrient_names = ["Protein", "Fat", "Carbohydrates"]
-for i, is_binding in enumerate(binding):
-    print(f"{nutrient_names[i]}: {'Yes' if is_binding else 'No'}")
\ No newline at end of file
+def solve_diet(costs, yields, requirements, method='highs', cache=None, presolve=False):
+    # For scipy.linprog, we need to convert ">=" constraints to "<=" by multiplying by -1
+    A_ub = -yields.T  # Transpose and negate
+    b_ub = -requirements
+
+    # Bounds for variables (all non-negative)
+    bounds = [(0, None)] * len(costs)
+
+    options = None
+    if method == 'ipm':
+        # In-project interior-point method; the crossover ends at a vertex,
+        # so the binding-constraint report below reads the same as for HiGHS
+        method, options = interior_point, {'crossover': True}
+
+    if cache is not None:
+        # A solvers.cache.SolutionCache answers repeated models without solving
+        return cache.solve(costs, A_ub=A_ub, b_ub=b_ub, bounds=bounds, method=method,
+                           options=options, presolve=presolve)
+
+    if presolve:
+        # Reduce the model first (dominated rows, implied bounds, scaling)
+        # and map the reduced solution back to all foods
+        return presolved_linprog(costs, A_ub=A_ub, b_ub=b_ub, bounds=bounds,
+                                 method=method, options=options)
+
+    if options is not None:
+        return interior_point(costs, A_ub=A_ub, b_ub=b_ub, bounds=bounds, **options)
+
+    from scipy.optimize import linprog
+
+    # Solve the linear programming problem
+    return linprog(
+        c=costs,           # Objective function coefficients
+        A_ub=A_ub,         # Inequality constraint coefficients
+        b_ub=b_ub,         # Inequality constraint right-hand side
+        bounds=bounds,     # Variable bounds
+        method=method      # HiGHS by default for better precision
+    )
+
+def print_solution(result, yields, requirements):
+    # Display results
+    print("Optimization Status:", result.message)
+    print("\nOptimal Solution:")
+    for j, units in enumerate(result.x):
+        print(f"Food type {j + 1}: {units:.4f} units")
+    print(f"\nMinimum Cost: {result.fun:.2f} BDT")
+
+    # Calculate actual nutrients obtained
+    nutrients_obtained = yields.T @ result.x
+    print("\nNutrients Obtained:")
+    print(f"Proteins:       {nutrients_obtained[0]:.2f} (required: {requirements[0]})")
+    print(f"Fat:            {nutrients_obtained[1]:.2f} (required: {requirements[1]})")
+    print(f"Carbohydrates:  {nutrients_obtained[2]:.2f} (required: {requirements[2]})")
+
+    # Check if any constraints are binding (at their limit)
+    tolerance = 1e-6
+    binding = np.isclose(nutrients_obtained, requirements, atol=tolerance)
+    print("\nBinding Constraints:")
+    for i, is_binding in enumerate(binding):
+        print(f"{nutrient_names[i]}: {'Yes' if is_binding else 'No'}")
+
+def print_sensitivity(costs, yields, requirements):
+    # Sensitivity analysis: shadow prices and the ranges over which the
+    # optimal basis stays optimal
+    model = DietModel(costs, yields, requirements)
+    model.solve()
+    ranges = model.sensitivity().ranging()
+    print("\nShadow Prices (BDT per unit of requirement):")
+    for i, name in enumerate(nutrient_names):
+        print(f"{name}: {ranges.shadow_prices[i] + 0.0:.4f} "
+              f"(valid for requirement {ranges.rhs_lower[i]:.2f} to {ranges.rhs_upper[i]:.2f})")
+    print("\nCost Ranges (optimal plan unchanged):")
+    for j in range(len(costs)):
+        print(f"Food type {j + 1}: {ranges.cost_lower[j]:.2f} to {ranges.cost_upper[j]:.2f} BDT")
+
+if __name__ == '__main__':
+    result = solve_diet(costs, yields, requirements)
+    print_solution(result, yields, requirements)
+    print_sensitivity(costs, yields, requirements)
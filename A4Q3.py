@@ -1,7 +1,9 @@
 import numpy as np
-from scipy.optimize import linprog
+from solvers.branch_and_bound import branch_and_bound
+from solvers.presolve import presolved_linprog
+from solvers.revised_simplex import solve_leq, solve_linprog
 
-c = [-12, -15, -14]  # Negative because linprog minimizes
+c = [-12, -15, -14]  # Negative because the solver minimizes
 
 A_ub = [
     [1, 1, 1],        # Total weight constraint
@@ -12,25 +14,41 @@ A_ub = [
 # Right-hand side of constraints
 b_ub = [100, 0, 0]
 
-# Bounds for variables (all non-negative)
-bounds = [(0, None), (0, None), (0, None)]
-
-# Solve using simplex method
-result = linprog(c=c, A_ub=A_ub, b_ub=b_ub, bounds=bounds, method='simplex')
-
-print("Optimization status:", result.message)
-print("\nOptimal solution:")
-print(f"Coal A: {result.x[0]:.2f} tons")
-print(f"Coal B: {result.x[1]:.2f} tons")
-print(f"Coal C: {result.x[2]:.2f} tons")
-print(f"Total: {sum(result.x):.2f} tons")
-
-print("\nTotal profit: {:.2f} BDT".format(-result.fun))
-
-# Let's verify our constraints are met
-print("\nVerification:")
-total_ash = (3*result.x[0] + 2*result.x[1] + 5*result.x[2]) / sum(result.x) * 100
-total_phosphorous = (0.02*result.x[0] + 0.04*result.x[1] + 0.03*result.x[2]) / sum(result.x) * 100
-
-print(f"Ash percentage: {total_ash/100:.4f}% (limit: 3%)")
-print(f"Phosphorous percentage: {total_phosphorous/100:.4f}% (limit: 0.03%)")
+def solve_blend(c, A_ub, b_ub, cache=None, integer=False, presolve=False):
+    # Solve using the revised simplex method (all variables non-negative,
+    # slack variables form the starting basis); with integer=True only
+    # whole tons are allowed and branch-and-bound runs on top of it
+    if presolve and integer:
+        raise ValueError("presolve scales and folds columns, so it is for the LP only")
+    solve = branch_and_bound if integer else solve_leq
+    if presolve:
+        # The reduced problem may have any row signs, so it goes through the
+        # two-phase revised simplex instead of the slack basis
+        solve = solve_linprog
+    if cache is not None:
+        # Repeated blends are answered by the SolutionCache without solving
+        return cache.solve(c, A_ub=A_ub, b_ub=b_ub, method=solve, presolve=presolve)
+    if presolve:
+        return presolved_linprog(c, A_ub=A_ub, b_ub=b_ub, method=solve)
+    return solve(c, A_ub=A_ub, b_ub=b_ub)
+
+def print_solution(result):
+    print("Optimization status:", result.message)
+    print("\nOptimal solution:")
+    print(f"Coal A: {result.x[0]:.2f} tons")
+    print(f"Coal B: {result.x[1]:.2f} tons")
+    print(f"Coal C: {result.x[2]:.2f} tons")
+    print(f"Total: {sum(result.x):.2f} tons")
+
+    print("\nTotal profit: {:.2f} BDT".format(-result.fun))
+
+    # Let's verify our constraints are met
+    print("\nVerification:")
+    total_ash = (3*result.x[0] + 2*result.x[1] + 5*result.x[2]) / sum(result.x) * 100
+    total_phosphorous = (0.02*result.x[0] + 0.04*result.x[1] + 0.03*result.x[2]) / sum(result.x) * 100
+
+    print(f"Ash percentage: {total_ash/100:.4f}% (limit: 3%)")
+    print(f"Phosphorous percentage: {total_phosphorous/100:.4f}% (limit: 0.03%)")
+
+if __name__ == '__main__':
+    print_solution(solve_blend(c, A_ub, b_ub))
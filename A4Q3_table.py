@@ -1,90 +1,89 @@
 import numpy as np
+from solvers.exact import certify
+from solvers.pricing import leq_tableau, tableau_simplex
+from solvers.tracing import TableauRecorder
 
-def simplex_solve():
-    tableau = np.array([
-        [1.0,  1.0,  1.0,  1.0, 0.0, 0.0,  100.0],  # s1 constraint
-        [-0.01, 0.01, 0.0,  0.0, 1.0, 0.0,   0.0],  # s2 constraint  
-        [0.0,  -1.0,  2.0,  0.0, 0.0, 1.0,   0.0],  # s3 constraint
-        [-12.0, -15.0, -14.0, 0.0, 0.0, 0.0,  0.0]   # objective row
-    ])
-    
-    variables = ['s1', 's2', 's3']  # Basic variables
-    iteration = 0
-    
-    while True:
-        iteration += 1
+c = [-12.0, -15.0, -14.0]   # Profit per ton of coal A, B, C (negated)
+A_ub = [
+    [1.0,  1.0,  1.0],      # s1 constraint
+    [-0.01, 0.01, 0.0],     # s2 constraint
+    [0.0,  -1.0,  2.0],     # s3 constraint
+]
+b_ub = [100.0, 0.0, 0.0]
+
+def print_trace(trace, status, headers):
+    # Replays the recorded run: entry k is the tableau after k pivots and
+    # entry k + 1 holds the pivot made on it
+    for k, state in enumerate(trace):
+        variables = [headers[j] for j in state.basis]  # Basic variables
+        tableau = state.tableau
+        m, width = tableau.shape[0] - 1, tableau.shape[1]
         print(f"\n{'='*50}")
-        print(f"ITERATION {iteration}")
+        print(f"ITERATION {k + 1}")
         print(f"{'='*50}")
-        
+
         # Print current tableau
         print("\nCurrent Tableau:")
-        headers = ['x1', 'x2', 'x3', 's1', 's2', 's3', 'RHS']
         print(f"{'Var':<4}", end="")
         for h in headers: print(f"{h:>8}", end="")
         print()
-        
-        for i in range(3):
+
+        for i in range(m):
             print(f"{variables[i]:<4}", end="")
-            for j in range(7): print(f"{tableau[i,j]:>8.2f}", end="")
+            for j in range(width): print(f"{tableau[i,j]:>8.2f}", end="")
             print()
-        
+
         print(f"{'Z':<4}", end="")
-        for j in range(7): print(f"{tableau[3,j]:>8.2f}", end="")
+        for j in range(width): print(f"{tableau[m,j]:>8.2f}", end="")
         print()
-        
-        # Check optimality
-        if np.all(tableau[3, :-1] >= 0):
-            print(f"\nOptimal solution reached!")
+
+        if k + 1 == len(trace):
+            if status == 0:
+                print(f"\nOptimal solution reached!")
             break
-            
-        # Find entering variable (most negative in objective row)
-        entering_col = np.argmin(tableau[3, :-1])
-        entering_var = headers[entering_col]
-        print(f"\nEntering variable: {entering_var}")
-        
-        # Find leaving variable (minimum ratio test)
-        ratios = []
-        for i in range(3):
-            if tableau[i, entering_col] > 0:
-                ratios.append(tableau[i, -1] / tableau[i, entering_col])
-            else:
-                ratios.append(float('inf'))
-        
-        leaving_row = np.argmin(ratios)
-        leaving_var = variables[leaving_row]
-        print(f"Outgoing variable: {leaving_var}")
-        
-        # Pivot operation
-        pivot = tableau[leaving_row, entering_col]
-        tableau[leaving_row] /= pivot  # Normalize pivot row
-        
-        # Eliminate other entries in pivot column
-        for i in range(4):
-            if i != leaving_row:
-                tableau[i] -= tableau[i, entering_col] * tableau[leaving_row]
-        
-        # Update basic variables
-        variables[leaving_row] = entering_var
-    
+        step = trace[k + 1]
+        print(f"\nEntering variable: {headers[step.entering]}")
+        print(f"Outgoing variable: {headers[step.left]}")
+
+def simplex_solve(c, A_ub, b_ub, pricing='dantzig', ratio='textbook', verbose=True, exact=False):
+    # Slack tableau [A | I | b] over the objective row [c | 0 | 0]; the
+    # slacks s1..sm form the starting basis
+    tableau, basis = leq_tableau(c, A_ub, b_ub)
+    start = tableau.copy()
+    m, n = len(b_ub), len(c)
+    headers = [f'x{j + 1}' for j in range(n)] + [f's{i + 1}' for i in range(m)] + ['RHS']
+
+    # Entering variable per the pricing rule (Dantzig takes the most negative
+    # in objective row), leaving variable per the ratio test. The tableaus
+    # are only recorded (and printed afterwards) when verbose
+    recorder = TableauRecorder() if verbose else None
+    result = tableau_simplex(tableau, basis, pricing, ratio, callback=recorder)
+    if verbose:
+        print_trace(recorder, result.status, headers)
+    if exact:
+        # Certify the final basis in rational arithmetic, so the solution
+        # and profit come out as exact Fractions instead of rounded floats
+        result = certify(start, result.basis, basis, pricing, ratio)
+        tableau = result.tableau
+
     # Extract solution
-    solution = np.zeros(3)
-    for i, var in enumerate(variables):
-        if var in ['x1', 'x2', 'x3']:
-            var_index = ['x1', 'x2', 'x3'].index(var)
-            solution[var_index] = tableau[i, -1]
-    
-    profit = -tableau[3, -1]
-    
+    solution = np.zeros(n, dtype=tableau.dtype)
+    for i, j in enumerate(result.basis):
+        if j < n:
+            solution[j] = tableau[i, -1]
+
+    profit = -tableau[m, -1]
+
+    return solution, profit
+
+if __name__ == '__main__':
+    # Run the solver
+    solution, profit = simplex_solve(c, A_ub, b_ub)
+
     print(f"\n{'='*50}")
     print("FINAL SOLUTION")
     print(f"{'='*50}")
     print(f"Coal A (x1): {solution[0]:.0f} tons")
-    print(f"Coal B (x2): {solution[1]:.0f} tons") 
+    print(f"Coal B (x2): {solution[1]:.0f} tons")
     print(f"Coal C (x3): {solution[2]:.0f} tons")
     print(f"Maximum Profit: {profit:.0f} BDT")
-    
-    return solution, profit
-
-# Run the solver
-solution, profit = simplex_solve()
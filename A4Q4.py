@@ -1,79 +1,85 @@
+import sys
+
 import numpy as np
+from solvers.presolve import presolved_linprog
+from solvers.revised_simplex import revised_simplex, solve_linprog, two_phase
+
+# Nutrients per unit of Food A (x) and Food B (y), and the daily minimums
+nutrients = np.array([
+    [200, 100],      # Vitamins
+    [1, 2],          # Minerals
+    [40, 40]         # Calories
+])
+requirements = np.array([4000, 50, 1400])
+costs = np.array([4, 3])
 
-def big_m_method():
+def big_m_method(nutrients, requirements, costs):
     # Coefficients for constraints (A matrix)
-    # Columns: x, y, s1, s2, s3, a1, a2, a3
-    A = np.array([
-        [200, 100, -1, 0, 0,    1, 0, 0],      # Vitamins
-        [1, 2,      0, -1, 0,   0, 1, 0],      # Minerals
-        [40, 40,    0, 0, -1,   0, 0, 1]       # Calories
-    ])
-    
+    # Columns: the n foods, then a surplus and an artificial variable per nutrient
+    m, n = nutrients.shape
+    A = np.hstack((nutrients, -np.eye(m), np.eye(m)))
+
     # Right-hand side (b vector)
-    b = np.array([4000, 50, 1400])
-    
+    b = requirements
+
     # Objective function coefficients (c vector)
     # Original: 4x + 3y, artificial variables with Big M
     M = 1e6  # Large positive number
-    c = np.array([4, 3, 0, 0, 0, M, M, M])
-    
-    # Initial basic variables: a1, a2, a3 (indices 5,6,7)
-    basic_vars = [5, 6, 7]
-    
-    # Initial tableau: [A | b]
-    tableau = np.hstack((A, b.reshape(-1, 1)))
-    
-    # Adjust the objective row
-    # Z = c - M * sum of artificial rows
-    artificial_rows = A[[0,1,2], :]  # Rows corresponding to a1, a2, a3
-    obj_row = c - M * np.sum(artificial_rows, axis=0)
-    tableau = np.vstack((tableau, np.append(obj_row, 0)))
-    
-    # Simplex iterations
-    while True:
-        # Find the entering variable (most negative in obj row)
-        obj_row = tableau[-1, :-1]
-        if np.all(obj_row >= 0):
-            break  # Optimal solution reached
-        entering = np.argmin(obj_row)
-        
-        # Find the leaving variable (min ratio test)
-        ratios = tableau[:-1, -1] / tableau[:-1, entering]
-        ratios[ratios <= 0] = np.inf
-        leaving = np.argmin(ratios)
-        
-        # Pivot
-        pivot_element = tableau[leaving, entering]
-        tableau[leaving, :] /= pivot_element
-        for i in range(tableau.shape[0]):
-            if i != leaving:
-                factor = tableau[i, entering]
-                tableau[i, :] -= factor * tableau[leaving, :]
-        
-        # Update basic variables
-        basic_vars[leaving] = entering
-    
-    # Extract solution
-    solution = np.zeros(len(c))
-    for i, var in enumerate(basic_vars):
-        if var < len(c):
-            solution[var] = tableau[i, -1]
-    
-    x, y = solution[0], solution[1]
-    total_cost = 4 * x + 3 * y
-    
-    return x, y, total_cost
-
-# Run the function
-x, y, total_cost = big_m_method()
-print(f"Optimal number of units of Food A: {x}")
-print(f"Optimal number of units of Food B: {y}")
-print(f"Total Cost (BDT): {total_cost}")
-
-# Verify constraints
-vitamins = 200 * x + 100 * y
-minerals = 1 * x + 2 * y
-calories = 40 * x + 40 * y
-print(f"Vitamins provided: {vitamins}")
-print(f"Minerals provided: {minerals}")
-print(f"Calories provided: {calories}")
+    c = np.concatenate((costs, np.zeros(m), np.full(m, M)))
+
+    # Initial basic variables: the artificials (indices n + m to n + 2m - 1)
+    basic_vars = list(range(n + m, n + 2 * m))
+
+    # Revised simplex from the artificial basis; the Big-M objective row
+    # (c - M * sum of artificial rows) is priced implicitly from c
+    result = revised_simplex(c, A, b, basic_vars)
+    foods = result.x[:n]
+    total_cost = costs @ foods
+
+    return foods, total_cost
+
+def two_phase_method(nutrients, requirements, costs):
+    # Same model without the artificial columns: Phase I adds them, drives
+    # them to zero and hands its basis to Phase II, so no M is needed
+    # Columns: the n foods, then a surplus variable per nutrient
+    m, n = nutrients.shape
+    A = np.hstack((nutrients, -np.eye(m)))
+    c = np.concatenate((costs, np.zeros(m)))
+
+    result = two_phase(c, A, requirements)
+    foods = result.x[:n]
+    total_cost = costs @ foods
+
+    return foods, total_cost
+
+METHODS = {'big-m': big_m_method, 'two-phase': two_phase_method}
+
+def solve(nutrients, requirements, costs, method='two-phase', presolve=False):
+    # 'two-phase' or 'big-m'; both reach the same optimum
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {sorted(METHODS)}, got {method!r}")
+    if presolve:
+        # Presolve the A @ x >= b rows (as -A @ x <= -b) and solve what is
+        # left with the same method; the surplus columns are added for it
+        result = presolved_linprog(costs, A_ub=-nutrients, b_ub=-requirements,
+                                   method=solve_linprog, options={'method': method})
+        return result.x, costs @ result.x
+    return METHODS[method](nutrients, requirements, costs)
+
+def print_solution(foods, total_cost):
+    x, y = foods
+    print(f"Optimal number of units of Food A: {x}")
+    print(f"Optimal number of units of Food B: {y}")
+    print(f"Total Cost (BDT): {total_cost}")
+
+    # Verify constraints
+    vitamins, minerals, calories = nutrients @ foods
+    print(f"Vitamins provided: {vitamins}")
+    print(f"Minerals provided: {minerals}")
+    print(f"Calories provided: {calories}")
+
+if __name__ == '__main__':
+    # Method from the command line: python A4Q4.py [two-phase|big-m] [--presolve]
+    args = [arg for arg in sys.argv[1:] if arg != '--presolve']
+    method = args[0] if args else 'two-phase'
+    print_solution(*solve(nutrients, requirements, costs, method, '--presolve' in sys.argv))
@@ -1,111 +1,123 @@
 import numpy as np
+from solvers.exact import certify
+from solvers.pricing import DESCRIPTIONS, tableau_simplex
+from solvers.tracing import TableauRecorder
 
-def big_m_method():
-    # Columns: x, y, s1, s2, s3, a1, a2, a3
-    A = np.array([
-        [200, 100, -1, 0, 0,    1, 0, 0],      # Vitamins
-        [1, 2,      0, -1, 0,   0, 1, 0],      # Minerals
-        [40, 40,    0, 0, -1,   0, 0, 1]       # Calories
-    ])
-    
-    b = np.array([4000, 50, 1400])
-    M = 1e4  # Large positive number
-    c = np.array([4, 3, 0, 0, 0, M, M, M])
-    basic_vars = [5, 6, 7]          # Initial basic variables: a1, a2, a3 (indices 5,6,7)
-    
-    # Initial tableau: [A | b]
-    tableau = np.hstack((A, b.reshape(-1, 1)))
-    
-    artificial_rows = A[[0,1,2], :]  # Rows corresponding to a1, a2, a3
-    obj_row = c - M * np.sum(artificial_rows, axis=0)         # Z = c - M * sum of artificial rows
-    tableau = np.vstack((tableau, np.append(obj_row, 0)))
+def print_trace(trace, status, var_names, description):
+    # Replays the recorded run: entry k is the tableau after k pivots and
+    # entry k + 1 holds the pivot made on it
+    for k, state in enumerate(trace):
+        iteration = k + 1
 
-    var_names = ['x', 'y', 's1', 's2', 's3', 'a1', 'a2', 'a3']      # Variable names for printing
-
-    iteration = 0
-    print("=" * 100)
-    print("BIG-M METHOD SIMPLEX ITERATIONS")
-    print("=" * 100)
-
-    # Simplex iterations
-    while True:
-        iteration += 1
-        
         # Print current basic variables
-        basic_vars_names = [var_names[i] for i in basic_vars]
+        basic_vars_names = [var_names[i] for i in state.basis]
         print(f"Iteration -->{iteration:4}  |  Basic Variables -->{str(basic_vars_names):>18}")
-        
+
         # Print tableau header
         print(f"\nTableau {iteration}:")
         print(f"{'':>12} " + " ".join(f"{name:>10}" for name in var_names) + f"{'RHS':>12}")
         print("-" * 113)
-        
+
         # Print constraint rows
-        constraint_names = ['Vitamins', 'Minerals', 'Calories', 'Objective']
-        for i, row in enumerate(tableau):
-            row_name = constraint_names[i] if i < len(constraint_names) else f"Row {i}"
+        constraint_names = ['Vitamins', 'Minerals', 'Calories']
+        for i, row in enumerate(state.tableau):
+            if i == len(state.tableau) - 1:
+                row_name = 'Objective'
+            else:
+                row_name = constraint_names[i] if i < len(constraint_names) else f"Row {i}"
             print(f"{row_name:>12} " + " ".join(f"{v:>10.1f}" for v in row))
         print()
 
-        # Find the entering variable (most negative in obj row)
-        obj_row = tableau[-1, :-1]
-        if np.all(obj_row >= 0):
-            print("OPTIMAL SOLUTION REACHED - All coefficients in objective row are non-negative")
-            break  # Optimal solution reached
-        entering = np.argmin(obj_row)
-
-        # Find the leaving variable (min ratio test)
-        ratios = tableau[:-1, -1] / tableau[:-1, entering]
-        ratios[ratios <= 0] = np.inf
-        leaving = np.argmin(ratios)
+        if iteration == len(trace):
+            if status == 0:
+                print("OPTIMAL SOLUTION REACHED - All coefficients in objective row are non-negative")
+            break
 
         # Print entering and leaving variables
-        print(f"→ Entering variable: {var_names[entering]} (most negative coefficient)")
-        print(f"→ Leaving variable: {var_names[basic_vars[leaving]]} (minimum ratio test)")
-        print(f"→ Pivot element: {tableau[leaving, entering]:.3f}")
+        step = trace[iteration]
+        print(f"→ Entering variable: {var_names[step.entering]} ({description})")
+        print(f"→ Leaving variable: {var_names[step.left]} (minimum ratio test)")
+        print(f"→ Pivot element: {step.element:.3f}")
         print()
 
-        pivot_element = tableau[leaving, entering]      # Pivot
-        tableau[leaving, :] /= pivot_element
-        for i in range(tableau.shape[0]):
-            if i != leaving:
-                factor = tableau[i, entering]
-                tableau[i, :] -= factor * tableau[leaving, :]
-
-        # Update basic variables
-        basic_vars[leaving] = entering
-        
         print("After pivoting:")
         print("-" * 60)
 
+# Nutrients per unit of Food A (x) and Food B (y), and the daily minimums
+nutrients = np.array([
+    [200, 100],      # Vitamins
+    [1, 2],          # Minerals
+    [40, 40]         # Calories
+])
+requirements = np.array([4000, 50, 1400])
+costs = np.array([4, 3])
+
+def big_m_method(nutrients, requirements, costs, pricing='dantzig', ratio='textbook', verbose=True,
+                 exact=False):
+    # Columns: n foods, then a surplus s_i and an artificial a_i per requirement
+    m, n = nutrients.shape
+    A = np.hstack((nutrients, -np.eye(m, dtype=int), np.eye(m, dtype=int)))
+    
+    b = requirements
+    M = 1e4  # Large positive number
+    c = np.concatenate((costs, np.zeros(m), np.full(m, M)))
+    basic_vars = list(range(n + m, n + 2 * m))      # Initial basic variables: the artificials a1..am
+    
+    # Initial tableau: [A | b]
+    tableau = np.hstack((A, b.reshape(-1, 1)))
+    
+    artificial_rows = A[:m, :]  # Every constraint row has its own artificial
+    obj_row = c - M * np.sum(artificial_rows, axis=0)         # Z = c - M * sum of artificial rows
+    tableau = np.vstack((tableau, np.append(obj_row, 0)))
+    start = tableau.copy()
+
+    foods = ['x', 'y'] if n == 2 else [f'x{j + 1}' for j in range(n)]
+    var_names = foods + [f's{i + 1}' for i in range(m)] + [f'a{i + 1}' for i in range(m)]      # Variable names for printing
+
+    # Entering variable per the pricing rule (Dantzig takes the most negative
+    # in obj row), leaving variable per the min ratio test. The tableaus are
+    # only recorded (and printed afterwards) when verbose
+    recorder = TableauRecorder() if verbose else None
+    result = tableau_simplex(tableau, basic_vars, pricing, ratio, callback=recorder)
+    basic_vars = result.basis
+    if verbose:
+        print("=" * 100)
+        print("BIG-M METHOD SIMPLEX ITERATIONS")
+        print("=" * 100)
+        print_trace(recorder, result.status, var_names, DESCRIPTIONS[pricing])
+    if exact:
+        # Certify the final basis in rational arithmetic (M included), so
+        # the amounts and cost come out as exact Fractions
+        result = certify(start, basic_vars, range(n + m, n + 2 * m), pricing, ratio)
+        tableau, basic_vars = result.tableau, result.basis
+
     # Extract solution
-    solution = np.zeros(len(c))
+    solution = np.zeros(len(c), dtype=tableau.dtype)
     for i, var in enumerate(basic_vars):
         if var < len(c):
             solution[var] = tableau[i, -1]
     
-    x, y = solution[0], solution[1]
-    total_cost = 4 * x + 3 * y
-
-    return x, y, total_cost
-
-# Run the function
-x, y, total_cost = big_m_method()
-
-print("\n" + "=" * 50)
-print("FINAL SOLUTION")
-print("=" * 50)
-print(f"Optimal number of units of Food A: {x}")
-print(f"Optimal number of units of Food B: {y}")
-print(f"Total Cost (BDT): {total_cost}")
-
-print("\n" + "=" * 50)
-print("CONSTRAINT VERIFICATION")
-print("=" * 50)
-# Verify constraints
-vitamins = 200 * x + 100 * y
-minerals = 1 * x + 2 * y
-calories = 40 * x + 40 * y
-print(f"Vitamins provided: {vitamins} (Required: ≥ 4000)")
-print(f"Minerals provided: {minerals} (Required: ≥ 50)")
-print(f"Calories provided: {calories} (Required: ≥ 1400)")
+    foods = solution[:n]
+    total_cost = costs @ foods
+
+    return foods, total_cost
+
+if __name__ == '__main__':
+    # Run the function
+    (x, y), total_cost = big_m_method(nutrients, requirements, costs)
+
+    print("\n" + "=" * 50)
+    print("FINAL SOLUTION")
+    print("=" * 50)
+    print(f"Optimal number of units of Food A: {x}")
+    print(f"Optimal number of units of Food B: {y}")
+    print(f"Total Cost (BDT): {total_cost}")
+
+    print("\n" + "=" * 50)
+    print("CONSTRAINT VERIFICATION")
+    print("=" * 50)
+    # Verify constraints
+    vitamins, minerals, calories = nutrients @ (x, y)
+    print(f"Vitamins provided: {vitamins} (Required: ≥ 4000)")
+    print(f"Minerals provided: {minerals} (Required: ≥ 50)")
+    print(f"Calories provided: {calories} (Required: ≥ 1400)")
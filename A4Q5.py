@@ -1,60 +1,56 @@
 import numpy as np
-import pandas as pd
+from solvers import transportation
 
 cost_matrix = np.array([[4, 3, 1, 2, 6], [5, 2, 3, 4, 5], [3, 5, 6, 3, 2], [2, 4, 4, 5, 3]])
 supply = np.array([80, 60, 40, 20])
 demand = np.array([60, 60, 30, 40, 10])
 
 def north_west_corner(supply, demand):
-    s, d = supply.copy(), demand.copy()
-    m, n = len(s), len(d)
-    alloc = np.zeros((m, n))
-    i, j = 0, 0
-    while i < m and j < n:
-        qty = min(s[i], d[j])
-        alloc[i, j] = qty
-        s[i] -= qty
-        d[j] -= qty
-        if s[i] == 0: i += 1
-        if d[j] == 0: j += 1
-    return alloc
+    cells = transportation.north_west_corner(supply, demand)
+    return transportation.to_dense(cells, (len(supply), len(demand)))
 
 def least_cost_method(supply, demand, costs):
-    s, d = supply.copy(), demand.copy()
-    c = costs.copy().astype(float) # Use a float copy for infinity
-    m, n = len(s), len(d)
-    alloc = np.zeros((m, n))
-    while np.sum(alloc) < np.sum(supply):
-        # Find the cell with the minimum cost in the available grid
-        i, j = np.unravel_index(np.argmin(c), c.shape)
-        
-        # Allocate as much as possible
-        qty = min(s[i], d[j])
-        alloc[i, j] = qty
-        
-        # Update remaining supply and demand
-        s[i] -= qty
-        d[j] -= qty
-        
-        # Mark exhausted rows/columns as infinitely expensive to ignore them
-        if s[i] == 0: c[i, :] = np.inf
-        if d[j] == 0: c[:, j] = np.inf
-    return alloc
+    # Cells in cost order without sorting the grid: each row keeps its cheapest
+    # candidates and a heap merges them, instead of an argmin per step
+    cells = transportation.least_cost(supply, demand, costs)
+    return transportation.to_dense(cells, (len(supply), len(demand)))
+
+def vogel_approximation_method(supply, demand, costs):
+    cells = transportation.vogel(supply, demand, costs)
+    return transportation.to_dense(cells, (len(supply), len(demand)))
+
+def modi_method(alloc, costs):
+    # Transportation simplex (u-v potentials, stepping-stone cycles) from an
+    # initial allocation; zero cells are added to complete the basis tree
+    result = transportation.modi(costs, transportation.basis_cells(alloc, costs))
+    return transportation.to_dense(result.cells, alloc.shape)
 
 # --- Helper Function for Display ---
 
 def print_solution(method_name, allocation, costs):
     """Calculates cost and prints the resulting allocation table."""
+    # pandas is only needed for the table layout, so it is loaded here
+    import pandas as pd
+
     print(f"\n--- {method_name} ---")
     total_cost = np.sum(allocation * costs)
     df = pd.DataFrame(allocation, index=['A', 'B', 'C', 'D'], columns=['P', 'Q', 'R', 'S', 'T'])
     print(df)
     print(f"Total Cost: ${total_cost:,.2f}")
-    
-# Solve and display North-West Corner solution
-nw_alloc = north_west_corner(supply, demand)
-print_solution("North-West Corner Rule", nw_alloc, cost_matrix)
-
-# Solve and display Least Cost Method solution
-lc_alloc = least_cost_method(supply, demand, cost_matrix)
-print_solution("Least Cost Method", lc_alloc, cost_matrix)
+
+if __name__ == '__main__':
+    # Solve and display North-West Corner solution
+    nw_alloc = north_west_corner(supply, demand)
+    print_solution("North-West Corner Rule", nw_alloc, cost_matrix)
+
+    # Solve and display Least Cost Method solution
+    lc_alloc = least_cost_method(supply, demand, cost_matrix)
+    print_solution("Least Cost Method", lc_alloc, cost_matrix)
+
+    # Solve and display Vogel's Approximation Method solution
+    vam_alloc = vogel_approximation_method(supply, demand, cost_matrix)
+    print_solution("Vogel's Approximation Method", vam_alloc, cost_matrix)
+
+    # Improve the initial allocations to optimality with the MODI method
+    print_solution("MODI Optimum from North-West Corner", modi_method(nw_alloc, cost_matrix), cost_matrix)
+    print_solution("MODI Optimum from Least Cost Method", modi_method(lc_alloc, cost_matrix), cost_matrix)
@@ -1,4 +1,5 @@
-from pulp import *
+from solvers.model_builder import TransportationLP
+from solvers.network_simplex import solve_transportation
 
 # Define supply, demand, and costs
 supply = {'F1': 200, 'F2': 160, 'F3': 90}
@@ -9,30 +10,33 @@ costs = {
     'F3': {'W1': 26, 'W2': 24, 'W3': 16}
 }
 
-# Create the linear programming problem
-prob = LpProblem("Transportation_Problem", LpMinimize)
-
-# Define decision variables
-vars = LpVariable.dicts("Route", (supply.keys(), demand.keys()), 0, None, LpContinuous)
-
-# Set the objective function (minimize total cost)
-prob += lpSum([vars[f][w] * costs[f][w] for f in supply for w in demand]), "Total Cost"
-
-# Add supply constraints
-for f in supply:
-    prob += lpSum([vars[f][w] for w in demand]) == supply[f], f"Supply_{f}"
-
-# Add demand constraints
-for w in demand:
-    prob += lpSum([vars[f][w] for f in supply]) == demand[w], f"Demand_{w}"
-
-# Solve the problem
-prob.solve()
-
-# Print the results
-print("Status:", LpStatus[prob.status])
-print("\nOptimal Shipping Plan:")
-for v in prob.variables():
-    if v.varValue > 0:
-        print(f"{v.name.replace('_', ' to ')}: {v.varValue} units")
-print(f"\nTotal Shipping Cost: {value(prob.objective)} BDT")
\ No newline at end of file
+def solve_with_pulp(supply, demand, costs):
+    # The model is built from the supply/demand/cost arrays and handed to
+    # PuLP as an MPS file, so there is no LpVariable or lpSum per route here
+    model = TransportationLP(supply, demand, costs)
+    routes, prob = model.to_pulp()
+
+    # Solve the problem with CBC and map the flows back to the labels
+    prob.solve()
+    return prob, model.plan([v.varValue or 0.0 for v in routes])
+
+def print_pulp_solution(prob, plan):
+    import pulp
+
+    # Print the results
+    print("Status:", pulp.LpStatus[prob.status])
+    print("\nOptimal Shipping Plan:")
+    for (f, w), qty in plan.items():
+        print(f"Route {f} to {w}: {qty} units")
+    print(f"\nTotal Shipping Cost: {pulp.value(prob.objective)} BDT")
+
+if __name__ == '__main__':
+    print_pulp_solution(*solve_with_pulp(supply, demand, costs))
+
+    # Same model through the network simplex backend (integer-indexed arrays,
+    # no LpVariable objects)
+    network = solve_transportation(supply, demand, costs, method='network')
+    print("\nNetwork Simplex Shipping Plan:")
+    for (f, w), qty in network.plan.items():
+        print(f"Route {f} to {w}: {qty} units")
+    print(f"\nTotal Shipping Cost: {network.fun} BDT")
\ No newline at end of file
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.optimize import linear_sum_assignment
+from solvers.assignment import linear_assignment
 
 # Define the profit matrix
 profit_matrix = np.array([
@@ -9,26 +9,38 @@ profit_matrix = np.array([
     [13, 12, 14, 15]
 ])
 
-# Since linear_sum_assignment minimizes the sum, we use the negative of the profit matrix
-cost_matrix = -profit_matrix
-
-# Solve the assignment problem
-row_ind, col_ind = linear_sum_assignment(cost_matrix)
-
-# Calculate the total profit
-total_profit = profit_matrix[row_ind, col_ind].sum()
-
 # Define labels for salesmen and cities
 salesmen = ['A', 'B', 'C', 'D']
 cities = ['1', '2', '3', '4']
 
-# Print the assignments
-print("Optimal Assignment:")
-for i in range(len(row_ind)):
-    salesman = salesmen[row_ind[i]]
-    city = cities[col_ind[i]]
-    profit = profit_matrix[row_ind[i], col_ind[i]]
-    print(f"Salesman {salesman} assigned to city {city}, profit: {profit} BDT")
+def solve_assignment(profit_matrix):
+    from scipy.optimize import linear_sum_assignment
+
+    # Since linear_sum_assignment minimizes the sum, we use the negative of the profit matrix
+    cost_matrix = -profit_matrix
+
+    # Solve the assignment problem
+    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    return row_ind, col_ind
+
+def print_assignment(profit_matrix, row_ind, col_ind):
+    # Calculate the total profit
+    total_profit = profit_matrix[row_ind, col_ind].sum()
+
+    # Print the assignments
+    print("Optimal Assignment:")
+    for i in range(len(row_ind)):
+        salesman = salesmen[row_ind[i]]
+        city = cities[col_ind[i]]
+        profit = profit_matrix[row_ind[i], col_ind[i]]
+        print(f"Salesman {salesman} assigned to city {city}, profit: {profit} BDT")
+
+    # Print the total profit
+    print(f"\nTotal profit: {total_profit} BDT per day")
+
+if __name__ == '__main__':
+    print_assignment(profit_matrix, *solve_assignment(profit_matrix))
 
-# Print the total profit
-print(f"\nTotal profit: {total_profit} BDT per day")
\ No newline at end of file
+    # Cross-check with the auction algorithm from solvers.assignment
+    auction = linear_assignment(profit_matrix, maximize=True, method='auction')
+    print(f"Auction algorithm total profit: {auction.fun:.0f} BDT per day")
\ No newline at end of file
@@ -0,0 +1 @@
+"""Benchmarks for the solvers package; run from the repository root."""
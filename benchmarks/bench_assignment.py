@@ -0,0 +1,102 @@
+"""Time and peak RSS of sparse assignment versus SciPy's dense linear_sum_assignment.
+
+Instances are salesman/territory matrices with --candidates allowed
+territories per salesman (a random permutation is always among them, so a
+complete assignment exists) and integer profits; every other pair is
+forbidden. SciPy needs them as a dense matrix with forbidden pairs priced
+out, which is skipped (with its estimated size printed instead) once that
+matrix would exceed --dense-limit. Each run is a fresh interpreter so
+``ru_maxrss`` only covers that solve.
+
+    python -m benchmarks.bench_assignment --sizes 1000 5000 20000
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+MODES = ('scipy', 'jv', 'auction')
+
+
+def territory_matrix(n, candidates=20, seed=0, wide=1.0):
+    """Sparse n x (wide * n) profit matrix with a guaranteed full assignment."""
+    rng = np.random.default_rng(seed)
+    cols = int(wide * n)
+    rows = np.repeat(np.arange(n), candidates)
+    territory = rng.integers(0, cols, n * candidates)
+    territory[::candidates] = rng.permutation(cols)[:n]
+    profit = rng.integers(1, 1000, n * candidates).astype(float)
+    P = sp.csr_matrix((profit, (rows, territory)), shape=(n, cols))
+    P.sum_duplicates()
+    return P
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def run(mode, n, candidates, wide, workers):
+    P = territory_matrix(n, candidates, wide=wide)
+    start = time.perf_counter()
+    if mode == 'scipy':
+        from scipy.optimize import linear_sum_assignment
+        dense = np.full(P.shape, -1e9)
+        dense[P.nonzero()] = P.data
+        rows, cols = linear_sum_assignment(dense, maximize=True)
+        total = dense[rows, cols].sum()
+    else:
+        from solvers.assignment import linear_assignment
+        options = {'workers': workers} if mode == 'auction' else {}
+        total = linear_assignment(P, maximize=True, method=mode, **options).fun
+    return time.perf_counter() - start, total
+
+
+def measure(mode, n, candidates, wide, workers):
+    """Run one mode in a child interpreter and return (seconds, total, MB)."""
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_assignment', '--child', mode,
+         '--sizes', str(n), '--candidates', str(candidates), '--wide', str(wide),
+         '--workers', str(workers)],
+        capture_output=True, text=True, check=True,
+    )
+    seconds, total, mb = out.stdout.split()
+    return float(seconds), float(total), float(mb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--candidates', type=int, default=20)
+    parser.add_argument('--wide', type=float, default=1.0,
+                        help='territories per salesman (rectangular when > 1)')
+    parser.add_argument('--workers', type=int, default=1, help='auction bidding threads')
+    parser.add_argument('--dense-limit', type=float, default=1.0, help='GB')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        seconds, total = run(args.child, args.sizes[0], args.candidates, args.wide,
+                             args.workers)
+        print(seconds, total, peak_rss_mb())
+        return
+
+    print(f"{'n':>8} {'mode':>8} {'time s':>9} {'peak RSS MB':>12} {'profit':>12}")
+    for n in args.sizes:
+        for mode in MODES:
+            dense_gb = 8 * n * int(args.wide * n) / 2**30
+            if mode == 'scipy' and dense_gb > args.dense_limit:
+                print(f"{n:>8} {mode:>8} {'-':>9} {'~%.0f' % (dense_gb * 1024):>12}"
+                      f"  (dense matrix alone, skipped)")
+                continue
+            seconds, total, mb = measure(mode, n, args.candidates, args.wide, args.workers)
+            print(f"{n:>8} {mode:>8} {seconds:>9.2f} {mb:>12.1f} {total:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
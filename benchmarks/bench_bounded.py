@@ -0,0 +1,67 @@
+"""Implicit upper bounds versus upper-bound rows in the revised simplex.
+
+The instances are blending LPs with a capacity cap on every variable:
+maximize p @ x subject to m resource rows A @ x <= b and 0 <= x <= cap.
+Each is solved by ``solve_leq`` twice: with the caps passed as ``bounds``
+(``implicit``, m rows, caps handled by bound flips) and with one extra row
+x_j <= cap_j and slack column per variable (``rows``, m + n rows, the only
+way A4Q3_table.py / A4Q4_table.py can express a cap). The last column is
+the objective error against HiGHS.
+
+    python -m benchmarks.bench_bounded --sizes 20x100 50x400 100x1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from solvers.revised_simplex import solve_leq
+
+
+def capped_blend(m, n, seed=0):
+    """Blend of n ingredients under m resource rows, each ingredient capped."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.5)
+    cap = rng.uniform(1, 10, n)
+    # Resources allow about a third of the capped amounts, so many
+    # variables end at their cap and many at zero
+    b = A @ cap / 3
+    c = -rng.uniform(1, 20, n)
+    return c, A, b, cap
+
+
+def timed(solve):
+    start = time.perf_counter()
+    result = solve()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['20x100', '50x400'])
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'method':>9} {'rows':>6} {'iters':>7} {'flips':>6} {'at cap':>7}"
+          f" {'time s':>9} {'obj error':>10}")
+    for size in args.sizes:
+        m, n = map(int, size.split('x'))
+        c, A, b, cap = capped_blend(m, n)
+        reference = linprog(c, A_ub=A, b_ub=b, bounds=np.column_stack((np.zeros(n), cap)),
+                            method='highs').fun
+        A_rows = np.vstack((A, np.eye(n)))
+        b_rows = np.concatenate((b, cap))
+        runs = [
+            ('implicit', m, lambda: solve_leq(c, A, b, bounds=np.column_stack((np.zeros(n), cap)))),
+            ('rows', m + n, lambda: solve_leq(c, A_rows, b_rows)),
+        ]
+        for label, rows, solve in runs:
+            result, seconds = timed(solve)
+            at_cap = np.sum(np.isclose(result.x, cap))
+            print(f"{size:>9} {label:>9} {rows:>6} {result.nit:>7} {result.flips:>6} {at_cap:>7}"
+                  f" {seconds:>9.4f} {abs(result.fun - reference):>10.2e}")
+
+
+if __name__ == '__main__':
+    main()
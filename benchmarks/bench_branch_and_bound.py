@@ -0,0 +1,119 @@
+"""Branch-and-bound against PuLP/CBC on integer blending and transportation.
+
+Two families of pure integer models, with fractional data so the LP
+relaxation is not integral on its own:
+
+* ``blend<n>``      n coal types, whole tons only, each with a fractional
+                    availability; 1000.5 tons in total at most and ten
+                    quality rows averaged over the blend (A4Q3.py scaled up)
+* ``transport<mxn>`` m sources with fractional supply, n destinations whose
+                    demand is 95% of it; shipments in whole units (A4Q6.py
+                    with inequalities, as fractional totals rule out equality)
+
+For each model ``bnb/<w>`` runs solvers.branch_and_bound once per
+--workers count w; the time to reach each --gaps target is read off its
+trace, and nodes/s comes from the whole run. ``cbc`` is
+PuLP's default solver on the same model, run once per gap target with
+gapRel set and a --time-limit, so its time is the wall time of that run
+(model build and CBC process included). The process pool needs as many
+cores as workers to speed anything up.
+
+    python -m benchmarks.bench_branch_and_bound --blends 500 2000 --transports 30x60 --workers 1 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.branch_and_bound import branch_and_bound
+
+
+def blend(n, k=10, seed=0):
+    """(c, A_ub, b_ub, bounds) of an n-type integer coal blend."""
+    rng = np.random.default_rng(seed)
+    quality = rng.uniform(0, 10, (k, n))
+    limit = rng.uniform(3, 6, k)
+    A_ub = np.vstack((np.ones(n), quality - limit[:, None]))
+    b_ub = np.concatenate(([1000.5], np.zeros(k)))
+    available = rng.uniform(5, 50, n).round(1)
+    return -rng.uniform(10, 20, n), A_ub, b_ub, np.column_stack((np.zeros(n), available))
+
+
+def transport(m, n, seed=0):
+    """(c, A_ub, b_ub, bounds) of an m x n integer transportation problem."""
+    rng = np.random.default_rng(seed)
+    supply = rng.uniform(20, 100, m).round(1)
+    demand = rng.dirichlet(np.ones(n)) * supply.sum() * 0.95
+    costs = rng.integers(1, 100, (m, n)).astype(float)
+    rows = sp.kron(sp.identity(m), np.ones((1, n)))
+    cols = sp.kron(np.ones((1, m)), sp.identity(n))
+    A_ub = sp.vstack((rows, -cols)).tocsc()
+    return costs.ravel(), A_ub, np.concatenate((supply, -demand)), None
+
+
+def time_to_gap(trace, gap):
+    """First trace time at which the relative gap is within ``gap``."""
+    for seconds, incumbent, bound in trace:
+        if np.isfinite(incumbent) and incumbent - bound <= gap * max(1.0, abs(incumbent)):
+            return seconds
+    return None
+
+
+def solve_cbc(c, A_ub, b_ub, bounds, gap, time_limit):
+    """Objective and wall time of the model through PuLP's CBC."""
+    import pulp
+
+    start = time.perf_counter()
+    model = pulp.LpProblem('bench', pulp.LpMinimize)
+    upper = [None] * len(c) if bounds is None else bounds[:, 1]
+    x = [pulp.LpVariable(f'x{j}', 0, upper[j], cat=pulp.LpInteger) for j in range(len(c))]
+    model += pulp.LpAffineExpression(zip(x, c))
+    A_ub = sp.csr_matrix(A_ub)
+    for i in range(A_ub.shape[0]):
+        row = slice(A_ub.indptr[i], A_ub.indptr[i + 1])
+        terms = zip((x[j] for j in A_ub.indices[row]), A_ub.data[row])
+        model += pulp.LpAffineExpression(terms) <= b_ub[i]
+    model.solve(pulp.PULP_CBC_CMD(msg=0, gapRel=gap, timeLimit=time_limit))
+    return pulp.value(model.objective), time.perf_counter() - start
+
+
+def fmt(seconds):
+    return '-' if seconds is None else f"{seconds:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--blends', type=int, nargs='*', default=[200, 2000])
+    parser.add_argument('--transports', nargs='*', default=['20x40', '30x60'], help='mxn')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--gaps', type=float, nargs='+', default=[1e-2, 1e-3, 1e-4])
+    parser.add_argument('--time-limit', type=float, default=60.0)
+    args = parser.parse_args()
+
+    models = [(f'blend{n}', blend(n)) for n in args.blends]
+    for size in args.transports:
+        m, n = map(int, size.split('x'))
+        models.append((f'transport{size}', transport(m, n)))
+
+    gaps = sorted(args.gaps, reverse=True)
+    print(f"{'model':>16} {'solver':>8} {'nodes':>8} {'nodes/s':>8}"
+          + ''.join(f" {'t@%g' % g:>8}" for g in gaps) + f" {'gap':>9} {'objective':>14}")
+    for name, (c, A_ub, b_ub, bounds) in models:
+        for workers in args.workers:
+            r = branch_and_bound(c, A_ub, b_ub, bounds=bounds, workers=workers,
+                                 gap=gaps[-1], time_limit=args.time_limit)
+            times = ''.join(f" {fmt(time_to_gap(r.trace, g)):>8}" for g in gaps)
+            print(f"{name:>16} {'bnb/%d' % workers:>8} {r.nodes:>8} {r.nodes_per_second:>8.0f}"
+                  f"{times} {r.gap:>9.1e} {r.fun:>14,.2f}")
+        times, objective = '', None
+        for g in gaps:
+            objective, seconds = solve_cbc(c, A_ub, b_ub, bounds, g, args.time_limit)
+            # A run cut off by the time limit has not certified its gap
+            times += f" {fmt(seconds) if seconds < args.time_limit else '>limit':>8}"
+        print(f"{name:>16} {'cbc':>8} {'-':>8} {'-':>8}{times} {'-':>9} {objective:>14,.2f}")
+
+
+if __name__ == '__main__':
+    main()
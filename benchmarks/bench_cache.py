@@ -0,0 +1,115 @@
+"""Request latency with and without the solution cache on a repeat-heavy trace.
+
+The trace mixes the three model families services send: diets (A4Q2.py,
+requirements and prices varied), coal blends (A4Q3.py, prices varied, solved
+by the revised simplex) and games (A4Q8.py, random payoff matrices, one LP
+per request). ``--models`` distinct models are drawn ``--requests`` times
+with Zipf(--skew) popularity, so a few models make up most requests. Each
+request goes through the script's own solve function, with:
+
+* ``none``       no cache
+* ``memory``     SolutionCache with the default 64 MB
+* ``small``      a --small-kb cache, so the tail of the trace is evicted
+* ``disk``       memory plus a shared directory store (writes on every miss)
+* ``disk-warm``  a second, empty cache on the same directory, as another
+                 worker process would start
+
+    python -m benchmarks.bench_cache --requests 20000 --models 2000 --skew 1.1
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+import A4Q2
+import A4Q3
+import A4Q8
+from solvers.cache import SolutionCache
+
+
+def model_pool(count, seed=0):
+    """``count`` distinct (family, arguments) requests."""
+    rng = np.random.default_rng(seed)
+    pool = []
+    for k in range(count):
+        family = k % 3
+        if family == 0:
+            costs = A4Q2.costs * rng.integers(8, 13, 4) / 10
+            requirements = A4Q2.requirements * rng.integers(8, 13, 3) / 10
+            pool.append(('diet', (costs, A4Q2.yields, requirements)))
+        elif family == 1:
+            c = np.array(A4Q3.c) * rng.integers(90, 111, 3) / 100
+            pool.append(('blend', (c, A4Q3.A_ub, A4Q3.b_ub)))
+        else:
+            size = rng.integers(3, 7)
+            pool.append(('game', (rng.integers(-10, 11, (size, size)),)))
+    return pool
+
+
+SOLVE = {
+    'diet': lambda args, cache: A4Q2.solve_diet(*args, cache=cache).fun,
+    'blend': lambda args, cache: A4Q3.solve_blend(*args, cache=cache).fun,
+    'game': lambda args, cache: A4Q8.solve_players(*args, cache=cache)[2],
+}
+
+
+def replay(trace, pool, cache):
+    latencies = np.empty(len(trace))
+    values = np.empty(len(trace))
+    for r, k in enumerate(trace):
+        family, args = pool[k]
+        start = time.perf_counter()
+        values[r] = SOLVE[family](args, cache)
+        latencies[r] = time.perf_counter() - start
+    return latencies, values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--models', type=int, default=500)
+    parser.add_argument('--skew', type=float, default=1.1)
+    parser.add_argument('--small-kb', type=int, default=32)
+    args = parser.parse_args()
+
+    pool = model_pool(args.models)
+    rng = np.random.default_rng(1)
+    weights = 1.0 / np.arange(1, args.models + 1) ** args.skew
+    trace = rng.choice(args.models, args.requests, p=weights / weights.sum())
+    print(f"{args.requests} requests over {len(np.unique(trace))} distinct models"
+          f" (of {args.models}, Zipf {args.skew})")
+
+    directory = tempfile.mkdtemp()
+    caches = [
+        ('none', None),
+        ('memory', SolutionCache()),
+        ('small', SolutionCache(maxbytes=args.small_kb * 1024)),
+        ('disk', SolutionCache(path=directory)),
+        ('disk-warm', SolutionCache(path=directory)),
+    ]
+    print(f"{'cache':>10} {'total s':>8} {'mean us':>9} {'p50 us':>8} {'p99 us':>9}"
+          f" {'hits':>6} {'disk':>6} {'misses':>7} {'evicted':>8} {'KB':>7}")
+    reference = None
+    try:
+        for label, cache in caches:
+            latencies, values = replay(trace, pool, cache)
+            if reference is None:
+                reference = values
+            elif not np.allclose(values, reference):
+                raise AssertionError(f"{label}: cached results differ")
+            info = cache.info() if cache is not None else {}
+            counts = [info.get(key, '-') for key in ('hits', 'disk_hits', 'misses', 'evictions')]
+            kb = f"{info['bytes'] / 1024:.0f}" if info else '-'
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+            print(f"{label:>10} {latencies.sum():>8.2f} {latencies.mean() * 1e6:>9.0f}"
+                  f" {p50:>8.0f} {p99:>9.0f} {counts[0]:>6} {counts[1]:>6} {counts[2]:>7}"
+                  f" {counts[3]:>8} {kb:>7}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
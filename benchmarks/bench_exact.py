@@ -0,0 +1,81 @@
+"""Exact solutions: certifying the float basis versus exact pivoting.
+
+Each instance is solved three ways from the slack tableau: in float only
+(``float``), in float followed by ``certify`` of the final basis
+(``certified``: the float time plus one fraction-free solve) and by
+pivoting a Fraction tableau from the start (``exact``, tol 0). ``ok``
+says whether the float basis was certified as it was, and ``digits`` is
+the size of the largest denominator in the exact optimal tableau. The
+exact objectives of both exact paths are checked to agree.
+
+Instances: the A4Q3 coal blend, Klee-Minty cubes (``km<n>``) and random
+m x 2m blends with data given to two decimals and a positive entry in
+every column, so they are bounded (``blend<m>``). An instance whose float
+solve does not end optimal is reported with its status and skipped.
+
+    python -m benchmarks.bench_exact --klee-minty 6 10 --blend 10 20 40
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_pricing import a4q3, klee_minty
+from solvers.exact import certify, rational_tableau
+from solvers.pricing import leq_tableau, tableau_simplex
+
+
+def blend(m, seed=0):
+    rng = np.random.default_rng(seed)
+    n = 2 * m
+    # Every column gets a positive entry somewhere: an all-zero column with
+    # a negative cost would make the LP unbounded
+    mask = rng.random((m, n)) < 0.5
+    mask[rng.integers(m, size=n), np.arange(n)] = True
+    A = np.round(rng.uniform(0.01, 10, (m, n)) * mask, 2)
+    b = np.round(rng.uniform(10, 100, m), 2)
+    return -np.round(rng.uniform(1, 20, n), 2), A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--klee-minty', type=int, nargs='+', default=[6, 10])
+    parser.add_argument('--blend', type=int, nargs='+', default=[10, 20, 40])
+    args = parser.parse_args()
+
+    instances = [('a4q3', a4q3())]
+    instances += [(f'km{n}', klee_minty(n)) for n in args.klee_minty]
+    instances += [(f'blend{m}', blend(m)) for m in args.blend]
+
+    print(f"{'instance':>9} {'nit':>6} {'float s':>9} {'certified s':>12} {'exact s':>9}"
+          f" {'speedup':>8} {'ok':>4} {'digits':>7}")
+    for name, (c, A, b) in instances:
+        start_tableau, start_basis = leq_tableau(c, A, b)
+
+        tableau = start_tableau.copy()
+        start = time.perf_counter()
+        run = tableau_simplex(tableau, start_basis)
+        float_time = time.perf_counter() - start
+        if run.status != 0:
+            # Nothing to certify without an optimal basis
+            print(f"{name:>9} {run.nit:>6} {float_time:>9.4f}  status {run.status}, skipped")
+            continue
+        result = certify(start_tableau, run.basis, start_basis)
+        certified = float_time + result.time_exact
+
+        exact = rational_tableau(start_tableau)
+        start = time.perf_counter()
+        tableau_simplex(exact, start_basis, tol=0)
+        exact_time = time.perf_counter() - start
+
+        if exact[-1, -1] != result.tableau[-1, -1]:
+            raise AssertionError(f"{name}: exact objectives differ")
+        digits = max(len(str(v.denominator)) for v in result.tableau.flat)
+        print(f"{name:>9} {run.nit:>6} {float_time:>9.4f} {certified:>12.4f} {exact_time:>9.4f}"
+              f" {exact_time / certified:>7.1f}x {'yes' if result.certified else 'no':>4}"
+              f" {digits:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Batched matrix-game solving versus A4Q8.py's one LP per game.
+
+The A4Q8 column runs the script's solve_players (solve_game on that one
+matrix, the column player read off the duals) for every game, and is
+only run on the first --baseline-max games and scaled up; ``max err`` is
+the largest difference between its values and the batch's. Non-square shapes (e.g. 3x5) are
+supported. ``solve_games`` handles the whole stack: saddle points and
+dominance first, then block-diagonal LPs of --chunk games; the approximate
+column runs multiplicative weights for --mwu-iters rounds.
+
+    python -m benchmarks.bench_games --games 10000 --shapes 3x3 3x5 5x5 20x20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import A4Q8
+from solvers.games import solve_games
+
+
+def random_games(k, m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(-10, 11, (k, m, n)).astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--shapes', nargs='+', default=['3x3', '3x5', '5x5', '20x20'])
+    parser.add_argument('--chunk', type=int, default=1000)
+    parser.add_argument('--baseline-max', type=int, default=500)
+    parser.add_argument('--mwu-iters', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'shape':>7} {'games':>7} {'A4Q8 s':>9} {'batch s':>9} {'saddle %':>9} "
+          f"{'max err':>9} {'mwu s':>8} {'mwu gap':>8}")
+    for shape in args.shapes:
+        m, n = map(int, shape.split('x'))
+        A = random_games(args.games, m, n)
+
+        sample = min(args.baseline_max, args.games)
+        start = time.perf_counter()
+        values = np.array([A4Q8.solve_players(a)[2] for a in A[:sample]])
+        baseline = (time.perf_counter() - start) * args.games / sample
+
+        start = time.perf_counter()
+        result = solve_games(A, chunk=args.chunk)
+        batch = time.perf_counter() - start
+        error = np.abs(result.value[:sample] - values).max()
+
+        start = time.perf_counter()
+        approx = solve_games(A, method='mwu', maxiter=args.mwu_iters, tol=0)
+        mwu = time.perf_counter() - start
+        print(f"{shape:>7} {args.games:>7} {baseline:>9.2f} {batch:>9.2f} "
+              f"{100 * result.saddle.mean():>9.1f} {error:>9.1e} {mwu:>8.2f} "
+              f"{approx.gap.max():>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Throughput of the graphical method on stacks of two-variable LPs.
+
+Random models  min c @ x,  A @ x <= b  with ``--constraints`` rows plus
+x >= 0 (some infeasible, some unbounded) are solved by HiGHS one at a
+time (``linprog``, at most --baseline-max models, extrapolated), by
+``solve_graphical`` one at a time (``loop``) and by one
+``solve_graphical_batch`` call (``batch``). ``agree`` counts the models
+whose status and objective match HiGHS. Nothing is drawn.
+
+    python -m benchmarks.bench_graphical --models 1000 10000 100000 --constraints 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from solvers.graphical import solve_graphical, solve_graphical_batch
+
+
+def random_models(k, n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-5, 5, (k, n + 2, 2))
+    A[:, n:] = [[-1, 0], [0, -1]]
+    b = rng.uniform(-2, 10, (k, n + 2))
+    b[:, n:] = 0
+    return rng.uniform(-3, 3, (k, 2)), A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--models', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--constraints', type=int, nargs='+', default=[4, 8])
+    parser.add_argument('--baseline-max', type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'models':>8} {'rows':>5} {'linprog s':>10} {'loop s':>9} {'batch s':>9}"
+          f" {'per model us':>13} {'agree':>7}")
+    for n in args.constraints:
+        for k in args.models:
+            c, A, b = random_models(k, n)
+            sample = min(k, args.baseline_max)
+
+            start = time.perf_counter()
+            reference = [linprog(c[i], A_ub=A[i], b_ub=b[i], bounds=(None, None), method='highs')
+                         for i in range(sample)]
+            baseline = (time.perf_counter() - start) * k / sample
+
+            start = time.perf_counter()
+            for i in range(sample):
+                solve_graphical(c[i], A[i], b[i])
+            loop = (time.perf_counter() - start) * k / sample
+
+            start = time.perf_counter()
+            result = solve_graphical_batch(c, A, b)
+            batch = time.perf_counter() - start
+
+            agree = sum(ref.status == result.status[i]
+                        and (ref.status != 0 or np.isclose(ref.fun, result.fun[i]))
+                        for i, ref in enumerate(reference))
+            print(f"{k:>8} {n + 2:>5} {baseline:>10.2f} {loop:>9.2f} {batch:>9.4f}"
+                  f" {batch / k * 1e6:>13.2f} {agree:>3}/{sample:<3}")
+
+
+if __name__ == '__main__':
+    main()
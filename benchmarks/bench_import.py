@@ -0,0 +1,106 @@
+"""Import time of the solvers modules and the A4Q*.py scripts.
+
+Each module is imported in a fresh interpreter under ``python -X
+importtime``. The table shows the cumulative time of that import in ms
+(the best of --repeat runs), which heavy dependencies it pulled in, and
+whether it stayed within BUDGET. Importing a script only defines its data
+and functions; the LAZY dependencies (pandas, pulp, matplotlib,
+scipy.optimize) are loaded by the functions that use them, so an import
+that pulls one in fails the check just like one over its budget.
+
+    python -m benchmarks.bench_import --repeat 3
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY = ['scipy.optimize', 'pandas', 'pulp', 'matplotlib']
+HEAVY = ['scipy.linalg', 'scipy.sparse'] + LAZY
+
+# Cumulative import time allowed per module, in ms. NumPy alone is about
+# 100 ms here and scipy.linalg or scipy.sparse another 250 ms on top
+BUDGET = {
+    'solvers': 10,
+    'solvers.result': 10,
+    'solvers.bounds': 200,
+    'solvers.transportation': 200,
+    'solvers.revised_simplex': 600,
+    'solvers.pricing': 200,
+    'solvers.tracing': 200,
+    'solvers.exact': 200,
+    'solvers.graphical': 200,
+    'solvers.interior_point': 600,
+    'solvers.cache': 200,
+    'solvers.branch_and_bound': 600,
+    'solvers.sensitivity': 600,
+    'solvers.diet': 600,
+    'solvers.network_simplex': 200,
+    'solvers.model_builder': 600,
+    'solvers.presolve': 600,
+    'solvers.assignment': 600,
+    'solvers.games': 600,
+    'solvers.scenarios': 600,
+    'A4Q1': 200,
+    'A4Q2': 600,
+    'A4Q3': 600,
+    'A4Q3_table': 200,
+    'A4Q4': 600,
+    'A4Q4_table': 200,
+    'A4Q5': 200,
+    'A4Q6': 600,
+    'A4Q7': 600,
+    'A4Q8': 600,
+}
+
+
+def import_profile(module):
+    """Return the cumulative import time of module in ms and the set of
+    modules the import loaded, from ``-X importtime`` on stderr."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total, loaded = 0.0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            total = int(cumulative) / 1000
+    return total, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('modules', nargs='*', default=list(BUDGET))
+    args = parser.parse_args()
+
+    print(f"{'module':>25} {'ms':>8} {'budget':>7}  heavy")
+    over = []
+    for module in args.modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        total = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        heavy = [name for name in HEAVY if name in loaded]
+        budget = BUDGET.get(module)
+        flag = ''
+        if budget is not None and total > budget:
+            flag = ' OVER'
+        if any(name in LAZY for name in heavy):
+            flag += ' EAGER'
+        if flag:
+            over.append(module)
+        print(f"{module:>25} {total:>8.1f} {budget if budget is not None else '-':>7}  "
+              f"{', '.join(heavy) or '-'}{flag}")
+    if over:
+        print(f"\nfailed: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
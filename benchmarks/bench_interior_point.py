@@ -0,0 +1,103 @@
+"""Interior point versus the simplex paths on growing diet LPs.
+
+Random diet models  min costs @ x,  yields @ x >= requirements,  0 <= x <= cap
+with ``m`` nutrients and ``n`` foods (every food capped) are solved by:
+
+* ``ipm``        solvers.interior_point, Mehrotra predictor-corrector
+* ``ipm+cross``  the same followed by crossover to a vertex
+* ``revised``    the two-phase revised simplex (bounds handled implicitly)
+* ``tableau``    the Big-M dense tableau of A4Q4_table.py, caps as rows
+                 (only up to --tableau-max foods)
+* ``highs-ds`` / ``highs-ipm``  HiGHS, for reference
+
+Iterations are simplex pivots or interior-point steps (plus crossover
+pivots). The last column is the relative objective error against ``linprog``.
+
+    python -m benchmarks.bench_interior_point --sizes 20x1000 50x5000 100x10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from solvers.interior_point import interior_point
+from solvers.pricing import tableau_simplex
+from solvers.revised_simplex import two_phase
+
+
+def diet_model(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    yields = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.3)
+    cap = rng.uniform(5, 50, n)
+    requirements = yields @ cap * rng.uniform(0.02, 0.1, m)
+    return rng.uniform(1, 100, n), yields, requirements, cap
+
+
+def big_m(c, A, b, cap, M=1e6):
+    """Big-M tableau simplex as in A4Q4_table.py, with x <= cap as slack rows.
+
+    Columns: x, surplus and artificial of the rows A @ x >= b, slack of
+    the caps.
+    """
+    m, n = A.shape
+    top = np.block([[A, -np.eye(m), np.eye(m), np.zeros((m, n))],
+                    [np.eye(n), np.zeros((n, 2 * m)), np.eye(n)]])
+    cost = np.concatenate((c, np.zeros(m), np.full(m, M), np.zeros(n)))
+    obj_row = cost - M * top[:m].sum(axis=0)
+    tableau = np.vstack((np.column_stack((top, np.concatenate((b, cap)))), np.append(obj_row, 0)))
+    basis = list(range(n + m, n + 2 * m)) + list(range(n + 2 * m, 2 * n + 2 * m))
+    result = tableau_simplex(tableau, basis)
+    x = np.zeros(2 * n + 2 * m)
+    x[result.basis] = tableau[:-1, -1]
+    result.fun = c @ x[:n] if result.status == 0 else np.nan
+    return result
+
+
+def timed(solve):
+    start = time.perf_counter()
+    result = solve()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['20x1000', '50x5000'])
+    parser.add_argument('--tableau-max', type=int, default=1000)
+    parser.add_argument('--revised-max', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'method':>10} {'iters':>11} {'time s':>9} {'rel error':>10}")
+    for size in args.sizes:
+        m, n = map(int, size.split('x'))
+        c, A, b, cap = diet_model(m, n)
+        bounds = np.column_stack((np.zeros(n), cap))
+        A_eq = np.hstack((A, -np.eye(m)))
+        c_eq = np.concatenate((c, np.zeros(m)))
+        bounds_eq = np.vstack((bounds, np.column_stack((np.zeros(m), np.full(m, np.inf)))))
+
+        runs = [
+            ('ipm', lambda: interior_point(c, A_ub=-A, b_ub=-b, bounds=bounds)),
+            ('ipm+cross', lambda: interior_point(c, A_ub=-A, b_ub=-b, bounds=bounds, crossover=True)),
+        ]
+        if n <= args.revised_max:
+            runs.append(('revised', lambda: two_phase(c_eq, A_eq, b, bounds=bounds_eq)))
+        if n <= args.tableau_max:
+            runs.append(('tableau', lambda: big_m(c, A, b, cap)))
+        runs += [
+            ('highs-ds', lambda: linprog(c, A_ub=-A, b_ub=-b, bounds=bounds, method='highs-ds')),
+            ('highs-ipm', lambda: linprog(c, A_ub=-A, b_ub=-b, bounds=bounds, method='highs-ipm')),
+        ]
+        reference = linprog(c, A_ub=-A, b_ub=-b, bounds=bounds, method='highs').fun
+        for label, solve in runs:
+            result, seconds = timed(solve)
+            iters = str(result.nit)
+            if 'nit_crossover' in result:
+                iters += f"+{result.nit_crossover}"
+            print(f"{size:>10} {label:>10} {iters:>11} {seconds:>9.3f}"
+                  f" {abs(result.fun - reference) / abs(reference):>10.2e}")
+
+
+if __name__ == '__main__':
+    main()
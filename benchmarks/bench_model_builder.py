@@ -0,0 +1,81 @@
+"""Build time and peak memory of the A4Q6 model: PuLP dicts vs TransportationLP.
+
+The PuLP column builds the model as A4Q6.py does (LpVariable.dicts + lpSum
+over string keys) without solving it; it is skipped above --pulp-max
+factories. The array column builds c/A_eq/b_eq from the same dict data, and
+the MPS column streams that model to a temporary file. Peak memory is the
+tracemalloc peak of each build.
+
+    python -m benchmarks.bench_model_builder --sizes 20 100 400 1000 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_network_simplex import a4q6_data
+from solvers.model_builder import TransportationLP
+
+
+def pulp_build(supply, demand, costs):
+    import pulp
+
+    prob = pulp.LpProblem("Transportation_Problem", pulp.LpMinimize)
+    routes = pulp.LpVariable.dicts("Route", (supply.keys(), demand.keys()), 0, None,
+                                   pulp.LpContinuous)
+    prob += pulp.lpSum([routes[f][w] * costs[f][w] for f in supply for w in demand])
+    for f in supply:
+        prob += pulp.lpSum([routes[f][w] for w in demand]) == supply[f]
+    for w in demand:
+        prob += pulp.lpSum([routes[f][w] for f in supply]) == demand[w]
+    return prob
+
+
+def array_build(supply, demand, costs):
+    return TransportationLP(supply, demand, costs).to_arrays()
+
+
+def measure(build, *args):
+    """Seconds and tracemalloc peak (MB) of one call, keeping the result alive."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    model = build(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    del model
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 100, 400, 1000, 2000])
+    parser.add_argument('--pulp-max', type=int, default=400)
+    args = parser.parse_args()
+
+    print(f"{'F x W':>12} {'pulp s':>8} {'pulp MB':>8} {'array s':>8} {'array MB':>9} "
+          f"{'mps s':>7} {'mps MB':>7}")
+    for factories in args.sizes:
+        supply, demand, costs = a4q6_data(factories)
+        pulp_time = pulp_peak = '-'
+        if factories <= args.pulp_max:
+            t, peak = measure(pulp_build, supply, demand, costs)
+            pulp_time, pulp_peak = f"{t:.3f}", f"{peak:.1f}"
+        array_time, array_peak = measure(array_build, supply, demand, costs)
+
+        model = TransportationLP(supply, demand, costs)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'model.mps')
+            start = time.perf_counter()
+            model.write_mps(path)
+            mps_time = time.perf_counter() - start
+            mps_size = os.path.getsize(path) / 2**20
+        size = f"{factories}x{len(demand)}"
+        print(f"{size:>12} {pulp_time:>8} {pulp_peak:>8} {array_time:>8.3f} "
+              f"{array_peak:>9.1f} {mps_time:>7.2f} {mps_size:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
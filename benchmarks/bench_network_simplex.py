@@ -0,0 +1,74 @@
+"""Build + solve time of the A4Q6 transportation model: PuLP/CBC vs network simplex.
+
+Instances have F factories and 2.5 F warehouses with A4Q6-style dict data
+(labels 'F1'.., 'W1'..). The PuLP column builds the model exactly as
+A4Q6.py does (LpVariable.dicts + lpSum over string keys) and solves it with
+CBC; it is skipped above --pulp-max factories.
+
+    python -m benchmarks.bench_network_simplex --sizes 20 100 400 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from solvers.network_simplex import solve_transportation
+
+
+def a4q6_data(factories, seed=0):
+    rng = np.random.default_rng(seed)
+    warehouses = int(2.5 * factories)
+    s = rng.integers(50, 200, factories)
+    d = rng.multinomial(s.sum() - warehouses, np.ones(warehouses) / warehouses) + 1
+    c = rng.integers(5, 30, (factories, warehouses))
+    supply = {f'F{i + 1}': int(q) for i, q in enumerate(s)}
+    demand = {f'W{j + 1}': int(q) for j, q in enumerate(d)}
+    costs = {f: {w: int(c[i, j]) for j, w in enumerate(demand)}
+             for i, f in enumerate(supply)}
+    return supply, demand, costs
+
+
+def pulp_build_and_solve(supply, demand, costs):
+    import pulp
+
+    start = time.perf_counter()
+    prob = pulp.LpProblem("Transportation_Problem", pulp.LpMinimize)
+    routes = pulp.LpVariable.dicts("Route", (supply.keys(), demand.keys()), 0, None,
+                                   pulp.LpContinuous)
+    prob += pulp.lpSum([routes[f][w] * costs[f][w] for f in supply for w in demand])
+    for f in supply:
+        prob += pulp.lpSum([routes[f][w] for w in demand]) == supply[f]
+    for w in demand:
+        prob += pulp.lpSum([routes[f][w] for f in supply]) == demand[w]
+    built = time.perf_counter()
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    return built - start, time.perf_counter() - built, pulp.value(prob.objective)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 100, 400, 2000])
+    parser.add_argument('--pulp-max', type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'F x W':>12} {'pulp build':>11} {'pulp solve':>11} {'network':>9} "
+          f"{'pivots':>7} {'cost match':>11}")
+    for factories in args.sizes:
+        supply, demand, costs = a4q6_data(factories)
+        start = time.perf_counter()
+        result = solve_transportation(supply, demand, costs, method='network')
+        network = time.perf_counter() - start
+
+        build = solve = '-'
+        match = '-'
+        if factories <= args.pulp_max:
+            b, s, objective = pulp_build_and_solve(supply, demand, costs)
+            build, solve = f"{b:.3f}", f"{s:.3f}"
+            match = 'yes' if np.isclose(objective, result.fun) else 'NO'
+        size = f"{factories}x{len(demand)}"
+        print(f"{size:>12} {build:>11} {solve:>11} {network:>9.3f} {result.nit:>7} {match:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Rows and columns removed by solvers.presolve, and the solve time saved.
+
+The generated model blends ``ingredients`` into ``products`` (variables
+x[i, p] >= 0, minimizing cost) and is written the way such models tend to
+be written by hand:
+
+* one demand equality per product;
+* quality limits per product, the minimums with explicit surplus columns
+  as in A4Q4.py, and some limits repeated in percent (parallel rows);
+* an availability row per ingredient, plus per-pair caps and minimum-use
+  entries as singleton rows;
+* contract ingredients whose amounts are fixed by their bounds;
+* a plant-capacity row no blend can reach (dominated).
+
+Each configuration is solved by HiGHS with its own presolve switched off
+(``raw``), by our presolve followed by the same solve (``ours``), and by
+HiGHS with its presolve on, for reference. Objectives and marginals of
+``ours`` are compared with ``raw``; the marginals of the larger models are
+degenerate and may differ while both are optimal.
+
+``--random N`` then checks N small random LPs (singleton, empty and zero
+rows, free, fixed and one-sided bounds): the status must match HiGHS and
+the postsolved ``x`` must satisfy the original rows and bounds, not just
+give the same objective. LPs whose lower bounds are all finite are also
+solved through the revised simplex (``solve_linprog``) after presolve.
+
+    python -m benchmarks.bench_presolve --products 20 50 100 --ingredients 400 --random 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import linprog
+
+from solvers.bounds import as_bounds
+from solvers.presolve import Presolve, presolved_linprog
+from solvers.revised_simplex import solve_linprog
+
+
+def blending_model(products, ingredients, qualities=8, seed=0):
+    """``linprog`` keyword arguments of a multi-product blending LP."""
+    rng = np.random.default_rng(seed)
+    P, I, K = products, ingredients, qualities
+    n = I * P
+    var = np.arange(n).reshape(I, P)
+    cost = np.repeat(rng.uniform(1, 20, I), P) * rng.uniform(0.9, 1.1, n)
+    quality = rng.uniform(0, 10, (I, K))
+    demand = rng.uniform(50, 150, P)
+
+    ub_rows, ub_rhs, eq_rows, eq_rhs = [], [], [], []
+    surplus = []
+
+    def row(cols, vals):
+        return np.asarray(cols), np.asarray(vals, dtype=float)
+
+    for p in range(P):
+        eq_rows.append(row(var[:, p], np.ones(I)))
+        eq_rhs.append(demand[p])
+        for k in range(K):
+            limit = np.quantile(quality[:, k], 0.7)
+            cols, vals = row(var[:, p], quality[:, k] - limit)
+            ub_rows.append((cols, vals))
+            ub_rhs.append(0.0)
+            if k % 4 == 0:
+                ub_rows.append((cols, 100 * vals))
+                ub_rhs.append(0.0)
+            if k % 2 == 0:
+                # q @ x - s == minimum, s >= 0
+                minimum = np.quantile(quality[:, k], 0.2)
+                surplus.append(len(eq_rows))
+                eq_rows.append((cols, quality[:, k] - minimum))
+                eq_rhs.append(0.0)
+    supply = 2.0 * demand.sum() / I
+    for i in range(I):
+        ub_rows.append(row(var[i], np.ones(P)))
+        ub_rhs.append(supply)
+    caps = rng.random(n) < 0.3
+    for j in np.flatnonzero(caps):
+        ub_rows.append(row([j], [1.0]))
+        ub_rhs.append(rng.uniform(5, 30))
+    for j in np.flatnonzero(~caps & (rng.random(n) < 0.05)):
+        ub_rows.append(row([j], [-1.0]))
+        ub_rhs.append(-rng.uniform(0, 0.1))
+    ub_rows.append(row(np.arange(n), np.ones(n)))
+    ub_rhs.append(2 * demand.sum() * I)
+
+    n_total = n + len(surplus)
+    A_ub = stack(ub_rows, n_total)
+    A_eq = stack(eq_rows, n_total)
+    A_eq = (A_eq - sp.csr_matrix((np.ones(len(surplus)), (surplus, n + np.arange(len(surplus)))),
+                                 shape=A_eq.shape)).tocsr()
+    bounds = np.zeros((n_total, 2))
+    bounds[:, 1] = np.inf
+    contract = rng.choice(I, max(1, I // 50), replace=False)
+    amounts = rng.uniform(0.1, 0.5, (len(contract), P))
+    bounds[var[contract].ravel()] = np.repeat(amounts.ravel(), 2).reshape(-1, 2)
+    c = np.concatenate((cost, np.zeros(len(surplus))))
+    return dict(c=c, A_ub=A_ub, b_ub=np.array(ub_rhs), A_eq=A_eq, b_eq=np.array(eq_rhs),
+                bounds=bounds)
+
+
+def stack(rows, n):
+    indptr = np.concatenate(([0], np.cumsum([len(cols) for cols, _ in rows])))
+    indices = np.concatenate([cols for cols, _ in rows])
+    data = np.concatenate([vals for _, vals in rows])
+    return sp.csr_matrix((data, indices, indptr), shape=(len(rows), n))
+
+
+def random_lp(rng):
+    """``linprog`` keyword arguments of a tiny LP with presolvable structure."""
+    n = int(rng.integers(1, 5))
+    choices = [(None, 0), (0, None), (None, None), (-2, 2), (0, 3), (1, 1), (None, 2)]
+    model = dict(c=rng.integers(-3, 4, n).astype(float),
+                 bounds=[choices[k] for k in rng.integers(0, len(choices), n)])
+    for A, b, low in (('A_ub', 'b_ub', -2), ('A_eq', 'b_eq', -6)):
+        m = int(rng.integers(0, 4))
+        if m:
+            model[A] = (rng.integers(-3, 4, (m, n)) * (rng.random((m, n)) < 0.4)).astype(float)
+            model[b] = rng.integers(low, 11 if A == 'A_ub' else 7, m).astype(float)
+    return model
+
+
+def check_random(count, seed=0, tol=1e-6):
+    """Compare presolved_linprog with HiGHS on random LPs; raises on a mismatch."""
+    rng = np.random.default_rng(seed)
+    statuses = np.zeros(4, dtype=int)
+    for k in range(count):
+        model = random_lp(rng)
+        ref = linprog(method='highs', **model)
+        lb, ub = as_bounds(model['bounds'], len(model['c']))
+        runs = [('highs', presolved_linprog(**model))]
+        if np.all(np.isfinite(lb)):
+            runs.append(('revised', presolved_linprog(**model, method=solve_linprog)))
+        statuses[ref.status] += 1
+        for label, ours in runs:
+            if ours.status != ref.status:
+                raise AssertionError(f"LP {k} ({label}): status {ours.status}, "
+                                     f"HiGHS {ref.status}: {model}")
+            if ref.status != 0:
+                continue
+            x = ours.x
+            feasible = np.all(x >= lb - tol) and np.all(x <= ub + tol)
+            if 'A_ub' in model:
+                feasible &= np.all(model['A_ub'] @ x <= model['b_ub'] + tol)
+            if 'A_eq' in model:
+                feasible &= np.allclose(model['A_eq'] @ x, model['b_eq'], atol=tol)
+            if not feasible or abs(ours.fun - ref.fun) > tol * (1 + abs(ref.fun)):
+                raise AssertionError(f"LP {k} ({label}): x = {x} (fun {ours.fun}, "
+                                     f"HiGHS {ref.fun}): {model}")
+    print(f"random LPs: {count} agree with HiGHS ({statuses[0]} optimal, "
+          f"{statuses[2]} infeasible, {statuses[3]} unbounded)")
+
+
+def timed(solve):
+    start = time.perf_counter()
+    result = solve()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument('--ingredients', type=int, default=400)
+    parser.add_argument('--random', type=int, default=1000, help='random LPs to check')
+    args = parser.parse_args()
+
+    off = {'presolve': False}
+    for products in args.products:
+        model = blending_model(products, args.ingredients)
+        m = model['A_ub'].shape[0] + model['A_eq'].shape[0]
+        n = len(model['c'])
+        print(f"products={products} ingredients={args.ingredients}: {m} rows, {n} cols")
+
+        raw, t_raw = timed(lambda: linprog(method='highs', options=off, **model))
+        ours, t_ours = timed(lambda: presolved_linprog(**model, options=off))
+        highs, t_highs = timed(lambda: linprog(method='highs', **model))
+        report = Presolve(**model).report
+
+        removed = report['rows_removed']
+        print(f"  rows {report['rows']} -> {report['reduced_rows']}  "
+              + " ".join(f"{key}={value}" for key, value in removed.items()))
+        print(f"  cols {report['cols']} -> {report['reduced_cols']}  "
+              + " ".join(f"{key}={value}" for key, value in report['cols_removed'].items()))
+        print(f"  bounds tightened={report['bounds_tightened']} "
+              f"sides dropped={report['sides_dropped']} passes={report['passes']}")
+        print(f"  raw {t_raw:.3f}s  ours {t_ours:.3f}s (presolve {report['time']:.3f}s)  "
+              f"highs presolve {t_highs:.3f}s  speedup {t_raw / t_ours:.2f}x")
+        dual = max(np.abs(ours.ineqlin.marginals - raw.ineqlin.marginals).max(),
+                   np.abs(ours.eqlin.marginals - raw.eqlin.marginals).max())
+        print(f"  objective {raw.fun:.6f} vs {ours.fun:.6f} (highs {highs.fun:.6f}), "
+              f"max marginal difference {dual:.2e}")
+    if args.random:
+        check_random(args.random)
+
+
+if __name__ == '__main__':
+    main()
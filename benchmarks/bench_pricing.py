@@ -0,0 +1,79 @@
+"""Iterations and time of the tableau simplex per pricing rule and ratio test.
+
+Instances (all  min c @ x,  A_ub @ x <= b_ub,  x >= 0  from the slack basis):
+
+* a4q3       the A4Q3 coal blend, two zero right-hand sides
+* beale      Beale's example, which cycles under Dantzig pricing with
+             first-row ties
+* km<n>      Klee-Minty cubes; Dantzig pricing takes 2**n - 1 pivots
+* degen<m>   random m x 4m/3 LPs whose right-hand sides are all zero but one
+
+A run that hits --maxiter is reported as ``limit`` (cycling, for beale).
+
+    python -m benchmarks.bench_pricing --klee-minty 6 10 14 --degenerate 60 150
+"""
+
+import argparse
+
+import numpy as np
+
+from solvers.pricing import PRICING, leq_tableau, tableau_simplex
+
+RATIOS = ('textbook', 'bland', 'harris')
+
+
+def a4q3():
+    c = np.array([-12.0, -15.0, -14.0])
+    A = np.array([[1.0, 1.0, 1.0], [-0.01, 0.01, 0.0], [0.0, -1.0, 2.0]])
+    return c, A, np.array([100.0, 0.0, 0.0])
+
+
+def beale():
+    c = np.array([-0.75, 150.0, -0.02, 6.0])
+    A = np.array([[0.25, -60.0, -0.04, 9.0], [0.5, -90.0, -0.02, 3.0], [0.0, 0.0, 1.0, 0.0]])
+    return c, A, np.array([0.0, 0.0, 1.0])
+
+
+def klee_minty(n):
+    c = -2.0 ** np.arange(n - 1, -1, -1)
+    A = np.eye(n)
+    for i in range(n):
+        A[i, :i] = 2.0 ** (i - np.arange(i) + 1)
+    return c, A, 5.0 ** np.arange(1, n + 1)
+
+
+def degenerate(m, seed=0):
+    rng = np.random.default_rng(seed)
+    n = 4 * m // 3
+    A = rng.uniform(-1, 1, (m, n))
+    A[0] = np.abs(A[0]) + 0.1
+    b = np.zeros(m)
+    b[0] = 10.0
+    return -rng.uniform(0, 1, n), A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--klee-minty', type=int, nargs='+', default=[6, 10, 14])
+    parser.add_argument('--degenerate', type=int, nargs='+', default=[60, 150])
+    parser.add_argument('--maxiter', type=int, default=20000)
+    args = parser.parse_args()
+
+    instances = [('a4q3', a4q3()), ('beale', beale())]
+    instances += [(f'km{n}', klee_minty(n)) for n in args.klee_minty]
+    instances += [(f'degen{m}', degenerate(m)) for m in args.degenerate]
+
+    print(f"{'instance':>9} {'pricing':>9} " + " ".join(f"{r:>17}" for r in RATIOS))
+    for name, (c, A, b) in instances:
+        for pricing in PRICING:
+            cells = []
+            for ratio in RATIOS:
+                tableau, basis = leq_tableau(c, A, b)
+                result = tableau_simplex(tableau, basis, pricing, ratio, maxiter=args.maxiter)
+                nit = 'limit' if result.status == 1 else str(result.nit)
+                cells.append(f"{nit:>7} {result.time:>8.4f}s")
+            print(f"{name:>9} {pricing:>9} " + " ".join(cells))
+
+
+if __name__ == '__main__':
+    main()
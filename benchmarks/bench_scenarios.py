@@ -0,0 +1,60 @@
+"""Throughput of the process-pool scenario runner from 1 to N workers.
+
+Each scenario is a cost variant of one sparse blending LP (the model from
+bench_sparse_memory). The ``shared`` rows send the constraint matrix once
+through shared memory; the ``pickled`` row puts it in every scenario, as a
+plain ``pool.map`` over full problems would, to show the transfer cost.
+Throughput can only scale up to the number of cores available.
+
+    python -m benchmarks.bench_scenarios --scenarios 2000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.bench_sparse_memory import blending_lp
+from solvers.scenarios import run_scenarios
+
+
+def cost_variants(c, count, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        yield {'c': c * rng.uniform(0.8, 1.2, len(c))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', type=int, default=2000)
+    parser.add_argument('--size', type=int, default=300)
+    parser.add_argument('--density', type=float, default=0.02)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunksize', type=int, default=32)
+    args = parser.parse_args()
+
+    c, A, b = blending_lp(args.size, args.density)
+    print(f"{os.cpu_count()} cores, {args.scenarios} scenarios, A_ub {A.shape[0]}x{A.shape[1]} "
+          f"({A.nnz} nonzeros)")
+    print(f"{'workers':>8} {'transfer':>9} {'time s':>8} {'per s':>8} {'speedup':>8}")
+    base = None
+    runs = [(w, 'shared') for w in args.workers] + [(max(args.workers), 'pickled')]
+    for workers, transfer in runs:
+        scenarios = cost_variants(c, args.scenarios)
+        if transfer == 'shared':
+            shared = {'A_ub': A, 'b_ub': b}
+        else:
+            shared = None
+            scenarios = ({**s, 'A_ub': A, 'b_ub': b} for s in scenarios)
+        start = time.perf_counter()
+        count = sum(1 for _ in run_scenarios(scenarios, shared=shared, workers=workers,
+                                             chunksize=args.chunksize))
+        seconds = time.perf_counter() - start
+        base = base or seconds
+        print(f"{workers:>8} {transfer:>9} {seconds:>8.2f} {count / seconds:>8.1f} "
+              f"{base / seconds:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
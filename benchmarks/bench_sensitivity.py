@@ -0,0 +1,62 @@
+"""Batched what-if scenarios versus one linprog call per scenario.
+
+Builds a random diet model, solves it once, then evaluates --scenarios cost
+vectors and --scenarios requirement vectors (each entry scaled by a random
+factor in [1 - spread, 1 + spread]) through SensitivityAnalysis, and the
+same scenarios one by one with ``linprog(method='highs')``.
+
+    python -m benchmarks.bench_sensitivity --foods 200 --scenarios 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from benchmarks.bench_warm_start import diet_lp
+from solvers.diet import DietModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--foods', type=int, default=200)
+    parser.add_argument('--scenarios', type=int, default=2000)
+    parser.add_argument('--spread', type=float, default=0.2)
+    args = parser.parse_args()
+
+    foods, nutrients = args.foods, max(3, args.foods // 10)
+    costs, yields, requirements = diet_lp(foods, nutrients)
+    model = DietModel(costs, yields, requirements)
+    model.solve()
+    analysis = model.sensitivity()
+
+    rng = np.random.default_rng(1)
+    k, spread = args.scenarios, args.spread
+    cost_batch = costs * rng.uniform(1 - spread, 1 + spread, (k, foods))
+    rhs_batch = requirements * rng.uniform(1 - spread, 1 + spread, (k, nutrients))
+
+    print(f"{foods} foods x {nutrients} nutrients, {k} scenarios each")
+    print(f"{'batch':>6} {'batched s':>10} {'re-solves':>10} {'linprog s':>10} {'max rel err':>12}")
+    for label, batch in (('costs', cost_batch), ('rhs', rhs_batch)):
+        start = time.perf_counter()
+        if label == 'costs':
+            out = analysis.cost_scenarios(np.hstack((batch, np.zeros((k, nutrients)))))
+        else:
+            out = analysis.rhs_scenarios(batch)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = np.empty(k)
+        for s in range(k):
+            c = batch[s] if label == 'costs' else costs
+            b = requirements if label == 'costs' else batch[s]
+            reference[s] = linprog(c, A_ub=-yields.T, b_ub=-b, method='highs').fun
+        single = time.perf_counter() - start
+
+        error = np.max(np.abs(out.fun - reference) / np.maximum(1.0, np.abs(reference)))
+        print(f"{label:>6} {batched:>10.3f} {out.resolves:>10} {single:>10.3f} {error:>12.1e}")
+
+
+if __name__ == '__main__':
+    main()
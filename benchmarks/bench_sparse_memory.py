@@ -0,0 +1,110 @@
+"""Peak RSS of the sparse revised simplex versus a dense tableau.
+
+Each measurement runs in a fresh interpreter so ``ru_maxrss`` only covers
+that solve. Both paths perform the same number of pivots on a random sparse
+blending LP (max profit, A_ub @ x <= b_ub, x >= 0); the dense path builds the
+[A | I | b] tableau the A4Q*_table.py scripts use, and is skipped (with its
+estimated size printed instead) once the tableau would exceed --dense-limit.
+
+    python -m benchmarks.bench_sparse_memory --sizes 1000 5000 50000
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def blending_lp(n, density=1e-4, seed=0):
+    """Square sparse blending LP with a capacity entry on every variable."""
+    rng = np.random.default_rng(seed)
+    A = sp.random(n, n, density=density, format='csc', random_state=rng)
+    A = (A + sp.identity(n, format='csc')).tocsc()
+    b = rng.uniform(10, 100, n)
+    c = -rng.uniform(1, 20, n)
+    return c, A, b
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def run_sparse(n, density, pivots):
+    from solvers.revised_simplex import solve_leq
+    c, A, b = blending_lp(n, density)
+    result = solve_leq(c, A, b, maxiter=pivots)
+    return result.nit
+
+
+def run_dense(n, density, pivots):
+    c, A, b = blending_lp(n, density)
+    m = A.shape[0]
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = A.toarray()
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = b
+    tableau[m, :n] = c
+    nit = 0
+    while nit < pivots:
+        entering = np.argmin(tableau[m, :-1])
+        if tableau[m, entering] >= 0:
+            break
+        col = tableau[:m, entering]
+        ratios = np.full(m, np.inf)
+        positive = col > 1e-12
+        ratios[positive] = tableau[:m, -1][positive] / col[positive]
+        leaving = np.argmin(ratios)
+        tableau[leaving] /= tableau[leaving, entering]
+        factors = tableau[:, entering].copy()
+        factors[leaving] = 0.0
+        tableau -= np.outer(factors, tableau[leaving])
+        nit += 1
+    return nit
+
+
+def measure(mode, n, density, pivots):
+    """Run one mode in a child interpreter and return (seconds, pivots, MB)."""
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_sparse_memory', '--child', mode,
+         '--sizes', str(n), '--density', str(density), '--pivots', str(pivots)],
+        capture_output=True, text=True, check=True,
+    )
+    seconds, nit, mb = out.stdout.split()
+    return float(seconds), int(nit), float(mb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 50000])
+    parser.add_argument('--density', type=float, default=1e-4)
+    parser.add_argument('--pivots', type=int, default=200)
+    parser.add_argument('--dense-limit', type=float, default=2.0, help='GB')
+    parser.add_argument('--child', choices=['sparse', 'dense'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run = run_sparse if args.child == 'sparse' else run_dense
+        start = time.perf_counter()
+        nit = run(args.sizes[0], args.density, args.pivots)
+        print(time.perf_counter() - start, nit, peak_rss_mb())
+        return
+
+    print(f"{'n':>8} {'mode':>7} {'pivots':>7} {'time s':>9} {'peak RSS MB':>12}")
+    for n in args.sizes:
+        for mode in ('sparse', 'dense'):
+            tableau_gb = 8 * (n + 1) * (2 * n + 1) / 2**30
+            if mode == 'dense' and tableau_gb > args.dense_limit:
+                print(f"{n:>8} {mode:>7} {'-':>7} {'-':>9} "
+                      f"{'~%.0f' % (tableau_gb * 1024):>12}  (tableau alone, skipped)")
+                continue
+            seconds, nit, mb = measure(mode, n, args.density, args.pivots)
+            print(f"{n:>8} {mode:>7} {nit:>7} {seconds:>9.2f} {mb:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
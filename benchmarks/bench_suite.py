@@ -0,0 +1,309 @@
+"""Timing, iterations and peak memory of every solver, kept in a JSON history.
+
+Every case pairs a seeded instance family with one solver path the scripts
+use. ``size`` is the number of decision variables: LP columns,
+transportation cells, assignment pairs or payoff entries (summed over the
+batch for ``games``). Cases whose ``limit`` is below a size are skipped at
+that size.
+
+========== ====================================================================
+family     instances
+========== ====================================================================
+blending   A4Q3-style ``A_ub @ x <= b_ub`` LPs (bench_sparse_memory), square,
+           with about 5 entries per row
+bigm       A4Q4-style ``A @ x >= b`` diet LPs (bench_two_phase), 2 columns
+           per row
+diet       A4Q2 foods x nutrients LPs (bench_warm_start), at most 50 nutrients
+transport  square transportation grids (bench_transportation)
+assign     dense square profit matrices, or 20 candidates per row for the
+           sparse solvers (bench_assignment)
+game       one square zero-sum game, or a batch of 3 x 3 games (bench_games)
+========== ====================================================================
+
+The script functions are timed as they are: ``simplex_solve``
+(A4Q3_table.py) and ``big_m_method`` (A4Q4_table.py) with
+``verbose=False``, and A4Q5.py's ``north_west_corner``,
+``least_cost_method`` and ``vogel_approximation_method``, which include
+the dense allocation they return. These return plain tuples, so no
+iteration count is recorded for them. Times are the best of ``--repeat``
+runs; peak memory comes from one more run under ``tracemalloc`` (Python and
+NumPy allocations only, not those inside HiGHS or CBC).
+
+Each run is appended to ``--history`` along with the commit and library
+versions, and every result is printed next to the previous run of the same
+case and size, so regressions show up as a ratio above 1.
+
+    python -m benchmarks.bench_suite --sizes 10 100 1000 10000 100000
+    python -m benchmarks.bench_suite --cases transport/ assign/jv --repeat 3
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+import scipy
+from scipy.optimize import linear_sum_assignment, linprog
+
+import A4Q3_table
+import A4Q4_table
+import A4Q5
+import A4Q8
+from benchmarks.bench_assignment import territory_matrix
+from benchmarks.bench_games import random_games
+from benchmarks.bench_sparse_memory import blending_lp
+from benchmarks.bench_transportation import transport_grid
+from benchmarks.bench_two_phase import geq_lp
+from benchmarks.bench_warm_start import diet_lp
+from solvers.assignment import linear_assignment
+from solvers.diet import DietModel
+from solvers.games import solve_game, solve_games
+from solvers.model_builder import TransportationLP
+from solvers.network_simplex import solve_pulp, solve_transportation
+from solvers.revised_simplex import big_m, solve_leq, two_phase
+
+# -- instance families ------------------------------------------------------
+
+
+def blending(size, seed):
+    c, A, b = blending_lp(size, density=min(0.5, 4 / size), seed=seed)
+    return c, A, b
+
+
+def bigm(size, seed):
+    return geq_lp(max(2, size // 2), seed=seed)
+
+
+def diet(size, seed):
+    return diet_lp(size, max(3, min(50, size // 10)), seed=seed)
+
+
+def transport(size, seed):
+    side = max(2, math.isqrt(size))
+    return transport_grid(side, side, seed=seed)
+
+
+def assign_dense(size, seed):
+    side = max(2, math.isqrt(size))
+    return np.random.default_rng(seed).integers(1, 1000, (side, side)).astype(float)
+
+
+def assign_sparse(size, seed):
+    rows = max(2, size // 20)
+    return territory_matrix(rows, candidates=min(20, rows), seed=seed)
+
+
+def game(size, seed):
+    side = max(2, math.isqrt(size))
+    return random_games(1, side, side, seed=seed)[0]
+
+
+def game_batch(size, seed):
+    return random_games(max(1, size // 9), 3, 3, seed=seed)
+
+
+# -- solver paths -----------------------------------------------------------
+
+
+def simplex_solve(instance):
+    c, A, b = instance
+    return A4Q3_table.simplex_solve(c, A.toarray(), b, verbose=False)
+
+
+def big_m_method(instance):
+    c, A, b = instance
+    return A4Q4_table.big_m_method(A, b, c, verbose=False)
+
+
+def revised_leq(instance):
+    return solve_leq(*instance)
+
+
+def ub_linprog(instance):
+    c, A, b = instance
+    return linprog(c, A_ub=A, b_ub=b, method='highs')
+
+
+def geq_linprog(instance):
+    c, A, b = instance
+    return linprog(c, A_ub=-A, b_ub=-b, method='highs')
+
+
+def geq_standard(solver):
+    def run(instance):
+        c, A, b = instance
+        m, n = A.shape
+        return solver(np.concatenate((c, np.zeros(m))), np.hstack((A, -np.eye(m))), b)
+    return run
+
+
+def diet_linprog(instance):
+    costs, yields, requirements = instance
+    return linprog(costs, A_ub=-yields.T, b_ub=-requirements, method='highs')
+
+
+def diet_model(instance):
+    return DietModel(*instance).solve()
+
+
+def north_west_corner(instance):
+    supply, demand, _ = instance
+    return A4Q5.north_west_corner(supply, demand)
+
+
+def least_cost(instance):
+    return A4Q5.least_cost_method(*instance)
+
+
+def vogel(instance):
+    return A4Q5.vogel_approximation_method(*instance)
+
+
+def network(instance):
+    return solve_transportation(*instance, method='network')
+
+
+def transport_linprog(instance):
+    return TransportationLP(*instance).solve()
+
+
+def transport_pulp(instance):
+    supply, demand, costs = instance
+    return solve_pulp(supply.astype(float), demand.astype(float), costs.astype(float))
+
+
+def lsa(instance):
+    return linear_sum_assignment(instance, maximize=True)
+
+
+def sparse_assignment(method):
+    def run(instance):
+        return linear_assignment(instance, maximize=True, method=method)
+    return run
+
+
+def game_solve_players(instance):
+    return A4Q8.solve_players(instance)
+
+
+# (name, family, solver, limit)
+CASES = [
+    ('blending/tableau', blending, simplex_solve, 1000),
+    ('blending/revised', blending, revised_leq, 10000),
+    ('blending/linprog', blending, ub_linprog, 10000),
+    ('bigm/tableau', bigm, big_m_method, 500),
+    ('bigm/big_m', bigm, geq_standard(big_m), 500),
+    ('bigm/two_phase', bigm, geq_standard(two_phase), 500),
+    ('bigm/linprog', bigm, geq_linprog, 10000),
+    ('diet/model', diet, diet_model, 10000),
+    ('diet/linprog', diet, diet_linprog, 100000),
+    ('transport/north_west_corner', transport, north_west_corner, 100000),
+    ('transport/least_cost', transport, least_cost, 100000),
+    ('transport/vogel', transport, vogel, 100000),
+    ('transport/network', transport, network, 100000),
+    ('transport/linprog', transport, transport_linprog, 100000),
+    ('transport/pulp', transport, transport_pulp, 10000),
+    ('assign/linear_sum_assignment', assign_dense, lsa, 100000),
+    ('assign/jv', assign_sparse, sparse_assignment('jv'), 100000),
+    ('assign/auction', assign_sparse, sparse_assignment('auction'), 100000),
+    ('game/solve_players', game, game_solve_players, 100000),
+    ('game/solve_game', game, solve_game, 100000),
+    ('games/solve_games', game_batch, solve_games, 100000),
+]
+
+
+def iterations(result):
+    nit = result.get('nit') if isinstance(result, dict) else None
+    return None if nit is None else int(nit)
+
+
+def measure(solver, instance, repeat, memory):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = solver(instance)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        solver(instance)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def previous(history):
+    """Latest recorded time per (case, size, seed)."""
+    last = {}
+    for run in history:
+        for row in run['results']:
+            last[row['case'], row['size'], row['seed']] = row['time']
+    return last
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--cases', nargs='+', default=[''],
+                        help='case names or prefixes, e.g. transport/ or assign/jv')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--no-memory', action='store_true')
+    parser.add_argument('--history', default='bench_history.json')
+    parser.add_argument('--label', default=None, help='free-form note stored with the run')
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if any(case[0].startswith(p) for p in args.cases)]
+    history = load(args.history)
+    last = previous(history)
+
+    print(f"{'case':>29} {'size':>7} {'time':>10} {'nit':>7} {'peak MB':>8} {'vs last':>8}")
+    results = []
+    for name, family, solver, limit in cases:
+        for size in args.sizes:
+            if size > limit:
+                continue
+            instance = family(size, args.seed)
+            result, seconds, peak = measure(solver, instance, args.repeat, not args.no_memory)
+            row = {'case': name, 'size': size, 'seed': args.seed, 'time': seconds,
+                   'nit': iterations(result), 'peak_mb': peak}
+            results.append(row)
+            before = last.get((name, size, args.seed))
+            ratio = f"{seconds / before:>7.2f}x" if before else f"{'-':>8}"
+            nit = '-' if row['nit'] is None else row['nit']
+            mb = '-' if peak is None else f"{peak:.1f}"
+            print(f"{name:>29} {size:>7} {seconds:>9.4f}s {nit:>7} {mb:>8} {ratio}", flush=True)
+
+    history.append({
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit(), 'label': args.label, 'repeat': args.repeat,
+        'python': platform.python_version(), 'numpy': np.__version__,
+        'scipy': scipy.__version__, 'results': results,
+    })
+    with open(args.history, 'w') as f:
+        json.dump(history, f, indent=1)
+    print(f"\n{len(results)} results appended to {args.history}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Cost of tracing the tableau simplex, and where its time goes.
+
+Each instance from bench_pricing is solved with Dantzig pricing five ways:
+without a callback (``off``), with a callback that does nothing, with a
+TableauRecorder keeping only the pivots (``steps``), with one keeping every
+tableau (``record``, its buffer size in ``MB``), and with the full recorder
+followed by printing every recorded tableau the way A4Q3_table.py does,
+into a discarded buffer (``print``). The phase split comes from the
+recorder.
+
+    python -m benchmarks.bench_tracing --klee-minty 8 12 --degenerate 30 60
+"""
+
+import argparse
+import io
+import time
+from contextlib import redirect_stdout
+
+from benchmarks.bench_pricing import degenerate, klee_minty
+from solvers.pricing import leq_tableau, tableau_simplex
+from solvers.tracing import TableauRecorder
+
+
+def dump(trace):
+    for state in trace:
+        for row in state.tableau:
+            print(" ".join(f"{v:>8.2f}" for v in row))
+
+
+def timed(c, A, b, callback=None, after=None):
+    tableau, basis = leq_tableau(c, A, b)
+    start = time.perf_counter()
+    result = tableau_simplex(tableau, basis, callback=callback)
+    if after is not None:
+        with redirect_stdout(io.StringIO()):
+            after(callback)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--klee-minty', type=int, nargs='+', default=[8, 12])
+    parser.add_argument('--degenerate', type=int, nargs='+', default=[30, 60])
+    args = parser.parse_args()
+
+    instances = [(f'km{n}', klee_minty(n)) for n in args.klee_minty]
+    instances += [(f'degen{m}', degenerate(m)) for m in args.degenerate]
+
+    print(f"{'instance':>9} {'nit':>6} {'off':>9} {'no-op':>9} {'steps':>9} {'record':>9} {'print':>9}"
+          f" {'pricing':>8} {'ratio':>8} {'pivot':>8} {'MB':>7}")
+    for name, (c, A, b) in instances:
+        result, off = timed(c, A, b)
+        _, noop = timed(c, A, b, lambda step: None)
+        _, steps = timed(c, A, b, TableauRecorder(tableaus=False))
+        recorder = TableauRecorder()
+        _, record = timed(c, A, b, recorder)
+        _, printed = timed(c, A, b, TableauRecorder(), dump)
+        times = recorder.times()
+        total = sum(times.values())
+        share = " ".join(f"{times[phase] / total:>8.1%}" for phase in ('pricing', 'ratio', 'pivot'))
+        print(f"{name:>9} {result.nit:>6} {off:>8.4f}s {noop:>8.4f}s {steps:>8.4f}s {record:>8.4f}s "
+              f"{printed:>8.4f}s {share} {recorder.tableaus.nbytes / 2**20:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
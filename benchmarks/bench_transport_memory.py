@@ -0,0 +1,119 @@
+"""Peak RSS of the transportation heuristics on cost files larger than RAM.
+
+Square grids of float32 costs (integers in [1, 100), as bench_transportation
+uses) are written once to ``.npy`` files in --dir and reused. Each
+measurement runs in a fresh interpreter so ``ru_maxrss`` only covers that
+solve:
+
+* ``nw``      north_west_corner, which never reads the grid, plus the cost
+              of its cells read from the file
+* ``least``   least_cost on the file path (memory-mapped, read in blocks)
+* ``loaded``  np.load of the whole grid followed by least_cost, as an
+              in-memory script would do; skipped (its size printed instead)
+              once the grid exceeds --loaded-limit
+
+    python -m benchmarks.bench_transport_memory --sizes 10000 30000 100000 --dir /tmp
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from solvers import transportation
+
+
+def supply_demand(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(10, 100, m)
+    demand = rng.multinomial(supply.sum() - n, np.ones(n) / n) + 1
+    return supply, demand
+
+
+def cost_file(directory, size, seed=0, block=2**22):
+    """Path of the size x size float32 cost grid, written on first use."""
+    path = os.path.join(directory, f'transport_costs_{size}.npy')
+    if not os.path.exists(path):
+        # Plain writes rather than a memmap: a child's ru_maxrss starts from
+        # the peak of the parent it was forked from
+        rng = np.random.default_rng(seed)
+        header = {'descr': np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+                  'fortran_order': False, 'shape': (size, size)}
+        step = max(1, block // size)
+        with open(path + '.part', 'wb') as f:
+            np.lib.format.write_array_header_1_0(f, header)
+            for start in range(0, size, step):
+                rows = rng.integers(1, 100, (min(step, size - start), size), dtype=np.int16)
+                rows.astype(np.float32).tofile(f)
+        os.replace(path + '.part', path)
+    return path
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def run(mode, path, size):
+    supply, demand = supply_demand(size, size)
+    if mode == 'nw':
+        cells = transportation.north_west_corner(supply, demand)
+    elif mode == 'least':
+        cells = transportation.least_cost(supply, demand, path)
+    else:
+        costs = np.load(path)
+        cells = transportation.least_cost(supply, demand, costs)
+    return len(cells[0]), transportation.total_cost(cells, path)
+
+
+def measure(mode, path, size):
+    """Run one mode in a child interpreter; returns (seconds, cells, cost, MB)."""
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_transport_memory', '--child', mode,
+         '--child-path', path, '--sizes', str(size)],
+        capture_output=True, text=True, check=True,
+    )
+    seconds, cells, cost, mb = out.stdout.split()
+    return float(seconds), int(cells), float(cost), float(mb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 30000])
+    parser.add_argument('--dir', default=tempfile.gettempdir())
+    parser.add_argument('--loaded-limit', type=float, default=2.0, help='GB')
+    parser.add_argument('--child', choices=['nw', 'least', 'loaded'], help=argparse.SUPPRESS)
+    parser.add_argument('--child-path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        start = time.perf_counter()
+        cells, cost = run(args.child, args.child_path, args.sizes[0])
+        print(time.perf_counter() - start, cells, cost, peak_rss_mb())
+        return
+
+    print(f"{'size':>7} {'grid GB':>8} {'mode':>7} {'cells':>7} {'time s':>9}"
+          f" {'peak RSS MB':>12} {'cost':>14}")
+    for size in args.sizes:
+        grid_gb = 4 * size * size / 2**30
+        start = time.perf_counter()
+        path = cost_file(args.dir, size)
+        print(f"{size:>7} {grid_gb:>8.2f} {'(file)':>7} {'-':>7}"
+              f" {time.perf_counter() - start:>9.1f} {'-':>12} {'-':>14}")
+        for mode in ('nw', 'least', 'loaded'):
+            if mode == 'loaded' and grid_gb > args.loaded_limit:
+                print(f"{size:>7} {grid_gb:>8.2f} {mode:>7} {'-':>7} {'-':>9}"
+                      f" {'~%.0f' % (grid_gb * 1024):>12}  (grid alone, skipped)")
+                continue
+            seconds, cells, cost, mb = measure(mode, path, size)
+            print(f"{size:>7} {grid_gb:>8.2f} {mode:>7} {cells:>7} {seconds:>9.2f}"
+                  f" {mb:>12.1f} {cost:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Transportation heuristics on square random grids.
+
+Times the engine's North-West Corner, Least Cost and Vogel heuristics and,
+up to --baseline-max, the original grid-scanning A4Q5.py implementations
+(copied below as the baseline). Costs are integers in [1, 100).
+
+    python -m benchmarks.bench_transportation --sizes 100 500 1000 2000 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from solvers import transportation
+
+
+def transport_grid(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(10, 100, m)
+    demand = rng.multinomial(supply.sum() - n, np.ones(n) / n) + 1
+    return supply, demand, rng.integers(1, 100, (m, n))
+
+
+def baseline_north_west_corner(supply, demand):
+    s, d = supply.copy(), demand.copy()
+    m, n = len(s), len(d)
+    alloc = np.zeros((m, n))
+    i, j = 0, 0
+    while i < m and j < n:
+        qty = min(s[i], d[j])
+        alloc[i, j] = qty
+        s[i] -= qty
+        d[j] -= qty
+        if s[i] == 0: i += 1
+        if d[j] == 0: j += 1
+    return alloc
+
+
+def baseline_least_cost(supply, demand, costs):
+    s, d = supply.copy(), demand.copy()
+    c = costs.copy().astype(float)
+    m, n = len(s), len(d)
+    alloc = np.zeros((m, n))
+    while np.sum(alloc) < np.sum(supply):
+        i, j = np.unravel_index(np.argmin(c), c.shape)
+        qty = min(s[i], d[j])
+        alloc[i, j] = qty
+        s[i] -= qty
+        d[j] -= qty
+        if s[i] == 0: c[i, :] = np.inf
+        if d[j] == 0: c[:, j] = np.inf
+    return alloc
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000, 2000, 5000])
+    parser.add_argument('--baseline-max', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'method':>10} {'engine s':>10} {'baseline s':>11} {'cost':>14}")
+    for size in args.sizes:
+        supply, demand, costs = transport_grid(size, size)
+        runs = [
+            ('nw', (transportation.north_west_corner, supply, demand),
+             (baseline_north_west_corner, supply, demand)),
+            ('least', (transportation.least_cost, supply, demand, costs),
+             (baseline_least_cost, supply, demand, costs)),
+            ('vogel', (transportation.vogel, supply, demand, costs), None),
+        ]
+        for label, engine, baseline in runs:
+            seconds, cells = timed(*engine)
+            reference = '-'
+            if baseline and size <= args.baseline_max:
+                reference = f"{timed(*baseline)[0]:.3f}"
+            cost = transportation.total_cost(cells, costs)
+            print(f"{size:>6} {label:>10} {seconds:>10.3f} {reference:>11} {cost:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Iterations and wall time of Big-M versus two-phase on >= constraint LPs.
+
+Runs the A4Q4 vitamin/mineral/calorie model and random diet-style instances
+(min c @ x, A @ x >= b, x >= 0) through ``big_m`` with both M values used
+in the repo and through ``two_phase``. The last column is the objective
+error against HiGHS.
+
+    python -m benchmarks.bench_two_phase --sizes 50 200 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from solvers.revised_simplex import big_m, two_phase
+
+
+def a4q4_model():
+    A = np.array([[200, 100], [1, 2], [40, 40]], dtype=float)
+    return np.array([4.0, 3.0]), A, np.array([4000.0, 50.0, 1400.0])
+
+
+def geq_lp(m, seed=0):
+    """Random diet LP with m nutrient rows and 2m foods."""
+    rng = np.random.default_rng(seed)
+    n = 2 * m
+    A = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.3)
+    b = rng.uniform(50, 500, m)
+    c = rng.uniform(1, 100, n)
+    return c, A, b
+
+
+def run(name, c, A, b):
+    m, n = A.shape
+    c_eq = np.concatenate((c, np.zeros(m)))
+    A_eq = np.hstack((A, -np.eye(m)))
+    reference = linprog(c, A_ub=-A, b_ub=-b, method='highs').fun
+    solvers = [
+        ('big-m M=1e4', lambda: big_m(c_eq, A_eq, b, M=1e4)),
+        ('big-m M=1e6', lambda: big_m(c_eq, A_eq, b, M=1e6)),
+        ('two-phase', lambda: two_phase(c_eq, A_eq, b)),
+    ]
+    for label, solve in solvers:
+        start = time.perf_counter()
+        result = solve()
+        seconds = time.perf_counter() - start
+        print(f"{name:>10} {label:>12} {result.nit:>7} {seconds:>9.4f} "
+              f"{abs(result.fun - reference):>12.2e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200])
+    args = parser.parse_args()
+
+    print(f"{'model':>10} {'method':>12} {'iters':>7} {'time s':>9} {'obj error':>12}")
+    run('A4Q4', *a4q4_model())
+    for m in args.sizes:
+        run(f'{m}x{2 * m}', *geq_lp(m))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Per-re-solve latency of DietModel versus a cold linprog call.
+
+A stream of edits alternates between perturbed costs and perturbed
+requirements (+-10%); after each edit the model is re-solved warm from the
+previous basis, and the same problem is solved cold with
+``linprog(method='highs')``. The A4Q2.py data is the first row.
+
+    python -m benchmarks.bench_warm_start --edits 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+from solvers.diet import DietModel
+
+
+def a4q2_model():
+    costs = np.array([45, 40, 85, 65], dtype=float)
+    yields = np.array([[3, 2, 6], [4, 2, 4], [8, 7, 7], [6, 5, 4]], dtype=float)
+    return costs, yields, np.array([800, 200, 700], dtype=float)
+
+
+def diet_lp(foods, nutrients, seed=0):
+    rng = np.random.default_rng(seed)
+    yields = rng.uniform(0, 10, (foods, nutrients)) * (rng.random((foods, nutrients)) < 0.3)
+    return rng.uniform(1, 100, foods), yields, rng.uniform(50, 500, nutrients)
+
+
+def run(name, costs, yields, requirements, edits, seed=1):
+    rng = np.random.default_rng(seed)
+    model = DietModel(costs, yields, requirements)
+    model.solve()
+    warm = cold = 0.0
+    worst = 0.0
+    for k in range(edits):
+        if k % 2:
+            model.set_costs(costs * rng.uniform(0.9, 1.1, len(costs)))
+        else:
+            model.set_requirements(requirements * rng.uniform(0.9, 1.1, len(requirements)))
+
+        start = time.perf_counter()
+        result = model.solve()
+        warm += time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = linprog(model.costs, A_ub=-yields.T, b_ub=-model.requirements,
+                            method='highs')
+        cold += time.perf_counter() - start
+        worst = max(worst, abs(result.fun - reference.fun) / max(1.0, abs(reference.fun)))
+
+    print(f"{name:>10} {1e3 * warm / edits:>10.3f} {1e3 * cold / edits:>10.3f} "
+          f"{cold / warm:>8.1f}x {worst:>10.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--edits', type=int, default=200)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 2000],
+                        help='number of foods; nutrients = foods // 10')
+    args = parser.parse_args()
+
+    print(f"{'model':>10} {'warm ms':>10} {'cold ms':>10} {'speedup':>9} {'rel err':>10}")
+    run('A4Q2', *a4q2_model(), args.edits)
+    for foods in args.sizes:
+        nutrients = max(3, foods // 10)
+        run(f'{foods}x{nutrients}', *diet_lp(foods, nutrients), args.edits)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Reusable LP solvers shared by the A4Q*.py scripts.
+
+The public functions and classes can be imported from the package
+directly, e.g. ``from solvers import solve_transportation``. Their modules
+are only imported on first use, so importing ``solvers`` costs nothing and
+a worker pays only for the solvers (and the NumPy/SciPy parts) it uses.
+``revised_simplex`` itself is left out: ``solvers.revised_simplex`` is the
+module.
+"""
+
+import importlib
+
+EXPORTS = {
+    'OptimizeResult': 'result',
+    'as_bounds': 'bounds',
+    'north_west_corner': 'transportation',
+    'least_cost': 'transportation',
+    'vogel': 'transportation',
+    'modi': 'transportation',
+    'solve_transportation': 'network_simplex',
+    'TransportationLP': 'model_builder',
+    'transportation_lp': 'model_builder',
+    'dual_simplex': 'revised_simplex',
+    'big_m': 'revised_simplex',
+    'two_phase': 'revised_simplex',
+    'solve_leq': 'revised_simplex',
+    'solve_linprog': 'revised_simplex',
+    'SensitivityAnalysis': 'sensitivity',
+    'DietModel': 'diet',
+    'tableau_simplex': 'pricing',
+    'TableauRecorder': 'tracing',
+    'exact_tableau_simplex': 'exact',
+    'solve_graphical': 'graphical',
+    'solve_graphical_batch': 'graphical',
+    'interior_point': 'interior_point',
+    'Presolve': 'presolve',
+    'presolved_linprog': 'presolve',
+    'SolutionCache': 'cache',
+    'branch_and_bound': 'branch_and_bound',
+    'linear_assignment': 'assignment',
+    'solve_game': 'games',
+    'solve_games': 'games',
+    'run_scenarios': 'scenarios',
+    'solve_scenarios': 'scenarios',
+}
+
+__all__ = sorted(EXPORTS)
+
+
+def __getattr__(name):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{EXPORTS[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
@@ -0,0 +1,327 @@
+"""Linear assignment on sparse candidate lists (A4Q7.py at scale).
+
+A4Q7.py hands a dense profit matrix to ``linear_sum_assignment``. Here the
+matrix may instead be
+
+* a dense array whose non-finite entries (inf, -inf, nan) are forbidden pairs,
+* a SciPy sparse matrix whose stored entries are the only allowed pairs, or
+* a candidate list ``(rows, cols, values)`` with an optional ``shape``,
+
+and it may be rectangular, in which case every row of the smaller side is
+assigned. Everything is converted once to CSR arrays with at least as many
+columns as rows (transposing if needed), and two solvers work on them:
+
+``method='jv'``
+    Jonker-Volgenant: column reduction and a greedy match on tight pairs,
+    then one Dijkstra shortest augmenting path (on reduced costs, with a
+    heap over the candidate lists) per row still free.
+
+``method='auction'``
+    Bertsekas' auction with epsilon scaling. All free rows bid at once
+    (Jacobi bidding), which is a handful of segment reductions per round and
+    can be split across ``workers`` threads. Rectangular problems finish
+    with a reverse auction so that unassigned columns end at the lowest
+    price. Integer costs give the exact optimum; otherwise the total is
+    within ``rows * eps_final`` of it.
+
+Both return an OptimizeResult with ``row_ind``, ``col_ind`` (sorted by row),
+``fun`` and ``status`` (0 optimal, 2 no assignment covers every row).
+"""
+
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import maximum_bipartite_matching
+
+from solvers.result import OptimizeResult
+
+MESSAGES = {
+    0: "Optimal assignment found.",
+    2: "No assignment covers every row of the smaller side.",
+}
+
+
+def candidates(costs, shape=None):
+    """CSR matrix of the allowed pairs of a dense, sparse or listed input."""
+    if sp.issparse(costs):
+        C = sp.csr_matrix(costs, dtype=float)
+    elif isinstance(costs, tuple):
+        rows, cols, values = costs
+        C = sp.csr_matrix((np.asarray(values, dtype=float), (rows, cols)), shape=shape)
+    else:
+        dense = np.asarray(costs, dtype=float)
+        rows, cols = np.nonzero(np.isfinite(dense))
+        C = sp.csr_matrix((dense[rows, cols], (rows, cols)), shape=dense.shape)
+    C.sum_duplicates()
+    C.sort_indices()
+    return C
+
+
+def linear_assignment(costs, maximize=False, method='jv', shape=None, **options):
+    """Minimum (or maximum) cost assignment of rows to columns.
+
+    ``options`` go to the solver: ``eps_final``, ``scaling`` and ``workers``
+    for the auction.
+    """
+    C = candidates(costs, shape)
+    transposed = C.shape[0] > C.shape[1]
+    if transposed:
+        C = C.T.tocsr()
+    m, n = C.shape
+
+    matching = maximum_bipartite_matching(C, perm_type='column')
+    if np.any(matching < 0):
+        return OptimizeResult(row_ind=np.array([], dtype=int), col_ind=np.array([], dtype=int),
+                              fun=np.nan, status=2, success=False, message=MESSAGES[2],
+                              nit=0, method=method)
+
+    if method == 'jv':
+        cols, nit = jonker_volgenant(C.indptr, C.indices, -C.data if maximize else C.data, n)
+    elif method == 'auction':
+        cols, nit = auction(C.indptr, C.indices, C.data if maximize else -C.data, n,
+                            **options)
+    else:
+        raise ValueError(f"unknown method {method!r}")
+
+    rows = np.arange(m)
+    fun = C[rows, cols].sum()
+    if transposed:
+        order = np.argsort(cols)
+        rows, cols = cols[order], rows[order]
+    return OptimizeResult(row_ind=rows, col_ind=cols, fun=fun, status=0, success=True,
+                          message=MESSAGES[0], nit=nit, method=method)
+
+
+def jonker_volgenant(indptr, indices, data, n):
+    """Minimum cost column for every row; needs a complete matching to exist.
+
+    Returns ``(col4row, augmentations)``.
+    """
+    m = len(indptr) - 1
+    row_of = np.repeat(np.arange(m), np.diff(indptr))
+    # Column reduction only on square problems: unmatched columns of a
+    # rectangular one must keep a zero potential
+    v = np.zeros(n)
+    if m == n:
+        v = np.full(n, np.inf)
+        np.minimum.at(v, indices, data)
+    reduced = data - v[indices]
+    u = np.minimum.reduceat(reduced, indptr[:-1])
+
+    # Greedy match on tight pairs
+    col4row = np.full(m, -1)
+    row4col = np.full(n, -1)
+    tight = np.flatnonzero(reduced - u[row_of] <= 0)
+    for i, j in zip(row_of[tight].tolist(), indices[tight].tolist()):
+        if col4row[i] < 0 and row4col[j] < 0:
+            col4row[i], row4col[j] = j, i
+
+    # The searches touch a few entries at a time, so they run on lists
+    ptr, ind, cost = indptr.tolist(), indices.tolist(), data.tolist()
+    u, v = u.tolist(), v.tolist()
+    col4row, row4col = col4row.tolist(), row4col.tolist()
+
+    # Augmenting row reduction, twice: a free row takes its best column and
+    # lowers that column's potential to the gap to its second best,
+    # displacing the previous owner, who is reprocessed straight away if
+    # the gap was positive
+    free = [i for i in range(m) if col4row[i] < 0]
+    for _ in range(2):
+        unmatched = []
+        k = 0
+        while k < len(free):
+            i = free[k]
+            k += 1
+            best = second = np.inf
+            j1 = j2 = -1
+            for p in range(ptr[i], ptr[i + 1]):
+                h = cost[p] - v[ind[p]]
+                if h < second:
+                    if h < best:
+                        second, j2 = best, j1
+                        best, j1 = h, ind[p]
+                    else:
+                        second, j2 = h, ind[p]
+            i0 = row4col[j1]
+            if best < second < np.inf:
+                v[j1] -= second - best
+                u[i] = second
+            elif i0 >= 0 and j2 >= 0:
+                j1, i0 = j2, row4col[j2]
+                u[i] = best
+            elif i0 >= 0:
+                # Single candidate already taken: leave it to the searches
+                unmatched.append(i)
+                continue
+            else:
+                u[i] = best
+            row4col[j1], col4row[i] = i, j1
+            if i0 >= 0:
+                col4row[i0] = -1
+                if best < second:
+                    k -= 1
+                    free[k] = i0
+                else:
+                    unmatched.append(i0)
+        free = unmatched
+
+    dist = [np.inf] * n
+    path = [-1] * n
+    done = [False] * n
+    augmentations = 0
+    for start in free:
+        heap = []
+        touched = []
+        scanned_rows, scanned_cols = [], []
+        i, min_val, sink = start, 0.0, -1
+        while sink < 0:
+            scanned_rows.append(i)
+            base = min_val - u[i]
+            for p in range(ptr[i], ptr[i + 1]):
+                j = ind[p]
+                r = base + cost[p] - v[j]
+                if r < dist[j] and not done[j]:
+                    dist[j], path[j] = r, i
+                    touched.append(j)
+                    heapq.heappush(heap, (r, j))
+            while True:
+                min_val, j = heapq.heappop(heap)
+                if not done[j] and min_val == dist[j]:
+                    break
+            done[j] = True
+            scanned_cols.append(j)
+            if row4col[j] < 0:
+                sink = j
+            else:
+                i = row4col[j]
+
+        # Dual update keeps every reduced cost nonnegative
+        u[start] += min_val
+        for i in scanned_rows[1:]:
+            u[i] += min_val - dist[col4row[i]]
+        for j in scanned_cols:
+            v[j] -= min_val - dist[j]
+            done[j] = False
+
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == start:
+                break
+        for j in touched:
+            dist[j] = np.inf
+        augmentations += 1
+    return np.array(col4row), augmentations
+
+
+def bids(indptr, indices, benefit, prices, bidders, eps, span):
+    """Best column and bid of every bidder (Jacobi round)."""
+    starts = indptr[bidders]
+    lengths = indptr[bidders + 1] - starts
+    offsets = np.cumsum(lengths) - lengths
+    idx = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+    cols = indices[idx]
+    values = benefit[idx] - prices[cols]
+
+    best = np.maximum.reduceat(values, offsets)
+    segment = np.repeat(np.arange(len(bidders)), lengths)
+    hits = np.flatnonzero(values == best[segment])
+    first = hits[np.unique(segment[hits], return_index=True)[1]]
+    values[first] = -np.inf
+    second = np.maximum.reduceat(values, offsets)
+    # A single candidate has no second best; bid as if it were span below
+    second = np.where(np.isfinite(second), second, best - span)
+    return cols[first], prices[cols[first]] + best - second + eps
+
+
+def auction(indptr, indices, benefit, n, eps_final=None, scaling=5, workers=1):
+    """Maximum benefit column for every row by epsilon-scaled auction.
+
+    Returns ``(col4row, bidding rounds)``.
+    """
+    m = len(indptr) - 1
+    span = max(benefit.max() - benefit.min(), 1.0)
+    if eps_final is None:
+        integral = np.all(benefit == np.round(benefit))
+        eps_final = 1.0 / (m + 1) if integral else span * 1e-6 / (m + 1)
+    prices = np.zeros(n)
+    pool = ThreadPoolExecutor(workers) if workers > 1 else None
+
+    eps = max(span / scaling, eps_final)
+    rounds = 0
+    while True:
+        col4row = np.full(m, -1)
+        row4col = np.full(n, -1)
+        free = np.arange(m)
+        while free.size:
+            if pool is None or free.size < 4096 * workers:
+                cols, offers = bids(indptr, indices, benefit, prices, free, eps, span)
+            else:
+                parts = pool.map(lambda chunk: bids(indptr, indices, benefit, prices,
+                                                    chunk, eps, span),
+                                 np.array_split(free, workers))
+                cols, offers = map(np.concatenate, zip(*parts))
+
+            # Highest bid per column wins it; the previous owner is freed
+            order = np.lexsort((-offers, cols))
+            cols, offers, bidders = cols[order], offers[order], free[order]
+            win = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+            cols, winners = cols[win], bidders[win]
+            losers = row4col[cols]
+            losers = losers[losers >= 0]
+            col4row[losers] = -1
+            row4col[cols] = winners
+            col4row[winners] = cols
+            prices[cols] = offers[win]
+            free = np.flatnonzero(col4row < 0)
+            rounds += 1
+        if eps <= eps_final:
+            break
+        eps = max(eps / scaling, eps_final)
+
+    if pool is not None:
+        pool.shutdown()
+    if m < n:
+        reverse_auction(indptr, indices, benefit, prices, col4row, row4col, eps)
+    return col4row, rounds
+
+
+def reverse_auction(indptr, indices, benefit, prices, col4row, row4col, eps):
+    """Lower the prices of unassigned columns to the lowest assigned price.
+
+    Columns bid for rows here; every row stays assigned, so ``col4row`` and
+    ``row4col`` are updated in place.
+    """
+    m = len(col4row)
+    by_row = sp.csr_matrix((benefit, indices, indptr), shape=(m, len(prices)))
+    profit = np.asarray(by_row[np.arange(m), col4row]).ravel() - prices[col4row]
+    by_col = by_row.tocsc()
+    floor = prices[col4row].min()
+
+    pending = [j for j in np.flatnonzero(row4col < 0).tolist() if prices[j] > floor]
+    while pending:
+        j = pending.pop()
+        a, b = by_col.indptr[j], by_col.indptr[j + 1]
+        if a == b:
+            prices[j] = floor
+            continue
+        rows = by_col.indices[a:b]
+        values = by_col.data[a:b] - profit[rows]
+        k = np.argmax(values)
+        best = values[k]
+        values[k] = -np.inf
+        second = values.max()
+        if floor >= best - eps:
+            prices[j] = floor
+            continue
+        i = rows[k]
+        prices[j] = max(floor, second - eps)
+        profit[i] = by_col.data[a + k] - prices[j]
+        old = col4row[i]
+        col4row[i], row4col[j], row4col[old] = j, i, -1
+        if prices[old] > floor:
+            pending.append(old)
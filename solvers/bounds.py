@@ -0,0 +1,26 @@
+"""``linprog`` bounds arguments as float arrays.
+
+``bounds`` may be None (every variable >= 0), one (lb, ub) pair for all
+variables or one pair per variable, with None for an infinite side.
+``as_bounds`` is the one conversion the solvers, the presolve, the cache
+keys and the shared scenario arrays all use; it needs only NumPy.
+"""
+
+import numpy as np
+
+
+def as_bounds(bounds, n=None):
+    """``lb`` and ``ub`` arrays for any ``linprog`` bounds argument.
+
+    With ``n`` they have one entry per variable; without it a single pair
+    stays a single entry, which ``linprog`` applies to every variable.
+    """
+    if bounds is None:
+        bounds = (0, None)
+    # None becomes nan, which stands for an infinite bound
+    pairs = np.array(bounds, dtype=float).reshape(-1, 2)
+    if n is not None:
+        pairs = np.broadcast_to(pairs, (n, 2))
+    lb = np.where(np.isnan(pairs[:, 0]), -np.inf, pairs[:, 0])
+    ub = np.where(np.isnan(pairs[:, 1]), np.inf, pairs[:, 1])
+    return lb, ub
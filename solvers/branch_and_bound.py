@@ -0,0 +1,335 @@
+"""Branch-and-bound for LPs with integer variables.
+
+    min c @ x   subject to   A_ub @ x <= b_ub,  A_eq @ x = b_eq,  lb <= x <= ub,
+                             x_j integer where integrality[j] is set
+
+The root relaxation is solved by the two-phase revised simplex on the slack
+form [A_ub I; A_eq 0]. A child node differs from its parent only in one
+tightened bound, so the parent's optimal basis (and the set of variables at
+their upper bound) is still dual feasible and the bounded dual simplex
+re-solves the child from it, usually in a few pivots. The incumbent's
+objective is passed as the cutoff, so a child that cannot beat it is dropped
+in the middle of its solve.
+
+Open nodes wait in a heap keyed by their parent's LP value (best-bound
+selection); the smallest key is the global lower bound used for the gap.
+The most fractional variable is branched on, and every node LP solution is
+also rounded (down, then to nearest) in case that gives a better incumbent.
+
+With ``workers`` > 1 the node LPs run in a process pool. The standard-form
+model is copied once into shared memory (see ``scenarios.share``); a task
+carries only the node's bound changes and the parent basis. The incumbent
+objective lives in a shared ``multiprocessing.Value`` that every worker
+reads as its cutoff, so an improvement found anywhere prunes LPs already
+running elsewhere.
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.result import OptimizeResult
+from solvers.revised_simplex import as_matrix, dual_simplex, standard_form, two_phase
+from solvers.scenarios import attach, share
+
+MESSAGES = {
+    0: "Optimal integer solution found (within the gap).",
+    1: "Node or time limit reached.",
+    2: "The problem is infeasible.",
+    3: "The LP relaxation is unbounded.",
+}
+
+# Worker state, set once per process by init_worker
+_model = {}
+_incumbent = None
+
+
+def solve_root(c, A, b, box):
+    """Root relaxation; artificials left basic become columns fixed at 0.
+
+    Returns the LP result and the (possibly extended) c, A and bounds the
+    nodes are solved with.
+    """
+    root = two_phase(c, A, b, bounds=box)
+    N = len(c)
+    kept = [q - N for q in root.basis if q >= N]
+    if kept:
+        columns = np.zeros((A.shape[0], len(kept)))
+        columns[kept, range(len(kept))] = 1.0
+        A = sp.hstack((A, sp.csc_matrix(columns)), format='csc') if sp.issparse(A) \
+            else np.hstack((A, columns))
+        c = np.concatenate((c, np.zeros(len(kept))))
+        box = np.vstack((box, np.zeros((len(kept), 2))))
+        position = {N + row: N + k for k, row in enumerate(kept)}
+        root.basis = np.array([position.get(q, q) for q in root.basis])
+        root.at_upper = np.concatenate((root.at_upper, np.zeros(len(kept), dtype=bool)))
+    return root, c, A, box
+
+
+def round_rows(A_ub, b_ub, integer, tol):
+    """b_ub rounded down on rows whose terms are integers times integer variables.
+
+    Such a row's left-hand side is an integer at every integer point, so
+    this cuts off only fractional points; on network matrices (e.g.
+    transportation) it makes the LP relaxation's vertices integral.
+    """
+    A = as_matrix(A_ub)
+    b = np.asarray(b_ub, dtype=float)
+    if sp.issparse(A):
+        csr = A.tocsr()
+        bad = ~integer[csr.indices] | (csr.data != np.round(csr.data))
+        rows = np.repeat(np.arange(A.shape[0]), np.diff(csr.indptr))
+        whole = np.bincount(rows, weights=bad, minlength=A.shape[0]) == 0
+    else:
+        whole = np.all((A == 0) | (integer & (A == np.round(A))), axis=1)
+    return np.where(whole, np.floor(b + tol), b)
+
+
+def node_bounds(box, changes):
+    box = box.copy()
+    for j, lo, hi in changes:
+        box[j] = lo, hi
+    return box
+
+
+def cutoff_for(incumbent, gap):
+    """Objective a node must stay below to matter for the incumbent."""
+    if not np.isfinite(incumbent):
+        return None
+    return incumbent - gap * max(1.0, abs(incumbent))
+
+
+def solve_node(model, changes, basis, at_upper, cutoff):
+    """Re-solve a node from its parent's basis; a compact result tuple.
+
+    Without a usable basis (``None``, or one that round-off left slightly
+    dual infeasible) the node is solved cold, and if that leaves an
+    artificial basic its children are solved cold too.
+    """
+    box = node_bounds(model['box'], changes)
+    c, A, b = model['c'], model['A'], model['b']
+    result = None
+    if basis is not None:
+        flags = np.zeros(len(c), dtype=bool)
+        flags[at_upper] = True
+        try:
+            result = dual_simplex(c, A, b, basis, bounds=box, at_upper=flags, cutoff=cutoff)
+        except ValueError:
+            pass
+    if result is None:
+        result = two_phase(c, A, b, bounds=box)
+        if np.any(result.basis >= len(c)):
+            result.basis = None
+    if result.status != 0:
+        return result.status, np.inf, None, None, None, result.nit
+    at_upper = np.flatnonzero(result.at_upper) if result.basis is not None else None
+    return 0, result.fun, result.x[:model['n']], result.basis, at_upper, result.nit
+
+
+def init_worker(specs, n, incumbent):
+    global _incumbent
+    _model.update(attach(specs), n=n)
+    _incumbent = incumbent
+
+
+def solve_task(task):
+    changes, basis, at_upper, gap = task
+    return solve_node(_model, changes, basis, at_upper, cutoff_for(_incumbent.value, gap))
+
+
+def branch_and_bound(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                     integrality=None, workers=1, gap=1e-6, node_limit=None,
+                     time_limit=None, tol=1e-6):
+    """Minimize c @ x with the variables flagged in ``integrality`` integer.
+
+    Arguments follow ``linprog``; ``integrality`` is an array of 0/1 flags
+    (default: every variable integer). ``gap`` is the relative gap between
+    incumbent and best bound at which the search stops; ``workers`` > 1
+    solves node LPs in that many processes (``None``: one per CPU).
+
+    Returns an OptimizeResult with ``x``, ``fun``, ``status``, ``message``,
+    ``success``, the final ``bound`` and ``gap``, the number of ``nodes``
+    solved and ``pruned``, the dual simplex pivots ``nit``, ``time``,
+    ``nodes_per_second`` and ``trace``: (seconds, incumbent, bound) each
+    time either of them improved.
+    """
+    start = time.perf_counter()
+    n = len(np.asarray(c))
+    integer = np.ones(n, dtype=bool) if integrality is None \
+        else np.asarray(integrality, dtype=bool)
+    workers = workers or os.cpu_count()
+    node_limit = np.inf if node_limit is None else node_limit
+    time_limit = np.inf if time_limit is None else time_limit
+
+    if A_ub is not None:
+        b_ub = round_rows(A_ub, b_ub, integer, tol)
+    c_std, A, b, box = standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds)
+    # Integer variables only take integer values inside their bounds
+    box[:n][integer] = np.column_stack((np.ceil(box[:n, 0][integer] - tol),
+                                        np.floor(box[:n, 1][integer] + tol)))
+    if np.any(box[:, 0] > box[:, 1]):
+        root = OptimizeResult(status=2, nit=0)
+    else:
+        root, c_std, A, box = solve_root(c_std, A, b, box)
+    if root.status != 0:
+        status = 1 if root.status == 1 else root.status
+        return OptimizeResult(x=None, fun=None, status=status, message=MESSAGES[status],
+                              success=False, bound=None, gap=None, nodes=1, pruned=0,
+                              nit=root.nit, time=time.perf_counter() - start,
+                              nodes_per_second=0.0, trace=[])
+    checks = [(as_matrix(A_ub), np.asarray(b_ub, dtype=float), False)] if A_ub is not None else []
+    if A_eq is not None:
+        checks.append((as_matrix(A_eq), np.asarray(b_eq, dtype=float), True))
+    c = np.asarray(c, dtype=float)
+    lower, upper = box[:n, 0], box[:n, 1]
+
+    def rounded(x):
+        """Objective and point of the best feasible rounding of x, if any."""
+        best = None
+        for candidate in (np.floor(x + tol), np.round(x)):
+            point = np.where(integer, candidate, x)
+            if np.any(point < lower - tol) or np.any(point > upper + tol):
+                continue
+            if all(np.all(np.abs(M @ point - rhs) <= tol) if equal else np.all(M @ point <= rhs + tol)
+                   for M, rhs, equal in checks):
+                value = float(c @ point)
+                if best is None or value < best[0]:
+                    best = value, point
+        return best
+
+    model = {'c': c_std, 'A': A, 'b': b, 'box': box, 'n': n}
+    shared_incumbent = multiprocessing.RawValue('d', np.inf)
+    incumbent, best_x = np.inf, None
+    counter = itertools.count()
+    heap = []       # (parent LP value, id, bound changes, basis, at_upper)
+    plunge = []     # children of the last node, explored first until an incumbent exists
+    taken = set()   # ids of nodes taken from the plunge stack but still in the heap
+    trace = []
+    nodes, pruned, nit = 1, 0, root.nit
+    in_flight = {}
+    status = 0
+
+    def bound():
+        while heap and heap[0][1] in taken:
+            taken.discard(heapq.heappop(heap)[1])
+        keys = [parent for parent, _ in in_flight.values()]
+        if heap:
+            keys.append(heap[0][0])
+        return min(keys, default=incumbent)
+
+    def select():
+        """Next open node: depth-first before the first incumbent, then best-bound."""
+        while plunge and not np.isfinite(incumbent):
+            node = plunge.pop()
+            if node[1] not in taken:
+                taken.add(node[1])
+                return node
+        plunge.clear()
+        while heap:
+            node = heapq.heappop(heap)
+            if node[1] in taken:
+                taken.discard(node[1])
+            else:
+                return node
+        return None
+
+    def record():
+        point = (incumbent, min(bound(), incumbent))
+        if not trace or trace[-1][1:] != point:
+            trace.append((time.perf_counter() - start, *point))
+
+    def handle(changes, result):
+        """Fathom, update the incumbent or branch on a solved node."""
+        nonlocal incumbent, best_x, pruned, nit
+        node_status, fun, x, basis, at_upper, pivots = result
+        nit += pivots
+        cutoff = cutoff_for(incumbent, gap)
+        if node_status != 0 or (cutoff is not None and fun >= cutoff):
+            pruned += 1
+            return
+        frac = np.where(integer, np.abs(x - np.round(x)), 0.0)
+        if frac.max() <= tol:
+            candidate = (fun, np.where(integer, np.round(x), x))
+        else:
+            candidate = rounded(x)
+        if candidate is not None and candidate[0] < incumbent:
+            incumbent, best_x = candidate
+            shared_incumbent.value = incumbent
+            record()
+        if frac.max() <= tol:
+            return
+        # Most fractional variable; the children keep this node's basis
+        j = int(np.argmax(np.minimum(x - np.floor(x), np.ceil(x) - x) * integer))
+        lo, hi = node_bounds(box, changes)[j]
+        children = [(j, lo, np.floor(x[j])), (j, np.ceil(x[j]), hi)]
+        if x[j] - np.floor(x[j]) < 0.5:
+            children.reverse()      # the nearer side is plunged into first
+        for child in children:
+            if child[1] <= child[2]:
+                node = (fun, next(counter), changes + (child,), basis, at_upper)
+                heapq.heappush(heap, node)
+                if not np.isfinite(incumbent):
+                    plunge.append(node)
+
+    handle((), (0, root.fun, root.x[:n], root.basis, np.flatnonzero(root.at_upper), 0))
+    record()
+
+    pool = blocks = None
+    if workers > 1:
+        blocks, specs = share({'c': c_std, 'A': A, 'b': b, 'box': box})
+        pool = ProcessPoolExecutor(workers, initializer=init_worker,
+                                   initargs=(specs, n, shared_incumbent))
+    try:
+        while heap or in_flight:
+            if nodes >= node_limit or time.perf_counter() - start >= time_limit:
+                status = 1
+                break
+            cutoff = cutoff_for(incumbent, gap)
+            # Keep every worker busy with the best open nodes
+            while len(in_flight) < workers:
+                node = select()
+                if node is None:
+                    break
+                parent_bound, _, changes, basis, at_upper = node
+                if cutoff is not None and parent_bound >= cutoff:
+                    pruned += 1
+                    continue
+                nodes += 1
+                if pool is None:
+                    handle(changes, solve_node(model, changes, basis, at_upper, cutoff))
+                    break
+                future = pool.submit(solve_task, (changes, basis, at_upper, gap))
+                in_flight[future] = (parent_bound, changes)
+            if in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent_bound, changes = in_flight.pop(future)
+                    handle(changes, future.result())
+            record()
+            if np.isfinite(incumbent) and incumbent - bound() <= gap * max(1.0, abs(incumbent)):
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    lower_bound = min(bound(), incumbent)
+    elapsed = time.perf_counter() - start
+    if best_x is None and status == 0:
+        status = 2
+    found = best_x is not None
+    return OptimizeResult(
+        x=best_x, fun=incumbent if found else None, status=status, message=MESSAGES[status],
+        success=status == 0, bound=lower_bound,
+        gap=(incumbent - lower_bound) / max(1.0, abs(incumbent)) if found else None,
+        nodes=nodes, pruned=pruned, nit=nit, time=elapsed,
+        nodes_per_second=nodes / elapsed, trace=trace,
+    )
@@ -0,0 +1,201 @@
+"""Content-addressed cache of LP solutions.
+
+Services send the same few models over and over, so a solve is looked up
+by a digest of the model before anything is run. ``model_key`` hashes the
+canonical form of a ``linprog`` problem: every array as contiguous float64
+(so lists, ints and floats giving the same numbers hash alike, and -0.0 is
+0.0), sparse matrices as sorted CSR, bounds expanded to one (lb, ub) pair
+per variable with None as an infinite bound, plus the method and options.
+BLAKE2b over those bytes takes microseconds for the models the scripts
+solve.
+
+``SolutionCache`` keeps results in an in-process LRU bounded by their
+pickled size in bytes. With ``path`` set it also writes every result to
+``<path>/<key>.pkl`` (atomically, via a rename), so worker processes
+sharing the directory answer each other's models; entries found there are
+promoted into the memory LRU. The disk store is never evicted from.
+Results handed out on a hit share their arrays with the cache, and those
+arrays are read-only.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from solvers.bounds import as_bounds
+from solvers.result import OptimizeResult
+
+KEYS = ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq')
+
+
+def method_name(method):
+    """Stable name of a linprog method string or a solver function."""
+    if callable(method):
+        return f"{method.__module__}.{method.__qualname__}"
+    return str(method)
+
+
+def model_key(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, method='highs',
+              options=None, presolve=False):
+    """Hex digest identifying a ``linprog`` problem and how it is solved."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    def add(tag, array):
+        array = np.ascontiguousarray(array, dtype=float) + 0.0
+        digest.update(f"{tag}{array.shape}".encode())
+        digest.update(array.data)
+
+    c = np.asarray(c, dtype=float)
+    for name, value in zip(KEYS, (c, A_ub, b_ub, A_eq, b_eq)):
+        if value is None:
+            digest.update(f"{name}:none".encode())
+        elif hasattr(value, 'tocsr'):
+            csr = value.tocsr(copy=True)
+            csr.sum_duplicates()
+            csr.sort_indices()
+            add(f"{name}:csr{csr.shape}", csr.data)
+            digest.update(csr.indices.astype(np.int64).data)
+            digest.update(csr.indptr.astype(np.int64).data)
+        else:
+            add(name, value)
+    add('bounds', np.column_stack(as_bounds(bounds, len(c))))
+    digest.update(method_name(method).encode())
+    digest.update(repr(sorted((options or {}).items())).encode())
+    if presolve:
+        digest.update(b'presolve')
+    return digest.hexdigest()
+
+
+def freeze(value):
+    """Result converted to plain OptimizeResults with read-only arrays."""
+    if isinstance(value, dict):
+        return OptimizeResult({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.flags.writeable = False
+    return value
+
+
+class SolutionCache:
+    """LRU of solve results keyed by ``model_key``, bounded by ``maxbytes``.
+
+    ``solve`` takes the ``linprog`` arguments; ``method`` is a ``linprog``
+    method name or a solver function called as ``method(c, A_ub=...,
+    **options)`` with only the arguments that are not None (e.g.
+    ``solve_leq`` or ``interior_point``); with ``presolve=True`` it runs
+    through ``presolve.presolved_linprog``. ``info()`` reports the counters.
+    """
+
+    def __init__(self, maxbytes=64 * 2**20, path=None):
+        self.maxbytes = maxbytes
+        self.path = path
+        self.entries = OrderedDict()    # key -> (result, nbytes)
+        self.nbytes = 0
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+        self.lock = threading.Lock()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Cached result for key (memory, then disk) or None; counts hit/miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return OptimizeResult(entry[0])
+        data = self.read(key)
+        with self.lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        result = pickle.loads(data)
+        self.remember(key, result, len(data))
+        return OptimizeResult(result)
+
+    def put(self, key, result):
+        """Store a result (frozen copy) in memory and, if set up, on disk."""
+        result = freeze(result)
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self.remember(key, result, len(data))
+        if self.path is not None:
+            self.write(key, data)
+        return OptimizeResult(result)
+
+    def remember(self, key, result, nbytes):
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key)[1]
+            if nbytes > self.maxbytes:
+                return
+            self.entries[key] = (result, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.maxbytes:
+                _, (_, size) = self.entries.popitem(last=False)
+                self.nbytes -= size
+                self.evictions += 1
+
+    def file(self, key):
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def read(self, key):
+        if self.path is None:
+            return None
+        try:
+            with open(self.file(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write(self, key, data):
+        # Write then rename, so readers in other processes never see a
+        # partial file
+        fd, temp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp, self.file(key))
+
+    def solve(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+              method='highs', options=None, presolve=False):
+        """Cached result of the problem, solving and storing it on a miss."""
+        key = model_key(c, A_ub, b_ub, A_eq, b_eq, bounds, method, options, presolve)
+        result = self.get(key)
+        if result is not None:
+            return result
+        if presolve:
+            from solvers.presolve import presolved_linprog
+            result = presolved_linprog(c, A_ub, b_ub, A_eq, b_eq, bounds, method=method,
+                                       options=options)
+        elif callable(method):
+            problem = dict(zip(KEYS[1:], (A_ub, b_ub, A_eq, b_eq)), bounds=bounds)
+            problem = {name: value for name, value in problem.items() if value is not None}
+            result = method(c, **problem, **(options or {}))
+        else:
+            from scipy.optimize import linprog
+            result = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds, method=method, options=options)
+        return self.put(key, result)
+
+    def clear(self):
+        """Empty the memory LRU (the disk store and counters are kept)."""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def info(self):
+        """Counters: hits, disk_hits, misses, evictions, entries, bytes."""
+        with self.lock:
+            return OptimizeResult(hits=self.hits, disk_hits=self.disk_hits, misses=self.misses,
+                                  evictions=self.evictions, entries=len(self.entries),
+                                  bytes=self.nbytes, maxbytes=self.maxbytes)
@@ -0,0 +1,78 @@
+"""Diet model from A4Q2.py with warm-started re-solves.
+
+    min  costs @ x   subject to   yields.T @ x >= requirements,  x >= 0
+
+``DietModel`` keeps the optimal basis of its last solve. After a cost edit
+that basis is still primal feasible, so the primal simplex continues from
+it; after a requirements edit it is still dual feasible, so the dual simplex
+does. Only when neither holds (or on the first solve) does it start cold
+with the two-phase method.
+"""
+
+import numpy as np
+
+from solvers.revised_simplex import (BasisFactor, dual_simplex,
+                                     revised_simplex, two_phase)
+from solvers.sensitivity import SensitivityAnalysis
+
+
+class DietModel:
+    """Diet LP that re-solves from its last optimal basis."""
+
+    def __init__(self, costs, yields, requirements, tol=1e-9):
+        self.costs = np.array(costs, dtype=float)
+        self.yields = np.array(yields, dtype=float)
+        self.requirements = np.array(requirements, dtype=float)
+        foods, nutrients = self.yields.shape
+        # Surplus form: yields.T @ x - s = requirements
+        self.A = np.hstack((self.yields.T, -np.eye(nutrients)))
+        self.tol = tol
+        self.basis = None
+
+    def set_costs(self, costs):
+        self.costs[:] = costs
+
+    def set_requirements(self, requirements):
+        self.requirements[:] = requirements
+
+    def solve(self):
+        """Solve the current model; ``result.start`` tells how it started."""
+        foods, nutrients = self.yields.shape
+        c = np.concatenate((self.costs, np.zeros(nutrients)))
+        b = self.requirements
+        start = 'cold'
+        if self.basis is not None:
+            factor = BasisFactor(self.A, self.basis)
+            if np.all(factor.ftran(b) >= -self.tol):
+                start = 'primal'
+            else:
+                y = factor.btran(c[self.basis])
+                if np.all(c - self.A.T @ y >= -self.tol):
+                    start = 'dual'
+
+        if start == 'primal':
+            result = revised_simplex(c, self.A, b, self.basis, tol=self.tol)
+        elif start == 'dual':
+            result = dual_simplex(c, self.A, b, self.basis, tol=self.tol)
+        else:
+            result = two_phase(c, self.A, b, tol=self.tol)
+
+        # Artificials left basic by two_phase have no column in self.A
+        ok = result.status == 0 and np.all(result.basis < foods + nutrients)
+        self.basis = result.basis if ok else None
+        result.surplus = result.x[foods:]
+        result.x = result.x[:foods]
+        result.start = start
+        return result
+
+    def sensitivity(self):
+        """SensitivityAnalysis at the last optimal basis.
+
+        Variables are the foods followed by one surplus per nutrient, so
+        cost scenarios need zeros appended for the surplus columns.
+        """
+        if self.basis is None:
+            raise ValueError("solve the model before analysing it")
+        c = np.concatenate((self.costs, np.zeros(len(self.requirements))))
+        return SensitivityAnalysis(c, self.A, self.requirements, self.basis,
+                                   tol=self.tol)
@@ -0,0 +1,169 @@
+"""Exact rational certificates for tableau simplex solutions.
+
+Pivoting on a tableau of ``fractions.Fraction`` entries is exact but every
+pivot pays for big-integer arithmetic. Here a float solve picks the basis
+instead, and the final tableau for that basis is then rebuilt once from the
+original data in integer arithmetic:
+
+    B @ Z = T[:m]                constraint rows  [B^-1 A | B^-1 b]
+    T[m] - T[m, basis] @ Z       objective row    [d | -z]
+
+The system is solved with fraction-free (Bareiss) elimination, so Z comes
+out as an integer matrix over one common denominator and the optimality
+signs (B^-1 b >= 0, d >= 0) are checked on integers. Only if the float
+basis turns out not to be optimal does the exact tableau take more pivots.
+
+Float data is read as the decimal it prints as (``0.01`` is 1/100, not the
+binary fraction nearest to it).
+"""
+
+import math
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from solvers.pricing import tableau_simplex
+from solvers.result import OptimizeResult
+
+MESSAGES = {
+    0: "Basis certified optimal in exact arithmetic.",
+    1: "Iteration limit reached.",
+    3: "The problem is unbounded.",
+}
+
+
+def rational(value):
+    """Exact Fraction for an int, Fraction or float (by its repr)."""
+    if isinstance(value, (int, np.integer, Fraction)):
+        return Fraction(value)
+    return Fraction(repr(float(value)))
+
+
+as_rational = np.frompyfunc(rational, 1, 1)
+
+
+def rational_tableau(tableau):
+    """Object array of Fractions with the entries of ``tableau``."""
+    return as_rational(np.asarray(tableau)).astype(object)
+
+
+def integer_rows(T):
+    """Scale each row of a Fraction array by the lcm of its denominators.
+
+    Returns the rows as an object array of Python ints and the scales.
+    """
+    scales = [math.lcm(*(v.denominator for v in row)) for row in T]
+    rows = [[v.numerator * (scale // v.denominator) for v in row]
+            for row, scale in zip(T, scales)]
+    return np.array(rows, dtype=object).reshape(T.shape), scales
+
+
+def bareiss_solve(B, R):
+    """Solve B @ Z = R for integer matrices; returns (N, d) with Z = N / d.
+
+    Fraction-free Gaussian elimination: every intermediate entry is a minor
+    of [B | R], so divisions by the previous pivot are exact and the
+    entries stay as small as the determinant allows. Raises
+    ``np.linalg.LinAlgError`` if B is singular.
+    """
+    m = B.shape[0]
+    M = np.concatenate((B, R), axis=1).astype(object)
+    prev = 1
+    for k in range(m):
+        nonzero = np.flatnonzero(M[k:, k] != 0)
+        if nonzero.size == 0:
+            raise np.linalg.LinAlgError("basis matrix is singular")
+        p = k + nonzero[0]
+        if p != k:
+            M[[k, p]] = M[[p, k]]
+        below = M[k + 1:, k + 1:] * M[k, k] - np.multiply.outer(M[k + 1:, k], M[k, k + 1:])
+        M[k + 1:, k + 1:] = below // prev
+        M[k + 1:, k] = 0
+        prev = M[k, k]
+
+    # Back substitution scaled by d = +-det(B); by Cramer's rule d * Z is
+    # integral, so each division is exact
+    d = M[m - 1, m - 1]
+    N = np.empty((m, R.shape[1]), dtype=object)
+    for i in range(m - 1, -1, -1):
+        rest = M[i, i + 1:m] @ N[i + 1:] if i < m - 1 else 0
+        N[i] = (d * M[i, m:] - rest) // M[i, i]
+    return N, d
+
+
+def basis_tableau(tableau, basis):
+    """Exact tableau of ``tableau`` (as Fractions) pivoted to ``basis``.
+
+    Returns the Fraction tableau together with the signs of its right-hand
+    side and its reduced costs, computed on integers before any Fraction is
+    built.
+    """
+    T = rational_tableau(tableau)
+    m = T.shape[0] - 1
+    rows, _ = integer_rows(T[:m])
+    N, d = bareiss_solve(rows[:, basis], rows)
+
+    # Objective row over the common denominator scale * d, where scale > 0
+    (cost,), (scale,) = integer_rows(T[m:])
+    objective = cost * d - cost[basis] @ N
+    sign = 1 if d > 0 else -1
+    feasible = all(v * sign >= 0 for v in N[:, -1])
+    optimal = all(v * sign >= 0 for v in objective[:-1])
+
+    exact = np.empty_like(T)
+    exact[:m] = np.frompyfunc(Fraction, 2, 1)(N, d)
+    exact[m] = np.frompyfunc(Fraction, 2, 1)(objective, scale * d)
+    return exact, feasible, optimal
+
+
+def certify(tableau, basis, start_basis, pricing='dantzig', ratio='textbook', maxiter=None):
+    """Exact solution of the tableau problem from a basis found in float.
+
+    ``tableau`` and ``start_basis`` are the starting tableau and basis of a
+    float ``tableau_simplex`` run that ended in ``basis``. That basis is
+    rebuilt and checked by ``basis_tableau``. If it is feasible but not
+    optimal, exact pivots continue from it (with ``tol=0``); if it is not
+    even feasible, the whole solve is repeated exactly from the starting
+    tableau.
+
+    Returns an OptimizeResult with the exact ``tableau`` (Fractions) and
+    ``basis``, ``status`` (0 certified optimal, 1 iteration limit, 3
+    unbounded), ``certified`` (the float basis was optimal as is),
+    ``nit_exact`` (exact pivots) and the seconds spent (``time_exact``).
+    """
+    start = time.perf_counter()
+    basis = list(basis)
+    exact, feasible, optimal = None, False, False
+    try:
+        exact, feasible, optimal = basis_tableau(tableau, basis)
+    except np.linalg.LinAlgError:
+        pass
+    nit_exact, status = 0, 0
+    if not feasible:
+        exact, basis = rational_tableau(tableau), list(start_basis)
+    if not optimal:
+        run = tableau_simplex(exact, basis, pricing, ratio, maxiter, tol=0)
+        basis, nit_exact, status = run.basis, run.nit, run.status
+    return OptimizeResult(
+        tableau=exact, basis=basis, status=status, message=MESSAGES[status],
+        success=status == 0, certified=optimal, nit_exact=nit_exact,
+        time_exact=time.perf_counter() - start,
+    )
+
+
+def exact_tableau_simplex(tableau, basis, pricing='dantzig', ratio='textbook',
+                          maxiter=None, tol=1e-9):
+    """Solve the tableau problem in float, then ``certify`` its basis.
+
+    ``tableau`` and ``basis`` are as for ``tableau_simplex``, but the
+    tableau is not modified. Returns the fields of ``certify`` plus ``nit``
+    (float pivots) and ``time_float``.
+    """
+    start = time.perf_counter()
+    run = tableau_simplex(np.array(tableau, dtype=float), basis, pricing, ratio, maxiter, tol)
+    time_float = time.perf_counter() - start
+    result = certify(tableau, [int(j) for j in run.basis], basis, pricing, ratio, maxiter)
+    result.nit = run.nit
+    result.time_float = time_float
+    return result
@@ -0,0 +1,219 @@
+"""Zero-sum matrix games (A4Q8.py) solved in batches.
+
+``payoffs`` is an (m, n) matrix or a (k, m, n) stack of them; entries are
+payoffs to the row player, who maximizes. A4Q8.py solves one LP per player,
+but the column player's LP is the dual of the row player's
+
+    max v   subject to   A.T @ p >= v,  sum(p) = 1,  p >= 0
+
+so one solve gives both strategies: ``q`` is the vector of multipliers of
+the ``A.T @ p >= v`` rows. Before any LP is built the whole stack goes
+through two vectorized passes:
+
+* games with a pure saddle point (max of row minima == min of column maxima)
+  are answered directly;
+* weakly dominated rows and columns are removed repeatedly. The value is
+  unchanged and an optimal strategy of the reduced game, padded with zeros,
+  is optimal for the original one.
+
+The remaining games are packed block-diagonally, ``chunk`` games per
+``linprog`` call. For games too large for an exact solve, ``method='mwu'``
+(multiplicative weights) and ``method='fictitious'`` (fictitious play) run
+all games at once and report the duality ``gap`` of their averaged
+strategies.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.result import OptimizeResult
+
+
+def saddle_points(payoffs):
+    """Mask of games with a pure saddle point, and its value, row and column."""
+    A = np.asarray(payoffs, dtype=float)
+    row_min = A.min(axis=2)
+    col_max = A.max(axis=1)
+    row = row_min.argmax(axis=1)
+    col = col_max.argmin(axis=1)
+    games = np.arange(len(A))
+    lower, upper = row_min[games, row], col_max[games, col]
+    return lower == upper, lower, row, col
+
+
+def dominates(A, live, budget=2**24):
+    """out[g, a, b]: row a >= row b on every live column of game g.
+
+    Rows are compared in blocks so the temporary stays under ``budget``
+    elements.
+    """
+    k, m, n = A.shape
+    out = np.empty((k, m, m), dtype=bool)
+    step = max(1, budget // (k * m * n))
+    dead = ~live[:, None, None, :]
+    for lo in range(0, m, step):
+        out[:, lo:lo + step] = np.all((A[:, lo:lo + step, None, :] >= A[:, None, :, :]) | dead,
+                                      axis=3)
+    return out
+
+
+def undominated(payoffs, rows=None, cols=None):
+    """Rows and columns that survive iterated weak dominance, as masks.
+
+    Of two identical strategies the one with the lower index is kept.
+    """
+    A = np.asarray(payoffs, dtype=float)
+    k, m, n = A.shape
+    # The column player minimizes: column a beats b when -A[:, a] >= -A[:, b]
+    losses = -A.transpose(0, 2, 1)
+    rows = np.ones((k, m), dtype=bool) if rows is None else rows.copy()
+    cols = np.ones((k, n), dtype=bool) if cols is None else cols.copy()
+    before_r = np.triu(np.ones((m, m), dtype=bool), 1)
+    before_c = np.triu(np.ones((n, n), dtype=bool), 1)
+    while True:
+        geq = dominates(A, cols)
+        wins = geq & (~geq.transpose(0, 2, 1) | before_r) & rows[:, :, None]
+        dead_rows = wins.any(axis=1) & rows
+        geq = dominates(losses, rows)
+        wins = geq & (~geq.transpose(0, 2, 1) | before_c) & cols[:, :, None]
+        dead_cols = wins.any(axis=1) & cols
+        if not dead_rows.any() and not dead_cols.any():
+            return rows, cols
+        rows &= ~dead_rows
+        cols &= ~dead_cols
+
+
+def solve_lp(A, rows, cols):
+    """Block-diagonal LP over a chunk of games; live strategies only."""
+    k, m, n = A.shape
+    n_rows, n_cols = rows.sum(axis=1), cols.sum(axis=1)
+    var_start = np.concatenate(([0], np.cumsum(n_rows + 1)))
+    con_start = np.concatenate(([0], np.cumsum(n_cols)))
+    v_index = var_start[1:] - 1
+    p_index = var_start[:-1, None] + np.cumsum(rows, axis=1) - 1
+    q_index = con_start[:-1, None] + np.cumsum(cols, axis=1) - 1
+
+    # -A.T @ p + v <= 0 for every live column
+    g, i, j = np.nonzero(rows[:, :, None] & cols[:, None, :])
+    gc, jc = np.nonzero(cols)
+    A_ub = sp.csr_matrix(
+        (np.concatenate((-A[g, i, j], np.ones(len(gc)))),
+         (np.concatenate((q_index[g, j], q_index[gc, jc])),
+          np.concatenate((p_index[g, i], v_index[gc])))),
+        shape=(con_start[-1], var_start[-1]))
+    gr, ir = np.nonzero(rows)
+    A_eq = sp.csr_matrix((np.ones(len(gr)), (gr, p_index[gr, ir])),
+                         shape=(k, var_start[-1]))
+    c = np.zeros(var_start[-1])
+    c[v_index] = -1.0
+    bounds = np.zeros((var_start[-1], 2))
+    bounds[:, 1] = np.inf
+    bounds[v_index, 0] = -np.inf
+
+    from scipy.optimize import linprog
+
+    result = linprog(c, A_ub=A_ub, b_ub=np.zeros(con_start[-1]), A_eq=A_eq,
+                     b_eq=np.ones(k), bounds=bounds, method='highs')
+    p, q = np.zeros((k, m)), np.zeros((k, n))
+    if result.status != 0:
+        return np.full(k, np.nan), p, q, result.status
+    p[gr, ir] = result.x[p_index[gr, ir]]
+    q[gc, jc] = np.maximum(-result.ineqlin.marginals[q_index[gc, jc]], 0.0)
+    return result.x[v_index], p, q, 0
+
+
+def solve_games(payoffs, method='lp', chunk=1000, maxiter=10000, tol=1e-6):
+    """Value and optimal mixed strategies of every game in a stack.
+
+    Returns an OptimizeResult with ``value`` (k,), ``row_strategy`` (k, m),
+    ``col_strategy`` (k, n), ``status`` (k,) and ``saddle`` (k,) marking the
+    games answered by a pure saddle point. The approximate methods add
+    ``gap`` (k,), an upper bound on how far ``value`` is from the true one.
+    """
+    A = np.asarray(payoffs, dtype=float)
+    if A.ndim == 2:
+        A = A[None]
+    k, m, n = A.shape
+    if method in ('mwu', 'fictitious'):
+        return approximate(A, method, maxiter, tol)
+    if method != 'lp':
+        raise ValueError(f"unknown method {method!r}")
+
+    value = np.zeros(k)
+    p, q = np.zeros((k, m)), np.zeros((k, n))
+    status = np.zeros(k, dtype=int)
+    saddle, lower, row, col = saddle_points(A)
+    games = np.flatnonzero(saddle)
+    value[games] = lower[games]
+    p[games, row[games]] = 1.0
+    q[games, col[games]] = 1.0
+
+    rest = np.flatnonzero(~saddle)
+    for lo in range(0, len(rest), chunk):
+        games = rest[lo:lo + chunk]
+        rows, cols = undominated(A[games])
+        value[games], p[games], q[games], status[games] = solve_lp(A[games], rows, cols)
+    return OptimizeResult(value=value, row_strategy=p, col_strategy=q, status=status,
+                          success=np.all(status == 0), saddle=saddle)
+
+
+def approximate(A, method, maxiter, tol):
+    """Averaged strategies of fictitious play or multiplicative weights."""
+    if maxiter < 1:
+        raise ValueError(f"maxiter must be at least 1, got {maxiter}")
+    k, m, n = A.shape
+    games = np.arange(k)
+    p_sum, q_sum = np.zeros((k, m)), np.zeros((k, n))
+    if method == 'mwu':
+        # Hedge on payoffs rescaled to [0, 1]
+        scale = np.maximum(np.ptp(A.reshape(k, -1), axis=1), 1e-12)[:, None]
+        eta = np.sqrt(8 * np.log(max(m, n, 2)) / maxiter)
+        row_gain, col_loss = np.zeros((k, m)), np.zeros((k, n))
+    else:
+        # Running payoffs of every pure strategy against the other's counts
+        row_gain, col_loss = A[:, :, 0].copy(), A[:, 0, :].copy()
+        p_sum[:, 0], q_sum[:, 0] = 1.0, 1.0
+
+    nit = 0
+    gap = np.full(k, np.inf)
+    check = max(1, maxiter // 100)
+    while nit < maxiter:
+        nit += 1
+        if method == 'mwu':
+            p = np.exp(eta * (row_gain - row_gain.max(axis=1, keepdims=True)) / scale)
+            q = np.exp(-eta * (col_loss - col_loss.min(axis=1, keepdims=True)) / scale)
+            p /= p.sum(axis=1, keepdims=True)
+            q /= q.sum(axis=1, keepdims=True)
+            p_sum += p
+            q_sum += q
+            row_gain += np.einsum('kmn,kn->km', A, q)
+            col_loss += np.einsum('kmn,km->kn', A, p)
+        else:
+            i = row_gain.argmax(axis=1)
+            j = col_loss.argmin(axis=1)
+            p_sum[games, i] += 1.0
+            q_sum[games, j] += 1.0
+            row_gain += A[games, :, j]
+            col_loss += A[games, i, :]
+        if nit % check == 0 or nit == maxiter:
+            lower = np.einsum('kmn,km->kn', A, p_sum).min(axis=1) / p_sum.sum(axis=1)
+            upper = np.einsum('kmn,kn->km', A, q_sum).max(axis=1) / q_sum.sum(axis=1)
+            gap = upper - lower
+            if np.all(gap <= tol):
+                break
+
+    p = p_sum / p_sum.sum(axis=1, keepdims=True)
+    q = q_sum / q_sum.sum(axis=1, keepdims=True)
+    converged = gap <= tol
+    return OptimizeResult(value=(upper + lower) / 2, row_strategy=p, col_strategy=q,
+                          status=np.where(converged, 0, 1), success=np.all(converged),
+                          saddle=np.zeros(k, dtype=bool), gap=gap, nit=nit)
+
+
+def solve_game(payoff, **options):
+    """``solve_games`` for a single (m, n) game, with per-game fields unwrapped."""
+    result = solve_games(np.asarray(payoff)[None], **options)
+    for key in ('value', 'row_strategy', 'col_strategy', 'status', 'saddle', 'gap'):
+        if key in result:
+            result[key] = result[key][0]
+    return result
@@ -0,0 +1,177 @@
+"""Graphical method for two-variable LPs, vectorized over models.
+
+The feasible region of  A @ x <= b  in the plane is a convex polygon and
+its vertices are intersections of two of its boundary lines. All pairs of
+lines are intersected at once by Cramer's rule, the points outside any
+half-plane are dropped, and c @ x is evaluated over the rest in one array
+operation. The region is unbounded for the objective if some direction r
+with A @ r <= 0 improves it; in the plane such a direction, if one exists,
+can be taken along one of the lines, so the 2n directions parallel to the
+rows are the only candidates.
+
+Everything works on stacks of models with the same number of constraints
+(``A`` of shape (k, n, 2)), so thousands of models are solved with a few
+array operations. The region must not contain a whole line, which holds
+as soon as x >= 0 is among the constraints; otherwise it may have no
+vertex and is reported infeasible.
+
+Drawing is separate: ``plot_region`` imports matplotlib only when called.
+"""
+
+import numpy as np
+
+from solvers.result import OptimizeResult
+
+MESSAGES = {
+    0: "Optimal vertex found.",
+    2: "The feasible region is empty.",
+    3: "The objective is unbounded over the feasible region.",
+}
+
+
+def normalize(A, b):
+    """Rows scaled to unit length, so tolerances are distances."""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    norms = np.linalg.norm(A, axis=-1)
+    norms[norms == 0] = 1.0
+    return A / norms[..., None], b / norms
+
+
+def intersections(A, b):
+    """Intersection points of every pair of lines A[i] @ x = b[i].
+
+    ``A`` has shape (..., n, 2) and ``b`` (..., n). Returns the points,
+    shape (..., n * (n - 1) / 2, 2), and a mask of the pairs that do
+    intersect (the lines are not parallel).
+    """
+    i, j = np.triu_indices(A.shape[-2], 1)
+    a1, a2, b1, b2 = A[..., i, :], A[..., j, :], b[..., i], b[..., j]
+    det = a1[..., 0] * a2[..., 1] - a1[..., 1] * a2[..., 0]
+    valid = np.abs(det) > 1e-12
+    det = np.where(valid, det, 1.0)
+    x = (b1 * a2[..., 1] - b2 * a1[..., 1]) / det
+    y = (a1[..., 0] * b2 - a2[..., 0] * b1) / det
+    return np.stack((x, y), axis=-1), valid
+
+
+def feasible_vertices(A, b, tol=1e-9):
+    """Intersection points and the mask of those inside every half-plane."""
+    A, b = normalize(A, b)
+    points, valid = intersections(A, b)
+    slack = b[..., None, :] - points @ np.swapaxes(A, -1, -2)
+    return points, valid & np.all(slack >= -tol, axis=-1)
+
+
+def improving_ray(c, A, tol=1e-9):
+    """Whether some direction r with A @ r <= 0 has c @ r < 0."""
+    A, _ = normalize(A, np.zeros(A.shape[:-1]))
+    along = np.stack((-A[..., 1], A[..., 0]), axis=-1)
+    rays = np.concatenate((along, -along), axis=-2)
+    recession = np.all(rays @ np.swapaxes(A, -1, -2) <= tol, axis=-1)
+    improving = np.einsum('...rk,...k->...r', rays, c) < -tol
+    return np.any(recession & improving, axis=-1)
+
+
+def solve_graphical_batch(c, A, b, maximize=False, tol=1e-9):
+    """Optimize c[k] @ x over A[k] @ x <= b[k] for a stack of models.
+
+    ``c`` has shape (k, 2) (or (2,), shared), ``A`` (k, n, 2) and ``b``
+    (k, n). Returns an OptimizeResult with arrays ``x`` (k, 2), ``fun``
+    and ``status`` (0 optimal, 2 infeasible, 3 unbounded; x and fun are nan
+    unless optimal) and ``success``.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.broadcast_to(np.asarray(c, dtype=float), A.shape[:-2] + (2,))
+    cost = -c if maximize else c
+
+    points, feasible = feasible_vertices(A, b, tol)
+    values = np.where(feasible, np.einsum('...pk,...k->...p', points, cost), np.inf)
+    best = np.argmin(values, axis=-1)
+    x = np.take_along_axis(points, best[..., None, None], axis=-2)[..., 0, :]
+    fun = np.take_along_axis(values, best[..., None], axis=-1)[..., 0]
+
+    status = np.zeros(fun.shape, dtype=int)
+    status[improving_ray(cost, A, tol)] = 3
+    status[~feasible.any(axis=-1)] = 2
+    x[status != 0] = np.nan
+    fun = np.where(status == 0, -fun if maximize else fun, np.nan)
+    return OptimizeResult(x=x, fun=fun, status=status, success=status == 0)
+
+
+def polygon(A, b, tol=1e-9):
+    """Vertices of the feasible region of one model, counterclockwise."""
+    points, feasible = feasible_vertices(A, b, tol)
+    points = points[feasible]
+    if len(points) == 0:
+        return points
+    # Lines through a common point give the same vertex more than once
+    _, first = np.unique(np.round(points, 6), axis=0, return_index=True)
+    points = points[np.sort(first)]
+    centre = points.mean(axis=0)
+    angles = np.arctan2(points[:, 1] - centre[1], points[:, 0] - centre[0])
+    return points[np.argsort(angles)] + 0.0  # no -0.0 entries
+
+
+def solve_graphical(c, A, b, maximize=False, tol=1e-9):
+    """Graphical method for one model: optimize c @ x over A @ x <= b.
+
+    Returns an OptimizeResult with ``x``, ``fun``, ``status``, ``message``,
+    ``success`` and the ``vertices`` of the feasible region
+    (counterclockwise).
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    result = solve_graphical_batch(c, A[None], b[None], maximize, tol)
+    status = int(result.status[0])
+    return OptimizeResult(x=result.x[0], fun=float(result.fun[0]), status=status,
+                          message=MESSAGES[status], success=status == 0,
+                          vertices=polygon(A, b, tol))
+
+
+def plot_region(A, b, vertices=None, optimum=None, labels=None, colors=None,
+                xlim=(-1, 5), ylim=(-1, 5), title=None, ax=None):
+    """Draw the constraint lines, the feasible polygon and the optimum.
+
+    Returns the matplotlib axes; nothing is shown, so callers decide
+    whether to ``plt.show()`` or save the figure.
+    """
+    # matplotlib is only loaded when a plot is actually drawn
+    import matplotlib.pyplot as plt
+
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if ax is None:
+        ax = plt.figure(figsize=(10, 8)).gca()
+    if vertices is None:
+        vertices = polygon(A, b)
+    t = np.linspace(min(xlim[0], ylim[0]) - 2, max(xlim[1], ylim[1]), 400)
+    for i, (a, rhs) in enumerate(zip(A, b)):
+        label = labels[i] if labels is not None else None
+        color = colors[i] if colors is not None else None
+        if abs(a[1]) > 1e-12:
+            ax.plot(t, (rhs - a[0] * t) / a[1], label=label, color=color)
+        else:
+            ax.plot(np.full_like(t, rhs / a[0]), t, label=label, color=color)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+
+    # Shade the feasible region
+    if len(vertices):
+        ax.fill(vertices[:, 0], vertices[:, 1], color='lightgreen', alpha=0.3,
+                label='Feasible Region')
+
+    # Highlight the optimal solution
+    if optimum is not None:
+        x, y = (float(f"{v:g}") for v in optimum)
+        ax.plot(x, y, 'ro', markersize=8, label=f'Optimal Point ({x:g}, {y:g})')
+        ax.annotate(f'({x:g}, {y:g})', xy=(x, y), xytext=(x + 0.1, y + 0.1), color='red')
+
+    ax.set_xlabel(r'$x_1$', fontsize=12)
+    ax.set_ylabel(r'$x_2$', fontsize=12)
+    if title is not None:
+        ax.set_title(title, fontsize=14)
+    ax.legend(loc='upper right')
+    ax.grid(True, linestyle='--')
+    return ax
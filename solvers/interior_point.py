@@ -0,0 +1,276 @@
+"""Mehrotra predictor-corrector interior-point method for linprog-style LPs.
+
+    min  c @ x   subject to   A_ub @ x <= b_ub,  A_eq @ x == b_eq,  lb <= x <= ub
+
+The problem is brought to the standard form  A @ x = b, 0 <= x <= u  (a
+slack column per inequality, lower bounds shifted to zero, fixed variables
+substituted out) and solved by a primal-dual path-following method. Every
+iteration reduces the Newton system to the normal equations
+
+    A @ diag(theta) @ A.T @ dy = r,   theta = 1 / (z / x + v / w)
+
+whose Cholesky factorization is shared by the predictor (affine) and the
+corrector step; the m x m buffer it is built in is allocated once. With
+m rows and n columns an iteration costs O(m^2 n), so a catalog of 10 000
+foods under a few dozen nutrient rows is cheap, and the iteration count
+barely grows with the size.
+
+The interior solution is not a vertex. With ``crossover=True`` the columns
+farthest from their bounds are taken as a basis (completed to full rank by
+a pivoted QR), the others are set to their nearer bound and the bounded
+revised simplex finishes from there, so ``x`` is a basic solution again and
+binding-constraint reports behave as with the simplex paths. If that basis
+is not primal feasible the simplex starts cold instead.
+"""
+
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, qr
+
+from solvers.bounds import as_bounds
+from solvers.result import OptimizeResult
+from solvers.revised_simplex import revised_simplex, two_phase
+
+MESSAGES = {
+    0: "Optimization terminated successfully.",
+    1: "Iteration limit reached.",
+    2: "The problem is infeasible.",
+    3: "The problem is unbounded.",
+}
+
+
+def standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds):
+    """Dense  A @ x = b,  0 <= x <= u  data and what is needed to map back.
+
+    Returns c, A, b, u, the lower bounds, the free (not fixed) original
+    columns and the number of inequality rows; columns past the free ones
+    are the slacks of A_ub.
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    lower, upper = as_bounds(bounds, n)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("lower bounds must be finite")
+    blocks, rhs = [], []
+    for A, b in ((A_ub, b_ub), (A_eq, b_eq)):
+        if A is not None:
+            blocks.append(A.toarray() if sp.issparse(A) else np.asarray(A, dtype=float))
+            rhs.append(np.asarray(b, dtype=float))
+    A = np.vstack(blocks) if blocks else np.zeros((0, n))
+    b = np.concatenate(rhs) if rhs else np.zeros(0)
+    m_ub = len(rhs[0]) if A_ub is not None else 0
+
+    b = b - A @ lower
+    width = upper - lower
+    free = np.flatnonzero(width > 0)
+    if np.any(width < 0):
+        raise ValueError("lower bound above upper bound")
+    slacks = np.zeros((A.shape[0], m_ub))
+    slacks[np.arange(m_ub), np.arange(m_ub)] = 1.0
+    A_std = np.hstack((A[:, free], slacks))
+    c_std = np.concatenate((c[free], np.zeros(m_ub)))
+    u_std = np.concatenate((width[free], np.full(m_ub, np.inf)))
+    return c_std, A_std, b, u_std, lower, free, m_ub
+
+
+def starting_point(c, A, b, u, bounded):
+    """Mehrotra's heuristic start, kept strictly inside 0 < x < u."""
+    m, n = A.shape
+    AAT = A @ A.T + 1e-8 * np.eye(m)
+    factor = cho_factor(AAT)
+    x = A.T @ cho_solve(factor, b)
+    y = cho_solve(factor, A @ c)
+    z = c - A.T @ y
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    z += max(-1.5 * z.min(initial=0.0), 0.0)
+    xz = x @ z
+    x += 0.5 * xz / max(z.sum(), 1e-12) + 1e-2
+    z += 0.5 * xz / max(x.sum(), 1e-12) + 1e-2
+    x[bounded] = np.minimum(x[bounded], 0.5 * u[bounded])
+    w = np.where(bounded, u - x, 1.0)
+    v = np.where(bounded, np.maximum(z, 1.0), 0.0)
+    return x, y, z, w, v
+
+
+def max_step(value, step):
+    """Largest alpha <= 1 keeping value + alpha * step >= 0."""
+    shrinking = step < 0
+    if not shrinking.any():
+        return 1.0
+    with np.errstate(over='ignore'):
+        return min(1.0, np.min(-value[shrinking] / step[shrinking]))
+
+
+def mehrotra(c, A, b, u, tol=1e-8, maxiter=100):
+    """Solve min c @ x, A @ x = b, 0 <= x <= u; returns the iterates and status.
+
+    Converged means relative primal and dual residuals and duality gap all
+    below ``tol``. Once the normal equations get too ill-conditioned for
+    that, the iterates stop improving; after 10 such iterations the best
+    one is returned, as optimal if it is within ``tol ** 0.75``.
+    """
+    m, n = A.shape
+    bounded = np.isfinite(u)
+    ub = np.where(bounded, u, 0.0)
+    x, y, z, w, v = starting_point(c, A, b, u, bounded)
+    normal = np.empty((m, m))
+    scale_b, scale_c = 1 + np.linalg.norm(b), 1 + np.linalg.norm(c)
+    N = n + bounded.sum()
+    status, nit = 1, 0
+    best, best_error, best_nit = None, np.inf, 0
+
+    def solve(factor, theta, rb, ru, rc, rxz, rwv):
+        r_hat = rc - rxz / x + np.where(bounded, (rwv - v * ru) / w, 0.0)
+        dy = cho_solve(factor, rb + A @ (theta * r_hat))
+        dx = theta * (A.T @ dy - r_hat)
+        dz = (rxz - z * dx) / x
+        dw = np.where(bounded, ru - dx, 0.0)
+        dv = np.where(bounded, (rwv - v * dw) / w, 0.0)
+        return dx, dy, dz, dw, dv
+
+    while nit < maxiter:
+        rb = b - A @ x
+        ru = np.where(bounded, ub - x - w, 0.0)
+        rc = c - A.T @ y - z + v
+        mu = (x @ z + w[bounded] @ v[bounded]) / N
+        primal = c @ x
+        dual = b @ y - ub @ v
+        error = max((np.linalg.norm(rb) + np.linalg.norm(ru)) / scale_b,
+                    np.linalg.norm(rc) / scale_c, abs(primal - dual) / (1 + abs(primal)))
+        if error < tol:
+            status = 0
+            break
+        if error < best_error:
+            best = x.copy(), y.copy(), z.copy(), v.copy()
+            best_error, best_nit = error, nit
+        elif nit - best_nit >= 10:
+            break
+        if np.abs(x).max() > 1e12:
+            status = 3
+            break
+        if np.abs(y).max() > 1e12:
+            status = 2
+            break
+
+        # Normal equations, factorized once for both steps
+        theta = 1.0 / (z / x + np.where(bounded, v / w, 0.0))
+        np.matmul(A * theta, A.T, out=normal)
+        normal.flat[::m + 1] += 1e-12 * max(1.0, normal.diagonal().max(initial=1.0))
+        try:
+            factor = cho_factor(normal, overwrite_a=True, check_finite=False)
+        except LinAlgError:
+            status = 2
+            break
+
+        # Predictor: pure Newton step towards mu = 0
+        dx, dy, dz, dw, dv = solve(factor, theta, rb, ru, rc, -x * z, np.where(bounded, -w * v, 0.0))
+        alpha_p = min(max_step(x, dx), max_step(w[bounded], dw[bounded]))
+        alpha_d = min(max_step(z, dz), max_step(v[bounded], dv[bounded]))
+        mu_aff = ((x + alpha_p * dx) @ (z + alpha_d * dz)
+                  + (w + alpha_p * dw)[bounded] @ (v + alpha_d * dv)[bounded]) / N
+        sigma = (mu_aff / mu) ** 3
+
+        # Corrector: centring plus the second-order term of the predictor
+        rxz = sigma * mu - x * z - dx * dz
+        rwv = np.where(bounded, sigma * mu - w * v - dw * dv, 0.0)
+        dx, dy, dz, dw, dv = solve(factor, theta, rb, ru, rc, rxz, rwv)
+        eta = min(0.9995, max(0.9, 1.0 - mu))
+        alpha_p = eta * min(max_step(x, dx), max_step(w[bounded], dw[bounded]))
+        alpha_d = eta * min(max_step(z, dz), max_step(v[bounded], dv[bounded]))
+        x += alpha_p * dx
+        w += alpha_p * dw
+        y += alpha_d * dy
+        z += alpha_d * dz
+        v += alpha_d * dv
+        nit += 1
+
+    if status == 1 and best is not None:
+        x, y, z, v = best
+        if best_error < tol ** 0.75:
+            status = 0
+    return x, y, z, v, status, nit
+
+
+def crash_basis(A, x, u, tol=1e-9):
+    """Basis of columns farthest from their bounds, completed by pivoted QR.
+
+    Returns the basis and the mask of nonbasic columns nearer their upper
+    bound.
+    """
+    m = A.shape[0]
+    distance = np.minimum(x, u - x)
+    order = np.argsort(-distance)
+    interior = order[:m][distance[order[:m]] > tol * (1 + np.abs(x[order[:m]]))]
+    basis = []
+    if interior.size:
+        Q, R, piv = qr(A[:, interior], mode='economic', pivoting=True)
+        diag = np.abs(np.diag(R))
+        rank = int(np.sum(diag > 1e-9 * max(diag.max(initial=0.0), 1.0)))
+        basis = list(interior[piv[:rank]])
+        Q = Q[:, :rank]
+    else:
+        Q = np.zeros((m, 0))
+    if len(basis) < m:
+        rest = np.setdiff1d(np.arange(A.shape[1]), basis)
+        projected = A[:, rest] - Q @ (Q.T @ A[:, rest])
+        _, _, piv = qr(projected, mode='economic', pivoting=True)
+        basis += list(rest[piv[:m - len(basis)]])
+    at_upper = np.isfinite(u) & (x > 0.5 * u)
+    at_upper[basis] = False
+    return basis, at_upper
+
+
+def interior_point(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                   tol=1e-8, maxiter=100, crossover=False):
+    """Minimize c @ x over linprog-style constraints by Mehrotra's method.
+
+    Returns an OptimizeResult with ``x``, ``fun``, ``status`` (0 optimal,
+    1 iteration limit, 2 infeasible, 3 unbounded), ``message``,
+    ``success``, ``nit``, ``slack`` of the inequality rows, duals ``y``
+    (per row, A_ub first, in the sign convention of the simplex
+    multipliers) and ``time``.
+
+    The interior-point method cannot prove infeasibility or unboundedness;
+    when its iterates diverge or stop short of optimal, the two-phase
+    simplex settles the status (``fallback`` is then True). With
+    ``crossover`` the result also carries ``basis`` (standard-form
+    columns), ``nit_crossover``, ``crossover`` ('basis', or 'cold' when the
+    simplex had to start from scratch) and ``time_crossover``.
+    """
+    start = time.perf_counter()
+    c = np.asarray(c, dtype=float)
+    c_std, A, b, u, lower, free, m_ub = standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds)
+    x_std, y, z, v, status, nit = mehrotra(c_std, A, b, u, tol, maxiter)
+    result = OptimizeResult(nit=nit, fallback=status != 0, time=time.perf_counter() - start)
+    simplex_bounds = np.column_stack((np.zeros(len(u)), u))
+
+    if status != 0:
+        vertex = two_phase(c_std, A, b, bounds=simplex_bounds)
+        x_std, y, status = vertex.x, vertex.y, vertex.status
+        result.time = time.perf_counter() - start
+    elif crossover:
+        start = time.perf_counter()
+        basis, at_upper = crash_basis(A, x_std, u)
+        try:
+            vertex = revised_simplex(c_std, A, b, basis, bounds=simplex_bounds, at_upper=at_upper)
+            result.crossover = 'basis'
+        except ValueError:
+            vertex = two_phase(c_std, A, b, bounds=simplex_bounds)
+            result.crossover = 'cold'
+        x_std, y, status = vertex.x, vertex.y, vertex.status
+        result.basis = vertex.basis
+        result.nit_crossover = vertex.nit
+        result.time_crossover = time.perf_counter() - start
+
+    x = lower.copy()
+    x[free] += x_std[:len(free)]
+    result.x = x
+    result.fun = float(c @ x)
+    result.slack = x_std[len(free):len(free) + m_ub]
+    result.y = y
+    result.status = status
+    result.message = MESSAGES[status]
+    result.success = status == 0
+    return result
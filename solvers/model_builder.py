@@ -0,0 +1,121 @@
+"""Array-based construction of the A4Q6.py transportation LP.
+
+A4Q6.py creates one ``LpVariable`` per route and one ``lpSum`` expression
+per constraint. Here the model is emitted directly from the cost, supply
+and demand arrays:
+
+    x[i * n + j]   shipment from source i to sink j
+    c = costs.ravel()
+    A_eq = [row sums; column sums],  b_eq = [supply; demand]
+
+``A_eq`` is built straight in CSC form (every column has exactly two ones,
+in rows i and m + j), so the model costs two index arrays and no Python
+object per variable. ``write_mps`` streams the same model to a free-format
+MPS file block by block for external solvers such as CBC or HiGHS, and
+``to_pulp`` reads that file back as a PuLP problem for A4Q6.py.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.network_simplex import as_arrays
+
+
+class TransportationLP:
+    """Transportation LP in matrix form with source/sink labels."""
+
+    def __init__(self, supply, demand, costs, sources=None, sinks=None):
+        labels_f, labels_w, self.supply, self.demand, self.costs = as_arrays(
+            supply, demand, costs)
+        m, n = self.costs.shape
+        if not isinstance(supply, dict):
+            labels_f = [f'F{i + 1}' for i in range(m)]
+        if not isinstance(demand, dict):
+            labels_w = [f'W{j + 1}' for j in range(n)]
+        self.sources = list(sources) if sources is not None else labels_f
+        self.sinks = list(sinks) if sinks is not None else labels_w
+
+    @property
+    def shape(self):
+        return self.costs.shape
+
+    def to_arrays(self):
+        """``c``, ``A_eq`` (CSC) and ``b_eq`` for ``linprog`` and friends."""
+        m, n = self.shape
+        index = np.int32 if 2 * m * n < 2**31 else np.int64
+        rows = np.empty((m * n, 2), dtype=index)
+        rows[:, 0] = np.repeat(np.arange(m, dtype=index), n)
+        rows[:, 1] = m + np.tile(np.arange(n, dtype=index), m)
+        indptr = np.arange(0, 2 * m * n + 1, 2, dtype=index)
+        A_eq = sp.csc_matrix((np.ones(2 * m * n), rows.ravel(), indptr),
+                             shape=(m + n, m * n))
+        return self.costs.ravel(), A_eq, np.concatenate((self.supply, self.demand))
+
+    def solve(self, method='highs'):
+        """Solve with ``linprog`` and map the flows back to the labels."""
+        from scipy.optimize import linprog
+
+        c, A_eq, b_eq = self.to_arrays()
+        result = linprog(c, A_eq=A_eq, b_eq=b_eq, bounds=(0, None), method=method)
+        if result.x is not None:
+            result.plan = self.plan(result.x)
+        return result
+
+    def plan(self, x):
+        """{(source, sink): qty} for the nonzero entries of a flat solution."""
+        m, n = self.shape
+        nonzero = np.flatnonzero(np.asarray(x) > 0)
+        rows, cols = np.divmod(nonzero, n)
+        return {(self.sources[i], self.sinks[j]): q for i, j, q in
+                zip(rows.tolist(), cols.tolist(), np.asarray(x)[nonzero].tolist())}
+
+    def write_mps(self, path, name='Transportation_Problem', block=256):
+        """Stream the model to a free-format MPS file, ``block`` sources at a time.
+
+        Column names follow PuLP's ``Route_<source>_<sink>``; rows are
+        ``Supply_<source>`` and ``Demand_<sink>`` as in A4Q6.py.
+        """
+        m, n = self.shape
+        supply_rows = [f'Supply_{f}' for f in self.sources]
+        demand_rows = [f'Demand_{w}' for w in self.sinks]
+        with open(path, 'w') as out:
+            out.write(f'NAME {name}\nROWS\n N COST\n')
+            out.writelines(f' E {row}\n' for row in supply_rows + demand_rows)
+            out.write('COLUMNS\n')
+            for lo in range(0, m, block):
+                lines = []
+                for i in range(lo, min(lo + block, m)):
+                    f = self.sources[i]
+                    for w, cost, demand_row in zip(self.sinks, self.costs[i].tolist(),
+                                                   demand_rows):
+                        column = f'Route_{f}_{w}'
+                        lines.append(f' {column} COST {cost:.17g} {supply_rows[i]} 1\n'
+                                     f' {column} {demand_row} 1\n')
+                out.writelines(lines)
+            out.write('RHS\n')
+            values = np.concatenate((self.supply, self.demand)).tolist()
+            out.writelines(f' RHS {row} {value:.17g}\n'
+                           for row, value in zip(supply_rows + demand_rows, values))
+            out.write('ENDATA\n')
+        return path
+
+    def to_pulp(self):
+        """``(routes, prob)``: the model as a PuLP problem read from ``write_mps``.
+
+        ``routes`` holds the PuLP variables in the order of ``x``, so
+        ``self.plan([v.varValue for v in routes])`` maps a solve back.
+        """
+        import os
+        import tempfile
+
+        import pulp
+
+        with tempfile.TemporaryDirectory() as tmp:
+            variables, prob = pulp.LpProblem.fromMPS(self.write_mps(os.path.join(tmp, 'model.mps')))
+        routes = [variables[f'Route_{f}_{w}'] for f in self.sources for w in self.sinks]
+        return routes, prob
+
+
+def transportation_lp(supply, demand, costs):
+    """Shortcut for ``TransportationLP(supply, demand, costs).to_arrays()``."""
+    return TransportationLP(supply, demand, costs).to_arrays()
@@ -0,0 +1,88 @@
+"""Min-cost transportation backend for the A4Q6.py model.
+
+``solve_transportation`` takes the same ``supply``/``demand``/``costs``
+dicts A4Q6.py builds its PuLP model from (or plain arrays), maps the labels
+to integer indices once and solves on dense arrays: Vogel's approximation
+for the starting tree, then the network simplex in
+``solvers.transportation.modi`` with block pricing. No per-route Python
+objects are created, and because every pivot moves a difference of basic
+quantities, integer supplies and demands give integer flows.
+
+PuLP/CBC stays available as ``method='pulp'``; the default ``'auto'`` uses
+it when the network path does not apply (unbalanced totals) or stops at
+its iteration limit.
+"""
+
+import numpy as np
+
+from solvers import transportation
+from solvers.result import OptimizeResult
+
+
+def as_arrays(supply, demand, costs):
+    """Labels and float arrays for dict or array input."""
+    if isinstance(supply, dict):
+        sources, s = list(supply), np.array(list(supply.values()), dtype=float)
+    else:
+        s = np.asarray(supply, dtype=float)
+        sources = list(range(len(s)))
+    if isinstance(demand, dict):
+        sinks, d = list(demand), np.array(list(demand.values()), dtype=float)
+    else:
+        d = np.asarray(demand, dtype=float)
+        sinks = list(range(len(d)))
+    if isinstance(costs, dict):
+        c = np.array([[costs[f][w] for w in sinks] for f in sources], dtype=float)
+    else:
+        c = np.asarray(costs, dtype=float)
+    return sources, sinks, s, d, c
+
+
+def solve_transportation(supply, demand, costs, method='auto', block=64):
+    """Minimum-cost shipping plan.
+
+    Returns an OptimizeResult with ``plan`` ({(source, sink): qty} for the
+    nonzero routes), ``cells`` (rows, cols, qty as integer indices), ``fun``
+    (total cost), ``status`` and the ``method`` that produced it.
+    """
+    sources, sinks, s, d, c = as_arrays(supply, demand, costs)
+    integral = np.all(s == np.round(s)) and np.all(d == np.round(d))
+
+    result = None
+    if method in ('auto', 'network') and np.isclose(s.sum(), d.sum()):
+        cells = transportation.vogel(s, d, c)
+        result = transportation.modi(c, cells, block=block)
+        result.method = 'network'
+    elif method == 'network':
+        raise ValueError("total supply must equal total demand")
+    if result is None or (method == 'auto' and result.status != 0):
+        result = solve_pulp(s, d, c)
+
+    rows, cols, qty = result.cells
+    order = np.lexsort((cols, rows))
+    rows, cols, qty = rows[order], cols[order], qty[order]
+    if integral:
+        qty = np.rint(qty).astype(int)
+    result.cells = (rows, cols, qty)
+    result.plan = {(sources[i], sinks[j]): q
+                   for i, j, q in zip(rows.tolist(), cols.tolist(), qty.tolist()) if q}
+    return result
+
+
+def solve_pulp(s, d, c):
+    """The A4Q6.py model (TransportationLP) through PuLP/CBC."""
+    import pulp
+
+    from solvers.model_builder import TransportationLP
+
+    m, n = c.shape
+    routes, prob = TransportationLP(s, d, c).to_pulp()
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+
+    flows = np.array([v.varValue or 0.0 for v in routes]).reshape(m, n)
+    rows, cols = np.nonzero(flows)
+    optimal = pulp.LpStatus[prob.status] == 'Optimal'
+    return OptimizeResult(
+        cells=(rows, cols, flows[rows, cols]), fun=pulp.value(prob.objective),
+        status=0 if optimal else 2, success=optimal, nit=None, method='pulp',
+    )
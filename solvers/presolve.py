@@ -0,0 +1,484 @@
+"""Presolve and postsolve for LPs in ``linprog`` form.
+
+    min c @ x   subject to   A_ub @ x <= b_ub,  A_eq @ x == b_eq,  lb <= x <= ub
+
+``Presolve`` works on all rows as ranges ``rl <= A @ x <= ru`` (inequality
+rows have ``rl = -inf``, equality rows ``rl == ru``) and repeats, until
+nothing changes:
+
+* fixed columns (``lb == ub``) are substituted into the row ranges;
+* empty and free rows are dropped, empty columns are fixed at their best
+  bound (an infinite one is left for the solver, which tells an unbounded
+  problem from an infeasible one);
+* singleton rows become bounds on their variable;
+* zero-cost column singletons (explicit slack or surplus columns, as in
+  A4Q4.py) are folded into their row's range;
+* row activity bounds drop every side a row can never reach (dominated
+  constraints), detect infeasible rows and tighten variable bounds;
+  a tightened bound that crosses the other one stops presolve as
+  infeasible;
+* parallel rows (multiples of one another, like A4Q3.py's phosphorus row
+  and a scaled copy) are merged into the one with the tightest range.
+
+The reduced matrix is then scaled by powers of two close to the
+geometric mean of each row's and column's entries, and handed out in
+``linprog`` form as ``problem``.
+
+Every removal is recorded, and ``postsolve`` replays the records backwards
+to rebuild ``x`` and the row duals of the original problem: a bound that
+came from a row and is active in the reduced solution passes its reduced
+cost back to that row as its dual, so ``c - A.T @ y`` comes out with the
+right signs for the original bounds. Marginals follow ``linprog``: they are
+the derivatives of the optimal value with respect to ``b_ub`` and ``b_eq``.
+
+The solve paths take ``presolve=True`` to go through ``presolved_linprog``:
+``solve_diet`` (A4Q2.py), ``solve_blend`` (A4Q3.py, revised simplex via
+``solve_linprog``), ``solve`` in A4Q4.py (two-phase or Big-M),
+``SolutionCache.solve`` and ``run_scenarios``. It is off by default, so
+the scripts print what they always did.
+"""
+
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.bounds import as_bounds
+from solvers.result import OptimizeResult
+
+MESSAGES = {
+    0: "Presolve reduced the problem.",
+    2: "Presolve found the problem infeasible.",
+    3: "Presolve found the problem unbounded.",
+}
+
+
+class Presolve:
+    """Reduced form of an LP plus what is needed to map solutions back."""
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                 scale=True, tol=1e-9, max_passes=20):
+        start = time.perf_counter()
+        self.c = np.asarray(c, dtype=float)
+        n = len(self.c)
+        blocks, rl, ru = [], [], []
+        if A_ub is not None:
+            blocks.append(sp.csr_matrix(A_ub, dtype=float))
+            rl.append(np.full(blocks[-1].shape[0], -np.inf))
+            ru.append(np.asarray(b_ub, dtype=float))
+        if A_eq is not None:
+            blocks.append(sp.csr_matrix(A_eq, dtype=float))
+            rl.append(np.asarray(b_eq, dtype=float))
+            ru.append(np.asarray(b_eq, dtype=float))
+        self.m_ub = blocks[0].shape[0] if A_ub is not None else 0
+        A = sp.vstack(blocks, format='csr') if blocks else sp.csr_matrix((0, n))
+        A.eliminate_zeros()
+        A.sort_indices()
+        self.A, self.csc = A, A.tocsc()
+        m = A.shape[0]
+        self.row_of = np.repeat(np.arange(m), np.diff(A.indptr))
+
+        self.rl, self.ru = np.concatenate(rl + [[]]), np.concatenate(ru + [[]])
+        self.lb, self.ub = as_bounds(bounds, n)
+        self.tol = tol
+        self.rows = np.ones(m, dtype=bool)
+        self.cols = np.ones(n, dtype=bool)
+        self.row_count = np.diff(A.indptr)
+        self.col_count = np.diff(self.csc.indptr)
+        self.offset = 0.0
+        self.stack = []
+        self.status = 0
+        self.report = {
+            'rows': m, 'cols': n,
+            'rows_removed': dict.fromkeys(('empty', 'free', 'singleton', 'dominated',
+                                           'parallel'), 0),
+            'cols_removed': dict.fromkeys(('fixed', 'empty', 'singleton'), 0),
+            'bounds_tightened': 0, 'sides_dropped': 0, 'passes': 0,
+        }
+
+        steps = (self.fixed_columns, self.empty_rows, self.singleton_rows,
+                 self.empty_columns, self.column_singletons, self.activity,
+                 self.parallel_rows)
+        changed = True
+        while changed and self.status == 0 and self.report['passes'] < max_passes:
+            self.report['passes'] += 1
+            changed = False
+            for step in steps:
+                changed |= step()
+                if self.status != 0:
+                    break
+        if self.status == 0:
+            self.build(scale)
+        self.report['reduced_rows'] = int(self.rows.sum())
+        self.report['reduced_cols'] = int(self.cols.sum())
+        self.report['time'] = time.perf_counter() - start
+
+    # -- helpers ----------------------------------------------------------
+
+    def close(self, a, b):
+        with np.errstate(invalid='ignore'):
+            return np.isfinite(b) & (np.abs(a - b) <= self.tol * (1 + np.abs(b)))
+
+    def row_entries(self, i):
+        """Live columns and coefficients of row i."""
+        lo, hi = self.A.indptr[i], self.A.indptr[i + 1]
+        cols = self.A.indices[lo:hi]
+        live = self.cols[cols]
+        return cols[live], self.A.data[lo:hi][live]
+
+    def drop_rows(self, rows, reason):
+        self.rows[rows] = False
+        sub = self.A[rows]
+        self.col_count -= np.bincount(sub.indices, minlength=len(self.cols))
+        self.report['rows_removed'][reason] += len(rows)
+
+    def drop_cols(self, cols, values, reason):
+        """Remove columns at fixed values, shifting the row ranges."""
+        sub = self.csc[:, cols]
+        shift = sub @ values
+        self.rl -= shift
+        self.ru -= shift
+        self.offset += self.c[cols] @ values
+        self.cols[cols] = False
+        self.row_count -= np.bincount(sub.indices, minlength=len(self.rows))
+        self.stack.append(('fixed', cols, values))
+        self.report['cols_removed'][reason] += len(cols)
+
+    def crossed(self, cols):
+        """Whether any of the columns has lb > ub (the problem is infeasible)."""
+        lb, ub = self.lb[cols], self.ub[cols]
+        return bool(np.any(lb > ub + self.tol * (1 + np.abs(ub))))
+
+    def tighten(self, j, i, a, side, value):
+        """New bounds on columns j, each implied by row i with coefficient a.
+
+        Returns False, with status 2 set, when a bound crosses the other one.
+        """
+        j, i, a = np.atleast_1d(j), np.atleast_1d(i), np.atleast_1d(a)
+        if side == 'upper':
+            self.ub[j] = value
+        else:
+            self.lb[j] = value
+        self.stack.append(('bounds', j, i, a, side))
+        self.report['bounds_tightened'] += len(j)
+        # Caught here, before empty_columns can fix a crossed column at one
+        # of its bounds in the same pass
+        if self.crossed(j):
+            self.status = 2
+            return False
+        return True
+
+    # -- reductions -------------------------------------------------------
+
+    def fixed_columns(self):
+        if self.crossed(self.cols):
+            self.status = 2
+            return False
+        cols = np.flatnonzero(self.cols & self.close(self.lb, self.ub))
+        if cols.size:
+            self.drop_cols(cols, self.lb[cols].copy(), 'fixed')
+        return cols.size > 0
+
+    def empty_rows(self):
+        empty = self.rows & (self.row_count == 0)
+        if np.any(empty & ((self.rl > self.tol) | (self.ru < -self.tol))):
+            self.status = 2
+            return False
+        free = self.rows & ~empty & np.isneginf(self.rl) & np.isposinf(self.ru)
+        empty, free = np.flatnonzero(empty), np.flatnonzero(free)
+        if empty.size:
+            self.drop_rows(empty, 'empty')
+        if free.size:
+            self.drop_rows(free, 'free')
+        return empty.size + free.size > 0
+
+    def singleton_rows(self):
+        singleton = self.rows & (self.row_count == 1)
+        rows = np.flatnonzero(singleton)
+        if rows.size:
+            live = singleton[self.row_of] & self.cols[self.A.indices]
+            i, j, a = self.row_of[live], self.A.indices[live], self.A.data[live]
+            lo, hi = self.rl[i] / a, self.ru[i] / a
+            lo, hi = np.where(a > 0, lo, hi), np.where(a > 0, hi, lo)
+            # Tightest bound per column when several rows bound the same one
+            for side, new, old, better in (('upper', hi, self.ub, np.less),
+                                           ('lower', lo, self.lb, np.greater)):
+                k = np.lexsort((new if side == 'upper' else -new, j))
+                k = k[np.r_[True, j[k][1:] != j[k][:-1]]]
+                k = k[better(new[k], old[j[k]])]
+                if k.size and not self.tighten(j[k], i[k], a[k], side, new[k]):
+                    return False
+            self.drop_rows(rows, 'singleton')
+        return rows.size > 0
+
+    def empty_columns(self):
+        cols = np.flatnonzero(self.cols & (self.col_count == 0))
+        if not cols.size:
+            return False
+        c, lb, ub = self.c[cols], self.lb[cols], self.ub[cols]
+        values = np.where(c > 0, lb, np.where(c < 0, ub,
+                          np.where(np.isfinite(lb), lb, np.where(np.isfinite(ub), ub, 0.0))))
+        # A column that could improve the objective without limit is left to
+        # the solver: the problem is unbounded only if the rest is feasible
+        finite = np.isfinite(values)
+        if not finite.any():
+            return False
+        self.drop_cols(cols[finite], values[finite], 'empty')
+        return True
+
+    def column_singletons(self):
+        cols = np.flatnonzero(self.cols & (self.col_count == 1) & (self.c == 0))
+        for j in cols.tolist():
+            lo, hi = self.csc.indptr[j], self.csc.indptr[j + 1]
+            rows = self.csc.indices[lo:hi]
+            live = self.rows[rows]
+            i, a = rows[live][0], self.csc.data[lo:hi][live][0]
+            s_lo, s_hi = sorted((a * self.lb[j], a * self.ub[j]))
+            others, _ = self.row_entries(i)
+            others = others[others != j]
+            self.stack.append(('singleton', j, i, a, others, self.rl[i], self.ru[i], s_lo, s_hi))
+            self.rl[i] -= s_hi
+            self.ru[i] -= s_lo
+            self.cols[j] = False
+            self.row_count[i] -= 1
+            self.report['cols_removed']['singleton'] += 1
+        return cols.size > 0
+
+    def activity(self):
+        """Row activity ranges from the bounds: dominated sides and new bounds."""
+        A, tol = self.A, self.tol
+        live = self.rows[self.row_of] & self.cols[A.indices]
+        i, j, a = self.row_of[live], A.indices[live], A.data[live]
+        low = np.where(a > 0, a * self.lb[j], a * self.ub[j])
+        high = np.where(a > 0, a * self.ub[j], a * self.lb[j])
+        m = len(self.rows)
+
+        def sums(values):
+            finite = np.isfinite(values)
+            return (np.bincount(i, np.where(finite, values, 0.0), m),
+                    np.bincount(i, ~finite, m).astype(int))
+
+        (L, L_inf), (U, U_inf) = sums(low), sums(high)
+        L_row = np.where(L_inf > 0, -np.inf, L)
+        U_row = np.where(U_inf > 0, np.inf, U)
+        if np.any(self.rows & ((L_row > self.ru + tol * (1 + np.abs(self.ru))) |
+                               (U_row < self.rl - tol * (1 + np.abs(self.rl))))):
+            self.status = 2
+            return False
+
+        # Sides the activity can never pass are dominated by the bounds
+        upper = self.rows & np.isfinite(self.ru) & (U_row <= self.ru + tol * (1 + np.abs(self.ru)))
+        lower = self.rows & np.isfinite(self.rl) & (L_row >= self.rl - tol * (1 + np.abs(self.rl)))
+        self.ru[upper] = np.inf
+        self.rl[lower] = -np.inf
+        dropped = int(upper.sum() + lower.sum())
+        self.report['sides_dropped'] += dropped
+        dominated = np.flatnonzero(upper & (lower | np.isneginf(self.rl)) |
+                                   lower & np.isposinf(self.ru))
+        if dominated.size:
+            self.drop_rows(dominated, 'dominated')
+
+        # Each entry's bound from the rest of its row's activity range
+        rest_low = np.where((L_inf[i] - ~np.isfinite(low)) == 0,
+                            L[i] - np.where(np.isfinite(low), low, 0.0), -np.inf)
+        rest_high = np.where((U_inf[i] - ~np.isfinite(high)) == 0,
+                             U[i] - np.where(np.isfinite(high), high, 0.0), np.inf)
+        with np.errstate(invalid='ignore'):
+            from_ru = (self.ru[i] - rest_low) / a
+            from_rl = (self.rl[i] - rest_high) / a
+        keep = self.rows[i]
+        new_ub = np.where(keep, np.where(a > 0, from_ru, from_rl), np.nan)
+        new_lb = np.where(keep, np.where(a > 0, from_rl, from_ru), np.nan)
+
+        tightened = False
+        for side, new, old, better in (('upper', new_ub, self.ub, np.less),
+                                       ('lower', new_lb, self.lb, np.greater)):
+            # Only finite bounds that improve by a meaningful amount
+            margin = 1e-3 * np.maximum(1.0, np.abs(np.where(np.isfinite(old[j]), old[j], 0.0)))
+            shifted = new + margin if side == 'upper' else new - margin
+            useful = np.isfinite(new) & better(shifted, old[j])
+            if not useful.any():
+                continue
+            k = np.flatnonzero(useful)
+            order = np.lexsort((new[k] if side == 'upper' else -new[k], j[k]))
+            k = k[order]
+            k = k[np.r_[True, j[k][1:] != j[k][:-1]]]
+            if not self.tighten(j[k], i[k], a[k], side, new[k]):
+                return False
+            tightened = True
+        return dropped > 0 or tightened
+
+    def parallel_rows(self):
+        """Merge rows that are multiples of each other."""
+        groups = {}
+        for i in np.flatnonzero(self.rows & (self.row_count >= 2)).tolist():
+            cols, vals = self.row_entries(i)
+            key = cols.tobytes() + np.round(vals / vals[0], 12).tobytes()
+            groups.setdefault(key, []).append((i, vals[0]))
+        merged = []
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            # Ranges of r = row / lam, where r has a leading coefficient of 1
+            lower, upper = -np.inf, np.inf
+            p_lower = p_upper = None
+            for i, lam in members:
+                lo, hi = sorted((self.rl[i] / lam, self.ru[i] / lam))
+                if lo > lower:
+                    lower, p_lower = lo, (i, lam)
+                if hi < upper:
+                    upper, p_upper = hi, (i, lam)
+            if lower > upper + self.tol * (1 + abs(upper)):
+                self.status = 2
+                return False
+            k, lam = members[0]
+            self.rl[k], self.ru[k] = sorted((lam * lower, lam * upper))
+            self.stack.append(('parallel', k, lam, p_lower, p_upper))
+            merged += [i for i, _ in members[1:]]
+        if merged:
+            self.drop_rows(np.array(merged), 'parallel')
+        return len(merged) > 0
+
+    # -- reduced problem --------------------------------------------------
+
+    def build(self, scale):
+        rows, cols = np.flatnonzero(self.rows), np.flatnonzero(self.cols)
+        A = self.A[rows][:, cols].tocsr()
+        r, s = np.ones(len(rows)), np.ones(len(cols))
+        if scale and A.nnz:
+            row_of = np.repeat(np.arange(len(rows)), np.diff(A.indptr))
+            scaled = A.copy()
+            for _ in range(4):
+                scaled.data = A.data * r[row_of] * s[A.indices]
+                r *= self.geometric_scale(scaled, axis=1)
+                scaled.data = A.data * r[row_of] * s[A.indices]
+                s *= self.geometric_scale(scaled, axis=0)
+            A = A.copy()
+            A.data *= r[row_of] * s[A.indices]
+        self.row_scale, self.col_scale = r, s
+        self.live_rows, self.live_cols = rows, cols
+
+        rl, ru = self.rl[rows] * r, self.ru[rows] * r
+        eq = self.close(rl, ru) & np.isfinite(rl)
+        self.eq_rows = np.flatnonzero(eq)
+        self.up_rows = np.flatnonzero(~eq & np.isfinite(ru))
+        self.low_rows = np.flatnonzero(~eq & np.isfinite(rl))
+        lb, ub = self.lb[cols] / s, self.ub[cols] / s
+        self.problem = {
+            'c': self.c[cols] * s,
+            'A_ub': sp.vstack((A[self.up_rows], -A[self.low_rows]), format='csr'),
+            'b_ub': np.concatenate((ru[self.up_rows], -rl[self.low_rows])),
+            'A_eq': A[self.eq_rows],
+            'b_eq': ru[self.eq_rows],
+            'bounds': np.column_stack((lb, ub)),
+        }
+
+    @staticmethod
+    def geometric_scale(A, axis):
+        """Power-of-two factors near 1 / sqrt(max |a| * min |a|) per row or column."""
+        A = abs(A.tocsr() if axis == 1 else A.tocsc())
+        big = np.asarray(A.max(axis=axis).todense()).ravel()
+        A.data = 1.0 / A.data
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Rows or columns without entries get a factor of 1 below
+            small = 1.0 / np.asarray(A.max(axis=axis).todense()).ravel()
+            factor = 1.0 / np.sqrt(big * small)
+        factor[~np.isfinite(factor)] = 1.0
+        return 2.0 ** np.round(np.log2(factor))
+
+    # -- postsolve --------------------------------------------------------
+
+    def postsolve(self, x, ineqlin=None, eqlin=None):
+        """Original ``x``, row marginals and reduced costs from a reduced solution.
+
+        ``ineqlin`` and ``eqlin`` are the marginals of the reduced problem's
+        ``A_ub`` and ``A_eq`` rows (``result.ineqlin.marginals`` etc.).
+        """
+        m, n = self.A.shape
+        x_full, y = np.zeros(n), np.zeros(m)
+        x_full[self.live_cols] = np.asarray(x, dtype=float) * self.col_scale
+        y_live = np.zeros(len(self.live_rows))
+        if eqlin is not None and len(self.eq_rows):
+            y_live[self.eq_rows] += eqlin
+        if ineqlin is not None:
+            split = len(self.up_rows)
+            y_live[self.up_rows] += ineqlin[:split]
+            y_live[self.low_rows] -= ineqlin[split:]
+        y[self.live_rows] = y_live * self.row_scale
+
+        csc = self.csc
+        for record in reversed(self.stack):
+            kind = record[0]
+            if kind == 'fixed':
+                _, cols, values = record
+                x_full[cols] = values
+            elif kind == 'singleton':
+                _, j, i, a, others, rl, ru, s_lo, s_hi = record
+                rest = self.A[i, others].toarray().ravel() @ x_full[others] if len(others) else 0.0
+                lo, hi = max(rl - rest, s_lo), min(ru - rest, s_hi)
+                t = lo if np.isfinite(lo) else (hi if np.isfinite(hi) else 0.0)
+                x_full[j] = t / a
+            elif kind == 'bounds':
+                # An active bound that came from row i hands its dual to i
+                _, cols, rows, coefs, side = record
+                for j, i, a in zip(cols[::-1].tolist(), rows[::-1].tolist(),
+                                   coefs[::-1].tolist()):
+                    lo, hi = csc.indptr[j], csc.indptr[j + 1]
+                    z = self.c[j] - csc.data[lo:hi] @ y[csc.indices[lo:hi]]
+                    if (side == 'upper' and z < 0) or (side == 'lower' and z > 0):
+                        y[i] += z / a
+            elif kind == 'parallel':
+                _, k, lam, p_lower, p_upper = record
+                mu = y[k] * lam
+                y[k] = 0.0
+                target = p_upper if mu < 0 else p_lower
+                if mu != 0 and target is not None:
+                    y[target[0]] += mu / target[1]
+
+        return OptimizeResult(
+            x=x_full, fun=self.c @ x_full,
+            ineqlin=OptimizeResult(marginals=y[:self.m_ub]),
+            eqlin=OptimizeResult(marginals=y[self.m_ub:]),
+            reduced_costs=self.c - self.A.T @ y,
+        )
+
+
+def presolved_linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                      scale=True, method='highs', options=None):
+    """``linprog`` on the presolved problem, postsolved to the original space.
+
+    ``method`` is a ``linprog`` method name or a solver function called as
+    ``method(c, A_ub=..., **options)`` with the reduced problem's non-empty
+    parts (e.g. ``revised_simplex.solve_linprog``); duals are postsolved
+    when its result has ``ineqlin`` / ``eqlin`` marginals. The result
+    carries the presolve ``report``.
+    """
+    pre = Presolve(c, A_ub, b_ub, A_eq, b_eq, bounds, scale=scale)
+    if pre.status != 0:
+        return OptimizeResult(x=None, fun=None, status=pre.status, success=False,
+                              message=MESSAGES[pre.status], nit=0, report=pre.report)
+    problem = dict(pre.problem)
+    for A, b in (('A_ub', 'b_ub'), ('A_eq', 'b_eq')):
+        if not problem[A].shape[0]:
+            del problem[A], problem[b]
+    if len(problem['c']) and ('A_ub' in problem or 'A_eq' in problem):
+        if callable(method):
+            reduced = method(problem.pop('c'), **problem, **(options or {}))
+        else:
+            from scipy.optimize import linprog
+            reduced = linprog(method=method, options=options, **problem)
+        if reduced.status != 0:
+            return OptimizeResult(x=None, fun=None, status=reduced.status, success=False,
+                                  message=reduced.message, nit=reduced.nit, report=pre.report)
+        x, nit = reduced.x, reduced.nit
+        ineq = reduced.ineqlin.marginals if 'A_ub' in problem and 'ineqlin' in reduced else None
+        eq = reduced.eqlin.marginals if 'A_eq' in problem and 'eqlin' in reduced else None
+    elif len(problem['c']):
+        # Columns without rows are left only when their best bound is infinite
+        return OptimizeResult(x=None, fun=None, status=3, success=False,
+                              message=MESSAGES[3], nit=0, report=pre.report)
+    else:
+        x, nit, ineq, eq = np.zeros(0), 0, None, None
+    result = pre.postsolve(x, ineq, eq)
+    result.update(status=0, success=True, message=MESSAGES[0], nit=nit, report=pre.report)
+    return result
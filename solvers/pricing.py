@@ -0,0 +1,231 @@
+"""Pricing rules and ratio tests for the dense tableau simplex.
+
+The tableau is the one A4Q3_table.py and A4Q4_table.py pivot on: constraint
+rows ``[A | b]`` over an objective row ``[d | -z]`` of reduced costs, which
+is minimized (a column may enter while its ``d`` is negative).
+
+Pricing (entering column):
+
+``dantzig``   most negative reduced cost, as the scripts do
+``bland``     lowest-index column with a negative reduced cost; together
+              with the ``bland`` ratio test it cannot cycle
+``devex``     ``d_j**2 / w_j`` with Forrest-Goldfarb reference weights
+``steepest``  exact steepest edge, ``d_j**2 / (1 + ||column j||**2)``;
+              the tableau holds every column, so the norms are one pass
+
+Ratio tests (leaving row) among rows with a positive pivot entry:
+
+``textbook``  minimum ratio, ties to the first row, as the scripts do
+``bland``     minimum ratio, ties to the lowest-index basic variable
+``harris``    two passes: the largest step any row allows once each
+              right-hand side is relaxed by ``tol``, then the largest pivot
+              entry among rows whose ratio fits in that step
+"""
+
+import time
+
+import numpy as np
+
+from solvers.result import OptimizeResult
+
+DESCRIPTIONS = {
+    'dantzig': 'most negative coefficient',
+    'bland': "lowest index, Bland's rule",
+    'devex': 'largest Devex-weighted coefficient',
+    'steepest': 'steepest edge',
+}
+
+
+class Dantzig:
+    def __init__(self, tol=1e-9):
+        self.tol = tol
+
+    def entering(self, tableau, basis):
+        d = tableau[-1, :-1]
+        j = np.argmin(d)
+        return j if d[j] < -self.tol else -1
+
+    def update(self, tableau, basis, entering, leaving):
+        pass
+
+
+class Bland(Dantzig):
+    def entering(self, tableau, basis):
+        candidates = np.flatnonzero(tableau[-1, :-1] < -self.tol)
+        return candidates[0] if candidates.size else -1
+
+
+class SteepestEdge(Dantzig):
+    def entering(self, tableau, basis):
+        d = tableau[-1, :-1]
+        negative = d < -self.tol
+        if not negative.any():
+            return -1
+        norms = 1.0 + np.einsum('ij,ij->j', tableau[:-1, :-1], tableau[:-1, :-1])
+        score = np.where(negative, d * d / norms, -1.0)
+        return np.argmax(score)
+
+
+class Devex(Dantzig):
+    """Reference weights start at 1 and grow with each pivot row.
+
+    The reference framework is reset (all weights back to 1) once a weight
+    exceeds ``reset``, as the weights only approximate the true norms.
+    """
+
+    reset = 1e8
+
+    def __init__(self, tol=1e-9):
+        super().__init__(tol)
+        self.weights = None
+
+    def entering(self, tableau, basis):
+        if self.weights is None:
+            self.weights = np.ones(tableau.shape[1] - 1)
+        d = tableau[-1, :-1]
+        negative = d < -self.tol
+        if not negative.any():
+            return -1
+        score = np.where(negative, d * d / self.weights, -1.0)
+        return np.argmax(score)
+
+    def update(self, tableau, basis, entering, leaving):
+        # Called before the pivot, with the pivot row still unscaled
+        row = tableau[leaving, :-1]
+        w_q = self.weights[entering]
+        ratio = row / row[entering]
+        self.weights = np.maximum(self.weights, ratio * ratio * w_q)
+        self.weights[basis[leaving]] = max(w_q / row[entering] ** 2, 1.0)
+        self.weights[entering] = 1.0
+        if self.weights.max() > self.reset:
+            self.weights[:] = 1.0
+
+
+PRICING = {'dantzig': Dantzig, 'bland': Bland, 'devex': Devex, 'steepest': SteepestEdge}
+
+
+def make_pricing(name, tol=1e-9):
+    try:
+        return PRICING[name](tol)
+    except KeyError:
+        raise ValueError(f"unknown pricing rule {name!r}") from None
+
+
+def ratio_test(tableau, basis, entering, rule='textbook', tol=1e-9):
+    """Leaving row for ``entering``, or -1 if the column is unbounded."""
+    column = tableau[:-1, entering]
+    rhs = np.maximum(tableau[:-1, -1], 0)
+    eligible = column > tol
+    if not eligible.any():
+        return -1
+    ratios = np.full(len(column), np.inf, dtype=tableau.dtype)
+    ratios[eligible] = rhs[eligible] / column[eligible]
+
+    if rule == 'textbook':
+        return np.argmin(ratios)
+    if rule == 'bland':
+        ties = np.flatnonzero(ratios <= ratios.min() + tol)
+        return ties[np.argmin(np.asarray(basis)[ties])]
+    if rule == 'harris':
+        step = np.min((rhs[eligible] + tol) / column[eligible])
+        fits = eligible & (ratios <= step)
+        return np.argmax(np.where(fits, column, -np.inf))
+    raise ValueError(f"unknown ratio test {rule!r}")
+
+
+def pivot(tableau, row, col):
+    tableau[row] /= tableau[row, col]
+    factors = tableau[:, col].copy()
+    factors[row] = 0
+    tableau -= np.outer(factors, tableau[row])
+
+
+def tableau_simplex(tableau, basis, pricing='dantzig', ratio='textbook', maxiter=None,
+                    tol=1e-9, callback=None):
+    """Pivot ``tableau`` (in place) to optimality from a feasible ``basis``.
+
+    Returns an OptimizeResult with ``tableau``, ``basis``, ``nit``, ``time``
+    and ``status`` (0 optimal, 1 iteration limit, 3 unbounded).
+
+    ``callback``, if given, is called with the starting tableau and then
+    after every pivot, with an OptimizeResult holding the current
+    ``tableau`` and ``basis``, ``nit``, the ``objective``
+    (``-tableau[-1, -1]``) and, for the pivot just made, the ``entering``
+    column, the ``leaving`` row and the variable that left it
+    (``left``, -1 at the start), the ``element`` pivoted on and the seconds
+    spent in ``pricing``, the ``ratio`` test and the ``pivot``. The result
+    then also carries these ``times`` summed over the run. Without a
+    callback none of this is measured.
+    """
+    rule = make_pricing(pricing, tol) if isinstance(pricing, str) else pricing
+    basis = list(basis)
+    maxiter = maxiter if maxiter is not None else 50 * tableau.shape[1]
+    if callback is not None:
+        return traced_simplex(tableau, basis, rule, ratio, maxiter, tol, callback)
+    start = time.perf_counter()
+    nit, status = 0, 1
+    while nit < maxiter:
+        entering = rule.entering(tableau, basis)
+        if entering < 0:
+            status = 0
+            break
+        leaving = ratio_test(tableau, basis, entering, ratio, tol)
+        if leaving < 0:
+            status = 3
+            break
+        rule.update(tableau, basis, entering, leaving)
+        pivot(tableau, leaving, entering)
+        basis[leaving] = entering
+        nit += 1
+    return OptimizeResult(tableau=tableau, basis=basis, nit=nit, status=status,
+                          success=status == 0, time=time.perf_counter() - start)
+
+
+def traced_simplex(tableau, basis, rule, ratio, maxiter, tol, callback):
+    """``tableau_simplex`` with each pivot timed and reported to ``callback``."""
+    clock = time.perf_counter
+    start = clock()
+    times = {'pricing': 0.0, 'ratio': 0.0, 'pivot': 0.0}
+    callback(OptimizeResult(tableau=tableau, basis=basis, nit=0, objective=-tableau[-1, -1],
+                            entering=-1, leaving=-1, left=-1, element=np.nan,
+                            pricing=0.0, ratio=0.0, pivot=0.0))
+    nit, status = 0, 1
+    while nit < maxiter:
+        t0 = clock()
+        entering = rule.entering(tableau, basis)
+        t1 = clock()
+        times['pricing'] += t1 - t0
+        if entering < 0:
+            status = 0
+            break
+        leaving = ratio_test(tableau, basis, entering, ratio, tol)
+        t2 = clock()
+        times['ratio'] += t2 - t1
+        if leaving < 0:
+            status = 3
+            break
+        element, left = tableau[leaving, entering], basis[leaving]
+        rule.update(tableau, basis, entering, leaving)
+        pivot(tableau, leaving, entering)
+        basis[leaving] = entering
+        t3 = clock()
+        times['pivot'] += t3 - t2
+        nit += 1
+        callback(OptimizeResult(tableau=tableau, basis=basis, nit=nit,
+                                objective=-tableau[-1, -1], entering=entering, leaving=leaving,
+                                left=left, element=element, pricing=t1 - t0, ratio=t2 - t1,
+                                pivot=t3 - t2))
+    return OptimizeResult(tableau=tableau, basis=basis, nit=nit, status=status,
+                          success=status == 0, time=clock() - start, times=times)
+
+
+def leq_tableau(c, A_ub, b_ub):
+    """Slack tableau and basis for  min c @ x,  A_ub @ x <= b_ub (>= 0),  x >= 0."""
+    A = np.asarray(A_ub, dtype=float)
+    m, n = A.shape
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = A
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = b_ub
+    tableau[m, :n] = c
+    return tableau, list(range(n, n + m))
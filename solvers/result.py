@@ -0,0 +1,28 @@
+"""Result container shared by the solvers.
+
+``OptimizeResult`` behaves like ``scipy.optimize.OptimizeResult`` (a dict
+whose keys are also attributes), but importing it does not import
+``scipy.optimize``, which alone costs several hundred milliseconds.
+"""
+
+
+class OptimizeResult(dict):
+    """Solver output; keys are also readable and writable as attributes."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
+
+    def __dir__(self):
+        return list(self.keys())
+
+    def __repr__(self):
+        if not self:
+            return f"{type(self).__name__}()"
+        width = max(map(len, self.keys())) + 1
+        return "\n".join(f"{key.rjust(width)}: {value!r}" for key, value in self.items())
@@ -0,0 +1,599 @@
+"""Revised simplex method with an LU-factorized basis.
+
+Solves   min c @ x   subject to   A @ x = b,  x >= 0   from a feasible basis.
+Instead of pivoting a full tableau, only the basis matrix B is kept (as an LU
+factorization plus a product-form eta file for the rank-one updates) and every
+iteration solves two systems with it:
+
+    btran:  B.T @ y = c_B       simplex multipliers, used for pricing
+    ftran:  B @ d = A[:, q]     entering column, used for the ratio test
+
+The factorization is recomputed from scratch every ``refactor_every`` updates
+so the eta file stays short and round-off does not build up.
+
+``A`` may be a dense array or any ``scipy.sparse`` matrix. Sparse input is
+kept in CSC form, the basis is factorized with SuperLU and the eta vectors
+store only their nonzeros, so no dense m x n array is ever built.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+from solvers.bounds import as_bounds
+from solvers.result import OptimizeResult
+
+MESSAGES = {
+    0: "Optimization terminated successfully.",
+    1: "Iteration limit reached.",
+    2: "The problem is infeasible.",
+    3: "The problem is unbounded.",
+    4: "The objective reached the cutoff.",
+}
+
+
+def as_matrix(A):
+    """Return A as a float CSC matrix if it is sparse, else as a float array."""
+    if sp.issparse(A):
+        return sp.csc_matrix(A, dtype=float)
+    return np.asarray(A, dtype=float)
+
+
+def column(A, j):
+    """Dense copy of column j of a dense array or CSC matrix."""
+    if sp.issparse(A):
+        start, end = A.indptr[j], A.indptr[j + 1]
+        a = np.zeros(A.shape[0])
+        a[A.indices[start:end]] = A.data[start:end]
+        return a
+    return A[:, j].copy()
+
+
+class BasisFactor:
+    """LU factorization of the basis matrix with product-form updates."""
+
+    def __init__(self, A, basis, refactor_every=64):
+        self.A = A
+        self.sparse = sp.issparse(A)
+        self.basis = list(basis)
+        self.refactor_every = refactor_every
+        self.refactor()
+
+    def refactor(self):
+        B = self.A[:, self.basis]
+        self.lu = splu(sp.csc_matrix(B)) if self.sparse else lu_factor(B)
+        self.etas = []  # (pivot row, pivot, nonzero rows, values) of B^-1 a_q
+
+    def solve(self, rhs, trans=False):
+        if self.sparse:
+            return self.lu.solve(rhs, trans='T' if trans else 'N')
+        return lu_solve(self.lu, rhs, trans=int(trans))
+
+    def ftran(self, a):
+        """Solve B @ x = a."""
+        x = self.solve(np.asarray(a, dtype=float))
+        for r, dr, rows, vals in self.etas:
+            xr = x[r] / dr
+            x[rows] -= xr * vals
+            x[r] = xr
+        return x
+
+    def btran(self, c):
+        """Solve B.T @ y = c."""
+        c = np.array(c, dtype=float)
+        for r, dr, rows, vals in reversed(self.etas):
+            c[r] = (c[r] - (c[rows] @ vals - c[r] * dr)) / dr
+        return self.solve(c, trans=True)
+
+    def update(self, r, q, d):
+        """Replace the basic variable in row r by column q, where d = B^-1 a_q.
+
+        Returns True when the update triggered a fresh factorization.
+        """
+        self.basis[r] = q
+        if len(self.etas) >= self.refactor_every:
+            self.refactor()
+            return True
+        rows = np.flatnonzero(d)
+        self.etas.append((r, d[r], rows, d[rows]))
+        return False
+
+
+def revised_simplex(c, A, b, basis, maxiter=None, tol=1e-9,
+                    refactor_every=64, partial=None, bounds=None, at_upper=None):
+    """Minimize c @ x subject to A @ x = b, lb <= x <= ub.
+
+    ``basis`` lists one column index per row and must be primal feasible
+    (B^-1 b >= 0), e.g. the slack or artificial columns. Entering columns are
+    chosen by Dantzig's rule; with ``partial`` set, only blocks of that many
+    columns are priced until one of them improves the objective. After a run
+    of degenerate pivots the solver falls back to Bland's rule so it cannot
+    cycle.
+
+    ``bounds`` takes any ``linprog`` bounds argument with finite lower
+    bounds (default ``(0, None)``). Upper bounds are handled implicitly: a
+    nonbasic variable sits at its lower or at its upper bound (those in
+    ``at_upper`` start at the upper one), and when the entering variable
+    reaches its other bound before any basic variable hits one of its own it
+    just flips bound, without a pivot. The basis stays m x m however many
+    variables are boxed.
+
+    Returns a scipy ``OptimizeResult`` with ``x``, ``fun``, ``status``,
+    ``message``, ``nit``, the final ``basis``, simplex multipliers ``y``,
+    ``at_upper`` and the number of bound ``flips`` (counted in ``nit``).
+    """
+    c = np.asarray(c, dtype=float)
+    A = as_matrix(A)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    if maxiter is None:
+        maxiter = 50 * (m + n)
+    block = n if partial is None else max(1, min(partial, n))
+
+    # Shift to 0 <= x <= upper; nonbasic variables are then at 0 or upper
+    lower, upper = as_bounds(bounds, n)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("lower bounds must be finite")
+    upper = upper - lower
+    if np.any(upper < 0):
+        raise ValueError("lower bound above upper bound")
+    if lower.any():
+        b = b - A @ lower
+    boxed = np.isfinite(upper).any()
+
+    factor = BasisFactor(A, basis, refactor_every)
+    is_basic = np.zeros(n, dtype=bool)
+    is_basic[factor.basis] = True
+    at_upper = np.zeros(n, dtype=bool) if at_upper is None else np.array(at_upper, dtype=bool)
+    at_upper &= ~is_basic
+    if np.isinf(upper[at_upper]).any():
+        raise ValueError("at_upper variables need a finite upper bound")
+    rhs = b - A @ np.where(at_upper, upper, 0.0) if at_upper.any() else b.copy()
+    x_B = factor.ftran(rhs)
+    if np.any(x_B < -tol) or np.any(x_B > upper[factor.basis] + tol):
+        raise ValueError("starting basis is not primal feasible")
+
+    nblocks = -(-n // block)
+    start = 0          # next pricing block to scan
+    degenerate = 0     # consecutive pivots that did not move
+    nit = 0
+    flips = 0
+    status = 0
+
+    while True:
+        y = factor.btran(c[factor.basis])
+        bland = degenerate > m
+        if bland:
+            start = 0
+
+        # Pricing: scan blocks of columns until one has a reduced cost that
+        # improves the objective, i.e. a negative one at the lower bound or
+        # a positive one at the upper bound (flipped below)
+        q = -1
+        for k in range(nblocks):
+            lo = (start + k) % nblocks * block
+            hi = min(lo + block, n)
+            dj = c[lo:hi] - (A if block == n else A[:, lo:hi]).T @ y
+            dj[is_basic[lo:hi]] = 0.0
+            dj[at_upper[lo:hi]] *= -1.0
+            candidates = np.flatnonzero(dj < -tol)
+            if candidates.size:
+                if bland:
+                    q = lo + candidates[0]
+                else:
+                    q = lo + candidates[np.argmin(dj[candidates])]
+                start = (start + k + 1) % nblocks
+                break
+        if q < 0:
+            break
+
+        if nit >= maxiter:
+            status = 1
+            break
+
+        # Ratio test on the updated entering column. Moving x_q by theta
+        # (down if it is at its upper bound) changes x_B by -theta * g;
+        # basic variables with g > 0 fall to 0, those with g < 0 rise to
+        # their upper bound, and x_q itself stops at its other bound
+        a_q = column(A, q)
+        d = factor.ftran(a_q)
+        g = -d if at_upper[q] else d
+        down = g > tol
+        if boxed:
+            u_B = upper[factor.basis]
+            up = (g < -tol) & np.isfinite(u_B)
+            rows = np.flatnonzero(down | up)
+            room = np.where(down[rows], x_B[rows], u_B[rows] - x_B[rows])
+        else:
+            rows = np.flatnonzero(down)
+            room = x_B[rows]
+        if rows.size == 0 and np.isinf(upper[q]):
+            status = 3
+            break
+        ratios = room / np.abs(g[rows])
+        theta = ratios.min(initial=np.inf)
+
+        if upper[q] <= theta:
+            # Bound flip: x_q crosses its box, the basis stays as it is
+            theta = upper[q]
+            x_B -= theta * g
+            rhs -= (theta if not at_upper[q] else -theta) * a_q
+            at_upper[q] = not at_upper[q]
+            degenerate = degenerate + 1 if theta <= tol else 0
+            flips += 1
+            nit += 1
+            continue
+
+        ties = rows[ratios <= theta + tol]
+        if bland:
+            r = ties[np.argmin(np.asarray(factor.basis)[ties])]
+        else:
+            r = ties[np.argmax(np.abs(g[ties]))]
+        theta = max(ratios[np.searchsorted(rows, r)], 0.0)
+        degenerate = degenerate + 1 if theta <= tol else 0
+
+        # Pivot: update the basic solution and the factorization. The
+        # leaving variable becomes nonbasic at the bound it reached
+        p = factor.basis[r]
+        x_B -= theta * g
+        if at_upper[q]:
+            x_B[r] = upper[q] - theta
+            at_upper[q] = False
+            rhs += upper[q] * a_q
+        else:
+            x_B[r] = theta
+        if g[r] < 0:
+            at_upper[p] = True
+            rhs -= upper[p] * column(A, p)
+        is_basic[p] = False
+        is_basic[q] = True
+        if factor.update(r, q, d):
+            x_B = factor.ftran(rhs)
+        nit += 1
+
+    x_N = np.where(at_upper, upper, 0.0)
+    result = make_result(c, factor, x_B, y, status, nit, x_N, lower)
+    result.at_upper = at_upper
+    result.flips = flips
+    return result
+
+
+def dual_simplex(c, A, b, basis, maxiter=None, tol=1e-9, refactor_every=64,
+                 bounds=None, at_upper=None, cutoff=None):
+    """Minimize c @ x subject to A @ x = b, lb <= x <= ub from a dual feasible basis.
+
+    This is the re-solve path after b or the bounds changed (a new
+    requirement, a branch in branch-and-bound): the previous optimal basis
+    still prices out, and every pivot removes the basic variable furthest
+    outside its bounds while keeping the reduced costs of the right sign.
+    Bounds are handled as in ``revised_simplex``; nonbasic variables in
+    ``at_upper`` sit at their upper bound. Status 2 means the change made
+    the problem infeasible. The objective only rises from pivot to pivot,
+    so with ``cutoff`` set the solve stops with status 4 as soon as it
+    reaches that value. Returns the same fields as ``revised_simplex``.
+    """
+    c = np.asarray(c, dtype=float)
+    A = as_matrix(A)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    if maxiter is None:
+        maxiter = 50 * (m + n)
+
+    lower, upper = as_bounds(bounds, n)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("lower bounds must be finite")
+    upper = upper - lower
+    if np.any(upper < 0):
+        raise ValueError("lower bound above upper bound")
+    if lower.any():
+        b = b - A @ lower
+
+    factor = BasisFactor(A, basis, refactor_every)
+    is_basic = np.zeros(n, dtype=bool)
+    is_basic[factor.basis] = True
+    at_upper = np.zeros(n, dtype=bool) if at_upper is None else np.array(at_upper, dtype=bool)
+    at_upper &= ~is_basic
+    if np.isinf(upper[at_upper]).any():
+        raise ValueError("at_upper variables need a finite upper bound")
+    rhs = b - A @ np.where(at_upper, upper, 0.0) if at_upper.any() else b.copy()
+    x_B = factor.ftran(rhs)
+    y = factor.btran(c[factor.basis])
+    dj = c - A.T @ y
+    if np.any(dj[~is_basic & ~at_upper] < -tol) or np.any(dj[at_upper] > tol):
+        raise ValueError("starting basis is not dual feasible")
+    offset = c @ lower
+    nit = 0
+    status = 0
+
+    while True:
+        # Leaving row: the basic variable furthest outside its bounds
+        excess = x_B - upper[factor.basis]
+        r = np.argmax(np.maximum(-x_B, excess))
+        rises = x_B[r] < -tol
+        if not rises and excess[r] <= tol:
+            break
+        if cutoff is not None:
+            x_N = np.where(at_upper, upper, 0.0)
+            if c[factor.basis] @ x_B + c[at_upper] @ x_N[at_upper] + offset >= cutoff:
+                status = 4
+                break
+        if nit >= maxiter:
+            status = 1
+            break
+
+        # Entering column: dual ratio test along row r of B^-1 A. A column
+        # at its lower bound moves x_B[r] up when alpha < 0, one at its upper
+        # bound when alpha > 0; the leaving variable must rise if it is below
+        # zero and fall if it is above its upper bound
+        e = np.zeros(m)
+        e[r] = 1.0
+        alpha = A.T @ factor.btran(e)
+        alpha[is_basic] = 0.0
+        direction = np.where(at_upper, -alpha, alpha)
+        if not rises:
+            direction = -direction
+        candidates = np.flatnonzero(direction < -tol)
+        if candidates.size == 0:
+            status = 2
+            break
+        dj = c[candidates] - A[:, candidates].T @ y
+        dj[at_upper[candidates]] *= -1.0
+        ratios = np.maximum(dj, 0.0) / np.abs(alpha[candidates])
+        ties = candidates[ratios <= ratios.min() + tol]
+        q = ties[np.argmax(np.abs(alpha[ties]))]
+
+        # Pivot: x_q moves until the leaving variable reaches the bound it
+        # violated, then becomes nonbasic there
+        p = factor.basis[r]
+        d = factor.ftran(column(A, q))
+        target = 0.0 if rises else upper[p]
+        theta = (x_B[r] - target) / d[r]
+        x_B -= theta * d
+        x_B[r] = (upper[q] if at_upper[q] else 0.0) + theta
+        if at_upper[q]:
+            at_upper[q] = False
+            rhs += upper[q] * column(A, q)
+        if not rises:
+            at_upper[p] = True
+            rhs -= upper[p] * column(A, p)
+        is_basic[p] = False
+        is_basic[q] = True
+        if factor.update(r, q, d):
+            x_B = factor.ftran(rhs)
+        y = factor.btran(c[factor.basis])
+        nit += 1
+
+    x_N = np.where(at_upper, upper, 0.0)
+    result = make_result(c, factor, x_B, y, status, nit, x_N, lower)
+    result.at_upper = at_upper
+    return result
+
+
+def make_result(c, factor, x_B, y, status, nit, x_N=None, lower=0.0):
+    x = np.zeros(len(c)) if x_N is None else x_N
+    x[factor.basis] = x_B
+    x += lower
+    return OptimizeResult(
+        x=x, fun=float(c @ x), status=status, message=MESSAGES[status],
+        success=status == 0, nit=nit, basis=np.array(factor.basis), y=y,
+    )
+
+
+def add_artificials(A, b):
+    """Append one artificial column per row of A @ x = b.
+
+    Rows with b < 0 are negated first so the artificial basis is feasible.
+    Returns the extended matrix, the adjusted right-hand side and the row
+    signs; column n + i is the artificial of row i.
+    """
+    A = as_matrix(A)
+    b = np.asarray(b, dtype=float)
+    m = A.shape[0]
+    sign = np.where(b < 0, -1.0, 1.0)
+    if sp.issparse(A):
+        A = sp.hstack((sp.diags(sign) @ A, sp.identity(m)), format='csc')
+    else:
+        A = np.hstack((A * sign[:, None], np.eye(m)))
+    return A, b * sign, sign
+
+
+def feasibility_tol(b):
+    return 1e-7 * max(1.0, np.abs(b).max(initial=0.0))
+
+
+def shift_bounds(A, b, bounds, extra):
+    """Move the lower bounds of the columns of A to zero.
+
+    Returns the lower bounds, b - A @ lower and the bounds of the shifted
+    columns followed by ``extra`` columns bounded by (0, inf), e.g. the
+    artificials or slacks appended afterwards.
+    """
+    A = as_matrix(A)
+    lower, upper = as_bounds(bounds, A.shape[1])
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("lower bounds must be finite")
+    b = np.asarray(b, dtype=float)
+    if lower.any():
+        b = b - A @ lower
+    shifted = np.zeros((len(lower) + extra, 2))
+    shifted[:, 1] = np.inf
+    shifted[:len(lower), 1] = upper - lower
+    return lower, b, shifted
+
+
+def big_m(c, A, b, M=1e6, bounds=None, **options):
+    """Minimize c @ x subject to A @ x = b, lb <= x <= ub by the Big-M method.
+
+    One artificial column with cost M is appended per row and used as the
+    starting basis. If an artificial is still positive at the optimum the
+    problem is reported infeasible (status 2). ``x`` holds the original
+    variables only.
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    lower, b, shifted = shift_bounds(A, b, bounds, len(b))
+    A, b, sign = add_artificials(A, b)
+    m = len(b)
+    c_big = np.concatenate((c, np.full(m, float(M))))
+    result = revised_simplex(c_big, A, b, basis=range(n, n + m), bounds=shifted, **options)
+    if result.status == 0 and np.any(result.x[n:] > feasibility_tol(b)):
+        result.status = 2
+        result.message = MESSAGES[2]
+        result.success = False
+    result.x = result.x[:n] + lower
+    result.fun = float(c @ result.x)
+    result.y = result.y * sign
+    result.at_upper = result.at_upper[:n]
+    return result
+
+
+def two_phase(c, A, b, bounds=None, **options):
+    """Minimize c @ x subject to A @ x = b, lb <= x <= ub by the two-phase method.
+
+    Phase I minimizes the sum of the artificials from the artificial basis,
+    so no penalty constant is needed. Artificials left basic at zero are
+    then pivoted out where possible and Phase II starts from that basis;
+    the ones that cannot leave belong to redundant rows and stay basic at
+    zero. ``nit`` counts both phases, ``nit_phase1`` the first one only.
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    lower, b, shifted = shift_bounds(A, b, bounds, len(b))
+    A1, b, sign = add_artificials(A, b)
+    m = len(b)
+    tol = options.get('tol', 1e-9)
+
+    cost = np.concatenate((np.zeros(n), np.ones(m)))
+    phase1 = revised_simplex(cost, A1, b, basis=range(n, n + m), bounds=shifted, **options)
+    if phase1.status != 0 or phase1.fun > feasibility_tol(b):
+        if phase1.status == 0:
+            phase1.status = 2
+            phase1.message = MESSAGES[2]
+            phase1.success = False
+        phase1.x = phase1.x[:n] + lower
+        phase1.fun = float(c @ phase1.x)
+        phase1.at_upper = phase1.at_upper[:n]
+        phase1.nit_phase1 = phase1.nit
+        return phase1
+
+    # Swap zero-valued artificials for structural columns (degenerate pivots);
+    # a column that enters from its upper bound stays there as a basic value
+    A = A1[:, :n]
+    at_upper = phase1.at_upper
+    factor = BasisFactor(A1, phase1.basis)
+    for r in range(m):
+        if factor.basis[r] < n:
+            continue
+        e = np.zeros(m)
+        e[r] = 1.0
+        row = A.T @ factor.btran(e)
+        row[[q for q in factor.basis if q < n]] = 0.0
+        candidates = np.flatnonzero(np.abs(row) > tol)
+        if candidates.size:
+            q = candidates[np.argmax(np.abs(row[candidates]))]
+            factor.update(r, q, factor.ftran(column(A1, q)))
+            at_upper[q] = False
+
+    # Phase II keeps only the artificials of redundant rows
+    keep = [q for q in factor.basis if q >= n]
+    A2 = A1[:, list(range(n)) + keep]
+    position = {q: n + k for k, q in enumerate(keep)}
+    basis = [position.get(q, q) for q in factor.basis]
+    cost = np.concatenate((c, np.zeros(len(keep))))
+    result = revised_simplex(cost, A2, b, basis, bounds=shifted[:n + len(keep)],
+                             at_upper=np.concatenate((at_upper[:n], np.zeros(len(keep), dtype=bool))),
+                             **options)
+
+    columns = np.array(list(range(n)) + keep)
+    result.basis = columns[result.basis]
+    result.x = result.x[:n] + lower
+    result.fun = float(c @ result.x)
+    result.y = result.y * sign
+    result.at_upper = result.at_upper[:n]
+    result.nit_phase1 = phase1.nit
+    result.nit += phase1.nit
+    return result
+
+
+def solve_leq(c, A_ub, b_ub, bounds=None, **options):
+    """Minimize c @ x subject to A_ub @ x <= b_ub, lb <= x <= ub.
+
+    Slack columns are appended and used as the starting basis, so
+    b_ub - A_ub @ lb must be nonnegative. Upper bounds are kept out of
+    A_ub (see ``revised_simplex``). The returned ``x`` holds the original
+    variables only; the slacks are in ``slack``.
+    """
+    A_ub = as_matrix(A_ub)
+    m, n = A_ub.shape
+    if sp.issparse(A_ub):
+        A = sp.hstack((A_ub, sp.identity(m)), format='csc')
+    else:
+        A = np.hstack((A_ub, np.eye(m)))
+    c = np.concatenate((np.asarray(c, dtype=float), np.zeros(m)))
+    lower, upper = as_bounds(bounds, n)
+    bounds = np.zeros((n + m, 2))
+    bounds[:, 1] = np.inf
+    bounds[:n, 0], bounds[:n, 1] = lower, upper
+    result = revised_simplex(c, A, b_ub, basis=range(n, n + m), bounds=bounds, **options)
+    result.slack = result.x[n:]
+    result.x = result.x[:n]
+    result.at_upper = result.at_upper[:n]
+    return result
+
+
+def standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds):
+    """Slack form  [A_ub I; A_eq 0] @ (x, s) = b  and its (n + m_ub, 2) bounds."""
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    blocks, rhs = [], []
+    m_ub = 0
+    if A_ub is not None:
+        A_ub = as_matrix(A_ub)
+        m_ub = A_ub.shape[0]
+        blocks.append(A_ub)
+        rhs.append(np.asarray(b_ub, dtype=float))
+    if A_eq is not None:
+        blocks.append(as_matrix(A_eq))
+        rhs.append(np.asarray(b_eq, dtype=float))
+    if not blocks:
+        raise ValueError("the problem has no constraints")
+    m = sum(block.shape[0] for block in blocks)
+    slack = np.zeros((m, m_ub))
+    slack[:m_ub] = np.eye(m_ub)
+    if any(sp.issparse(block) for block in blocks):
+        A = sp.hstack((sp.vstack(blocks), sp.csc_matrix(slack)), format='csc')
+    else:
+        A = np.hstack((np.vstack(blocks), slack))
+    lower, upper = as_bounds(bounds, n)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("lower bounds must be finite")
+    box = np.zeros((n + m_ub, 2))
+    box[:, 1] = np.inf
+    box[:n, 0], box[:n, 1] = lower, upper
+    return np.concatenate((c, np.zeros(m_ub))), A, np.concatenate(rhs), box
+
+
+def solve_linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                  method='two-phase', **options):
+    """Minimize c @ x over ``linprog``-style constraints.
+
+    The slack form of ``standard_form`` is solved by ``two_phase`` (or
+    ``big_m`` with ``method='big-m'``), so any right-hand side signs and
+    finite lower bounds are accepted. ``x`` and ``slack`` are those of the
+    original problem, and ``ineqlin`` / ``eqlin`` carry the multipliers of
+    the rows as ``linprog`` marginals.
+    """
+    solvers = {'two-phase': two_phase, 'big-m': big_m}
+    if method not in solvers:
+        raise ValueError(f"method must be one of {sorted(solvers)}, got {method!r}")
+    n = len(c)
+    c, A, b, box = standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds)
+    result = solvers[method](c, A, b, bounds=box, **options)
+    m_ub = len(box) - n
+    result.slack = result.x[n:]
+    result.x = result.x[:n]
+    result.at_upper = result.at_upper[:n]
+    result.ineqlin = OptimizeResult(marginals=result.y[:m_ub])
+    result.eqlin = OptimizeResult(marginals=result.y[m_ub:])
+    return result
@@ -0,0 +1,174 @@
+"""Solve many independent LP variants on a process pool.
+
+A scenario is one ``linprog`` problem, given as a dict of its keyword
+arguments (``c``, ``A_ub``, ``b_ub``, ``A_eq``, ``b_eq``, ``bounds``) or as a
+tuple in that order. Variants of one model usually share the constraint
+matrix and differ only in costs or right-hand sides, so ``run_scenarios``
+takes those common arrays separately as ``shared``: they are copied once
+into ``multiprocessing.shared_memory`` blocks that every worker maps
+read-only, and any key a scenario leaves out (or sets to None) is taken
+from there. Only the per-scenario vectors travel through the task queue.
+Shared ``bounds`` are turned into a float array first (+-inf for None);
+shared values that are not numeric arrays are pickled to each worker once.
+
+Scenarios are read lazily from any iterable, sent ``chunksize`` at a time
+with a bounded number of chunks in flight, and ``(index, result)`` pairs
+are yielded as soon as their chunk finishes, so results arrive out of
+order.
+"""
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse as sp
+
+from solvers.bounds import as_bounds
+from solvers.presolve import presolved_linprog
+from solvers.result import OptimizeResult
+
+KEYS = ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq', 'bounds')
+
+# Worker state, set once per process by init_worker
+_shared = {}
+_blocks = []
+_method = 'highs'
+_presolve = False
+
+
+def shareable(value):
+    """Whether value is a numeric (dense or sparse) array ``share`` can copy."""
+    return sp.issparse(value) or np.asarray(value).dtype.kind in 'biufc'
+
+
+def share(arrays):
+    """Copy dense or sparse numeric arrays into shared memory.
+
+    Returns the blocks (to be closed and unlinked by the owner) and a
+    picklable spec for ``attach``. Object arrays are refused: their
+    elements are pointers into this process.
+    """
+    blocks, specs = [], {}
+    for key, value in arrays.items():
+        if sp.issparse(value):
+            value = sp.csr_matrix(value)
+            parts = {'data': value.data, 'indices': value.indices, 'indptr': value.indptr}
+            shape = value.shape
+        else:
+            value = np.ascontiguousarray(value)
+            if value.dtype.hasobject:
+                raise TypeError(f"cannot share {key!r}: object arrays hold pointers into "
+                                "this process")
+            parts, shape = {'array': value}, None
+        spec = {}
+        for name, array in parts.items():
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+            blocks.append(block)
+            spec[name] = (block.name, array.shape, array.dtype.str)
+        specs[key] = (shape, spec)
+    return blocks, specs
+
+
+def attach(specs):
+    """Arrays (without copying) for the spec made by ``share``."""
+    arrays = {}
+    for key, (shape, spec) in specs.items():
+        parts = {}
+        for name, (block_name, part_shape, dtype) in spec.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            _blocks.append(block)
+            parts[name] = np.ndarray(part_shape, dtype, buffer=block.buf)
+            parts[name].flags.writeable = False
+        if shape is None:
+            arrays[key] = parts['array']
+        else:
+            arrays[key] = sp.csr_matrix((parts['data'], parts['indices'], parts['indptr']),
+                                        shape=shape, copy=False)
+    return arrays
+
+
+def init_worker(specs, method, pickled=None, presolve=False):
+    global _method, _presolve
+    _shared.update(attach(specs))
+    _shared.update(pickled or {})
+    _method = method
+    _presolve = presolve
+
+
+def as_problem(scenario):
+    if isinstance(scenario, dict):
+        return scenario
+    return dict(zip(KEYS, scenario))
+
+
+def solve(problem, shared, method, presolve=False):
+    """``linprog`` on one scenario with missing keys filled from ``shared``."""
+    from scipy.optimize import linprog
+
+    problem = {key: value for key, value in as_problem(problem).items() if value is not None}
+    problem = {**shared, **problem}
+    if presolve:
+        result = presolved_linprog(method=method, **problem)
+    else:
+        result = linprog(method=method, **problem)
+    return OptimizeResult(x=result.x, fun=result.fun, status=result.status,
+                          success=result.success, nit=result.nit, message=result.message)
+
+
+def solve_chunk(chunk):
+    return [(index, solve(problem, _shared, _method, _presolve)) for index, problem in chunk]
+
+
+def run_scenarios(scenarios, shared=None, workers=None, chunksize=32, in_flight=None,
+                  method='highs', presolve=False):
+    """Yield ``(index, result)`` for every scenario as its chunk finishes.
+
+    ``workers=1`` solves in this process, in order, without a pool. With
+    ``presolve=True`` each scenario goes through ``presolved_linprog``.
+    ``in_flight`` bounds the number of submitted chunks (default: twice the
+    number of workers), which also bounds how far the scenario iterable is
+    read ahead.
+    """
+    shared = shared or {}
+    if workers == 1:
+        for index, problem in enumerate(scenarios):
+            yield index, solve(problem, shared, method, presolve)
+        return
+
+    workers = workers or os.cpu_count()
+    shared = dict(shared)
+    if shared.get('bounds') is not None:
+        # A list with None in it would become an object array; a single
+        # (lb, ub) pair stays one row, which linprog applies to every variable
+        shared['bounds'] = np.column_stack(as_bounds(shared['bounds']))
+    # Anything that is not a numeric array goes to the workers pickled
+    pickled = {key: value for key, value in shared.items() if not shareable(value)}
+    blocks, specs = share({key: value for key, value in shared.items() if key not in pickled})
+    pool = ProcessPoolExecutor(workers, initializer=init_worker,
+                               initargs=(specs, method, pickled, presolve))
+    try:
+        in_flight = in_flight or 2 * workers
+        numbered = enumerate(scenarios)
+        chunks = iter(lambda: list(itertools.islice(numbered, chunksize)), [])
+        pending = {pool.submit(solve_chunk, chunk)
+                   for chunk in itertools.islice(chunks, in_flight)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+            for chunk in itertools.islice(chunks, len(done)):
+                pending.add(pool.submit(solve_chunk, chunk))
+    finally:
+        pool.shutdown(cancel_futures=True)
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def solve_scenarios(scenarios, **options):
+    """All results of ``run_scenarios`` as a list in scenario order."""
+    results = dict(run_scenarios(scenarios, **options))
+    return [results[index] for index in range(len(results))]
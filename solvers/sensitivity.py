@@ -0,0 +1,144 @@
+"""Sensitivity analysis and batched what-if scenarios from one optimal basis.
+
+For   min c @ x   subject to   A @ x = b,  x >= 0   and an optimal basis B:
+
+* shadow prices    y = B^-T c_B
+* reduced costs    d = c - A.T @ y
+* cost ranging     the interval each c_j can move in while d stays >= 0
+* RHS ranging      the interval each b_i can move in while B^-1 b stays >= 0
+
+A basis stays optimal for a cost vector as long as its reduced costs are
+nonnegative, and for a right-hand side as long as B^-1 b is nonnegative, so
+a whole batch of scenarios is checked with one matrix solve. Only scenarios
+outside the valid range are re-pivoted (primal simplex for costs, dual
+simplex for right-hand sides), and each new basis is checked against the
+remaining scenarios before the next re-solve.
+"""
+
+import numpy as np
+
+from solvers.result import OptimizeResult
+from solvers.revised_simplex import (BasisFactor, as_matrix, dual_simplex,
+                                     revised_simplex)
+
+
+class SensitivityAnalysis:
+    """Post-optimal analysis of a standard-form LP at an optimal basis."""
+
+    def __init__(self, c, A, b, basis, tol=1e-9):
+        self.c = np.asarray(c, dtype=float)
+        self.A = as_matrix(A)
+        self.b = np.asarray(b, dtype=float)
+        self.basis = np.asarray(basis)
+        self.tol = tol
+        self.factor = BasisFactor(self.A, self.basis)
+        self.x_B = self.factor.solve(self.b)
+        self.shadow_prices = self.factor.solve(self.c[self.basis], trans=True)
+        self.reduced_costs = self.c - self.A.T @ self.shadow_prices
+        self.reduced_costs[self.basis] = 0.0
+
+    def ranging(self):
+        """Cost and right-hand-side ranges over which the basis stays optimal.
+
+        Returns ``cost_lower``/``cost_upper`` (per variable) and
+        ``rhs_lower``/``rhs_upper`` (per row) as absolute values, together
+        with the shadow prices and reduced costs.
+        """
+        m, n = self.A.shape
+        tol = self.tol
+        B_inv = self.factor.solve(np.eye(m))
+        d = self.reduced_costs
+        nonbasic = np.ones(n, dtype=bool)
+        nonbasic[self.basis] = False
+
+        # Nonbasic costs may rise freely and drop by their reduced cost;
+        # basic costs are limited by the rows of B^-1 A over nonbasic columns
+        cost_lower = self.c - d
+        cost_upper = np.full(n, np.inf)
+        alpha = np.asarray((self.A.T @ B_inv.T).T)[:, nonbasic]
+        d_N = d[nonbasic]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = d_N / alpha
+        up = np.where(alpha > tol, ratios, np.inf).min(axis=1, initial=np.inf)
+        down = np.where(alpha < -tol, ratios, -np.inf).max(axis=1, initial=-np.inf)
+        cost_lower[self.basis] = self.c[self.basis] + down
+        cost_upper[self.basis] = self.c[self.basis] + up
+
+        # b_i + delta keeps x_B + delta * B^-1 e_i >= 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = -self.x_B[:, None] / B_inv
+        up = np.where(B_inv < -tol, ratios, np.inf).min(axis=0, initial=np.inf)
+        down = np.where(B_inv > tol, ratios, -np.inf).max(axis=0, initial=-np.inf)
+
+        return OptimizeResult(
+            shadow_prices=self.shadow_prices, reduced_costs=d,
+            cost_lower=cost_lower, cost_upper=cost_upper,
+            rhs_lower=self.b + down, rhs_upper=self.b + up,
+        )
+
+    def cost_scenarios(self, costs):
+        """Optimal solutions for every row of a (k, n) array of cost vectors."""
+        costs = np.atleast_2d(np.asarray(costs, dtype=float))
+        rhs = np.broadcast_to(self.b, (len(costs), len(self.b)))
+
+        def check(factor, basis, pending):
+            Y = factor.solve(costs[pending][:, basis].T, trans=True)
+            D = costs[pending] - (self.A.T @ Y).T
+            return np.all(D >= -self.tol, axis=1)
+
+        def resolve(s, basis):
+            return revised_simplex(costs[s], self.A, self.b, basis, tol=self.tol)
+
+        return self._scenarios(costs, rhs, check, resolve)
+
+    def rhs_scenarios(self, rhs):
+        """Optimal solutions for every row of a (k, m) array of right-hand sides."""
+        rhs = np.atleast_2d(np.asarray(rhs, dtype=float))
+        costs = np.broadcast_to(self.c, (len(rhs), len(self.c)))
+
+        def check(factor, basis, pending):
+            X_B = factor.solve(rhs[pending].T)
+            return np.all(X_B >= -self.tol, axis=0)
+
+        def resolve(s, basis):
+            return dual_simplex(self.c, self.A, rhs[s], basis, tol=self.tol)
+
+        return self._scenarios(costs, rhs, check, resolve)
+
+    def _scenarios(self, costs, rhs, check, resolve):
+        k, n = costs.shape
+        x = np.zeros((k, n))
+        fun = np.full(k, np.nan)
+        status = np.zeros(k, dtype=int)
+        which = np.full(k, -1)
+        factor, basis = self.factor, self.basis
+        bases = [np.array(basis)]
+        resolves = 0
+        pending = np.arange(k)
+
+        while pending.size:
+            # Every pending scenario the current basis is optimal for
+            valid = check(factor, basis, pending)
+            done = pending[valid]
+            if done.size:
+                x[done[:, None], basis] = factor.solve(rhs[done].T).T
+                fun[done] = np.einsum('ij,ij->i', costs[done], x[done])
+                which[done] = len(bases) - 1
+            pending = pending[~valid]
+            if pending.size == 0:
+                break
+
+            # Re-pivot the first one left and carry on from its basis
+            s, pending = pending[0], pending[1:]
+            result = resolve(s, basis)
+            resolves += 1
+            x[s], status[s] = result.x, result.status
+            if result.status == 0:
+                fun[s] = result.fun
+                basis = result.basis
+                factor = BasisFactor(self.A, basis)
+                bases.append(np.array(basis))
+                which[s] = len(bases) - 1
+
+        return OptimizeResult(x=x, fun=fun, status=status, basis_index=which,
+                              bases=bases, resolves=resolves)
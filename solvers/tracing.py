@@ -0,0 +1,87 @@
+"""Recording the iterations of ``pricing.tableau_simplex``.
+
+``TableauRecorder`` is a ``callback`` for ``tableau_simplex`` that keeps a
+copy of every tableau it is shown, and the pivot that produced it, so a run
+can be printed, plotted or compared after the fact instead of being dumped
+while it runs. Entry 0 is the starting tableau; entry k the tableau after
+the k-th pivot, with that pivot's fields:
+
+``nit``        pivots made so far
+``entering``   column that entered the basis
+``leaving``    row it entered in
+``left``       variable (column) that left the basis
+``element``    pivot element, before the pivot
+``objective``  ``-tableau[-1, -1]`` after the pivot
+``pricing``, ``ratio``, ``pivot``   seconds spent in each phase
+
+Entry 0 has -1 in ``entering``, ``leaving`` and ``left``.
+"""
+
+import numpy as np
+
+from solvers.result import OptimizeResult
+
+STEP = np.dtype([
+    ('nit', np.int64), ('entering', np.int64), ('leaving', np.int64), ('left', np.int64),
+    ('element', np.float64), ('objective', np.float64),
+    ('pricing', np.float64), ('ratio', np.float64), ('pivot', np.float64),
+])
+
+
+class TableauRecorder:
+    """Tableaus, bases and pivots of one run in preallocated arrays.
+
+    Storage for ``capacity`` entries is allocated at the first call and
+    doubled whenever it fills up. ``dtype=np.float32`` halves the tableau
+    storage, at the cost of printing the recorded tableaus to single
+    precision; ``tableaus=False`` keeps only the bases and pivot fields,
+    which is enough for profiling runs whose tableaus would not fit.
+    """
+
+    def __init__(self, capacity=16, dtype=np.float64, tableaus=True):
+        self.capacity = capacity
+        self.dtype = dtype
+        self.keep_tableaus = tableaus
+        self.size = 0
+        self.tableaus = self.bases = self.steps = None
+
+    def __call__(self, step):
+        if self.tableaus is None:
+            shape = step.tableau.shape if self.keep_tableaus else (0, 0)
+            self.tableaus = np.empty((self.capacity,) + shape, self.dtype)
+            self.bases = np.empty((self.capacity, len(step.basis)), np.int64)
+            self.steps = np.empty(self.capacity, STEP)
+        elif self.size == len(self.tableaus):
+            self.grow()
+        k = self.size
+        if self.keep_tableaus:
+            self.tableaus[k] = step.tableau
+        self.bases[k] = step.basis
+        self.steps[k] = tuple(step[name] for name in STEP.names)
+        self.size += 1
+
+    def grow(self):
+        for name in ('tableaus', 'bases', 'steps'):
+            old = getattr(self, name)
+            new = np.empty((2 * len(old),) + old.shape[1:], old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, k):
+        if not -self.size <= k < self.size:
+            raise IndexError(k)
+        k %= self.size
+        fields = {name: self.steps[k][name].item() for name in STEP.names}
+        tableau = self.tableaus[k] if self.keep_tableaus else None
+        return OptimizeResult(tableau=tableau, basis=self.bases[k].tolist(), **fields)
+
+    def __iter__(self):
+        return (self[k] for k in range(self.size))
+
+    def times(self):
+        """Seconds per phase summed over the recorded pivots."""
+        steps = self.steps[:self.size] if self.size else np.zeros(0, STEP)
+        return {name: float(steps[name].sum()) for name in ('pricing', 'ratio', 'pivot')}
@@ -0,0 +1,478 @@
+"""Initial basic feasible solutions for large transportation problems.
+
+Every heuristic returns the allocation as a basic-cell list ``(rows, cols,
+qty)`` of exactly m + n - 1 cells: each step exhausts one row or one column,
+and when a row and a column run out together only the row is crossed out,
+so the column later receives a zero (degenerate) allocation. That keeps the
+cells a spanning tree of the rows and columns, which is the basis the
+transportation simplex needs. ``to_dense`` turns a cell list back into the
+m x n ``alloc`` matrix A4Q5.py prints.
+
+* ``north_west_corner`` merges the cumulative supply and demand breakpoints
+  with one stable sort instead of walking the grid.
+* ``least_cost`` walks the cells in sorted order without sorting the grid:
+  each row keeps its cheapest few cells and a heap merges the rows.
+* ``vogel`` keeps each row's and column's cells sorted by cost and the
+  row/column penalties in a heap, so only lines whose two cheapest open
+  cells changed get a new penalty after each allocation.
+
+``modi`` then improves any of these to optimality with the transportation
+simplex (u-v potentials, stepping-stone cycles).
+
+Costs may be given as a ``np.memmap`` or the path of a ``.npy`` file.
+``north_west_corner`` never reads them and ``least_cost`` reads them in
+row blocks, so grids larger than RAM work; ``vogel`` and ``modi`` need the
+whole matrix in memory.
+"""
+
+import heapq
+import mmap
+import os
+
+import numpy as np
+
+from solvers.result import OptimizeResult
+
+
+def balanced(supply, demand):
+    """Float copies of supply and demand, checking that they balance."""
+    s = np.array(supply, dtype=float)
+    d = np.array(demand, dtype=float)
+    if not np.isclose(s.sum(), d.sum()):
+        raise ValueError("total supply must equal total demand")
+    return s, d
+
+
+def to_dense(cells, shape):
+    """m x n allocation matrix of a (rows, cols, qty) cell list."""
+    rows, cols, qty = cells
+    alloc = np.zeros(shape)
+    alloc[rows, cols] = qty
+    return alloc
+
+
+def total_cost(cells, costs):
+    rows, cols, qty = cells
+    return float(read_cells(open_costs(costs), rows, cols) @ qty)
+
+
+def open_costs(costs):
+    """Cost matrix as an array; a ``.npy`` path is memory-mapped, not loaded."""
+    if isinstance(costs, (str, os.PathLike)):
+        return np.load(costs, mmap_mode='r')
+    return costs if isinstance(costs, np.ndarray) else np.asarray(costs)
+
+
+def file_backed(costs):
+    """Whether rows of ``costs`` can be read straight from its file."""
+    return (isinstance(costs, np.memmap) and isinstance(costs.base, mmap.mmap)
+            and costs.ndim == 2 and costs.flags.c_contiguous)
+
+
+def read_rows(costs, start, stop):
+    """Rows start:stop of the cost matrix as a new float array.
+
+    Rows of a memory-mapped file are read with ordinary file reads rather
+    than through the mapping, so the pages scanned never count towards the
+    process's resident memory.
+    """
+    if file_backed(costs):
+        n = costs.shape[1]
+        rows = np.fromfile(costs.filename, dtype=costs.dtype, count=(stop - start) * n,
+                           offset=costs.offset + start * n * costs.itemsize)
+        rows = rows.reshape(-1, n)
+    else:
+        rows = costs[start:stop]
+    return np.array(rows, dtype=np.result_type(costs.dtype, np.float32))
+
+
+def read_cells(costs, rows, cols):
+    """Costs of the cells (rows[k], cols[k]), reading only those cells."""
+    if not file_backed(costs):
+        return np.asarray(costs)[rows, cols]
+    n, size = costs.shape[1], costs.itemsize
+    with open(costs.filename, 'rb') as f:
+        fd = f.fileno()
+        data = b''.join(os.pread(fd, size, costs.offset + (i * n + j) * size)
+                        for i, j in zip(np.asarray(rows).tolist(), np.asarray(cols).tolist()))
+    return np.frombuffer(data, dtype=costs.dtype)
+
+
+def north_west_corner(supply, demand):
+    """North-West Corner Rule.
+
+    The allocation path is a staircase from (0, 0) to (m-1, n-1): it moves
+    down whenever a row's cumulative supply is used up and right whenever a
+    column's cumulative demand is met. Sorting those breakpoints gives every
+    cell and its quantity at once.
+    """
+    s, d = balanced(supply, demand)
+    m, n = len(s), len(d)
+    row_ends = np.cumsum(s)[:-1]
+    col_ends = np.cumsum(d)[:-1]
+
+    # Stable sort puts a row end before an equal column end (move down first)
+    events = np.concatenate((row_ends, col_ends))
+    order = np.argsort(events, kind='stable')
+    is_row = order < m - 1
+
+    rows = np.concatenate(([0], np.cumsum(is_row)))
+    cols = np.concatenate(([0], np.cumsum(~is_row)))
+    qty = np.diff(np.concatenate(([0.0], events[order], [s.sum()])))
+    return rows, cols, qty
+
+
+def least_cost(supply, demand, costs, candidates=64, block=2**22):
+    """Least Cost Method without sorting the whole grid.
+
+    Cells are taken in the order of one stable sort of all costs, but that
+    order is produced lazily: a single pass over the grid, ``block`` cells
+    at a time, keeps the ``candidates`` cheapest cells of every row, and a
+    heap merges the rows' cheapest open candidates. A row whose candidates
+    all lie in crossed-out columns is read again on its own for its next
+    cheapest open cells. Memory is O((m + n) * candidates + block) whatever
+    the grid size, so ``costs`` may be a ``np.memmap`` or the path of a
+    ``.npy`` file larger than RAM, of any numeric dtype (float32 is read as
+    float32).
+    """
+    s, d = balanced(supply, demand)
+    costs = open_costs(costs)
+    m, n = len(s), len(d)
+    k = min(candidates, n)
+    col_open = np.ones(n, dtype=bool)
+    cand_cols = np.empty((m, k), dtype=np.int32 if n < 2**31 else np.int64)
+    cand_costs = np.empty((m, k), dtype=np.result_type(costs.dtype, np.float32))
+    step = max(1, block // n)
+    for start in range(0, m, step):
+        stop = min(start + step, m)
+        cand_cols[start:stop], cand_costs[start:stop] = cheapest(read_rows(costs, start, stop), k)
+
+    row_open = [True] * m
+    pointer = [0] * m
+    heap = list(zip(cand_costs[:, 0].tolist(), (np.arange(m) * n + cand_cols[:, 0]).tolist(), range(m)))
+    heapq.heapify(heap)
+    s, d = s.tolist(), d.tolist()
+    rows_left = m
+    cells = []
+
+    while len(cells) < m + n - 1:
+        _, flat, i = heapq.heappop(heap)
+        if not row_open[i]:
+            continue
+        j = flat - i * n
+        if col_open[j]:
+            qty = min(s[i], d[j])
+            s[i] -= qty
+            d[j] -= qty
+            cells.append((i, j, qty))
+            if s[i] == 0 and rows_left > 1:
+                row_open[i] = False
+                rows_left -= 1
+                continue
+            col_open[j] = False
+            if len(cells) == m + n - 1:
+                break
+
+        # Next candidate of row i in an open column, re-reading the row
+        # once all of its candidates are crossed out
+        p = pointer[i] + 1
+        while p < k and not col_open[cand_cols[i, p]]:
+            p += 1
+        if p == k:
+            row = read_rows(costs, i, i + 1)
+            row[:, ~col_open] = np.inf
+            cand_cols[i:i + 1], cand_costs[i:i + 1] = cheapest(row, k)
+            p = 0
+        pointer[i] = p
+        heapq.heappush(heap, (cand_costs[i, p].item(), i * n + int(cand_cols[i, p]), i))
+    return cell_arrays(cells)
+
+
+def cheapest(block, k):
+    """Columns and costs of the k cheapest cells of each row, in the order
+    (cost, column); ties at the k-th cost keep the lowest columns."""
+    kth = np.partition(block, k - 1, axis=1)[:, k - 1:k]
+    rows, cols = np.nonzero(block <= kth)
+    values = block[rows, cols]
+    order = np.lexsort((cols, values, rows))
+    counts = np.bincount(rows, minlength=len(block))
+    starts = np.cumsum(counts) - counts
+    order = order[(starts[:, None] + np.arange(k)).ravel()]
+    return cols[order].reshape(-1, k), values[order].reshape(-1, k)
+
+
+def vogel(supply, demand, costs):
+    """Vogel's Approximation Method with heap-maintained penalties.
+
+    A line's penalty is the gap between its two cheapest open cells (its
+    cheapest cost once only one is left). Heap entries carry a version
+    number, so stale penalties are skipped when popped instead of being
+    searched for and removed.
+    """
+    s, d = balanced(supply, demand)
+    costs = np.asarray(costs, dtype=float)
+    m, n = len(s), len(d)
+    s, d = s.tolist(), d.tolist()
+
+    # lines[0] are the rows, lines[1] the columns; each line lists the
+    # indices of the opposite lines sorted by cost
+    order = (np.argsort(costs, axis=1, kind='stable'),
+             np.argsort(costs.T, axis=1, kind='stable'))
+    line_costs = (costs, costs.T)
+    is_open = (np.ones(m, dtype=bool), np.ones(n, dtype=bool))
+    pointer = ([0] * m, [0] * n)
+    cheapest = (np.full(m, -1), np.full(n, -1))     # two cheapest open cells
+    second = (np.full(m, -1), np.full(n, -1))
+    version = ([0] * m, [0] * n)
+    heap = []
+
+    def refresh(kind, k):
+        """Recompute the penalty of line k and push it on the heap."""
+        line = order[kind][k]
+        other = is_open[1 - kind]
+        p = pointer[kind][k]
+        while not other[line[p]]:
+            p += 1
+        pointer[kind][k] = p
+        q = p + 1
+        while q < len(line) and not other[line[q]]:
+            q += 1
+        first = line[p]
+        cost = line_costs[kind][k]
+        if q < len(line):
+            cheapest[kind][k], second[kind][k] = first, line[q]
+            penalty = cost[line[q]] - cost[first]
+        else:
+            cheapest[kind][k], second[kind][k] = first, -1
+            penalty = cost[first]
+        version[kind][k] += 1
+        heapq.heappush(heap, (-penalty, cost[first], kind, k, version[kind][k]))
+
+    for k in range(m):
+        refresh(0, k)
+    for k in range(n):
+        refresh(1, k)
+
+    rows_left = m
+    cells = []
+    while len(cells) < m + n - 1:
+        _, _, kind, k, stamp = heapq.heappop(heap)
+        if not is_open[kind][k] or stamp != version[kind][k]:
+            continue
+        i, j = (k, cheapest[0][k]) if kind == 0 else (cheapest[1][k], k)
+        qty = min(s[i], d[j])
+        s[i] -= qty
+        d[j] -= qty
+        cells.append((i, j, qty))
+
+        # Cross out one line; lines whose two cheapest cells used it reprice
+        if s[i] == 0 and rows_left > 1:
+            closed, line, rows_left = 0, i, rows_left - 1
+        else:
+            closed, line = 1, j
+        is_open[closed][line] = False
+        if len(cells) == m + n - 1:
+            break
+        other = 1 - closed
+        affected = np.flatnonzero(is_open[other] & ((cheapest[other] == line) |
+                                                    (second[other] == line)))
+        for k in affected.tolist():
+            refresh(other, k)
+
+    return cell_arrays(cells)
+
+
+def cell_arrays(cells):
+    rows, cols, qty = zip(*cells)
+    return np.array(rows), np.array(cols), np.array(qty)
+
+
+def basis_cells(alloc, costs):
+    """Basic-cell list of a dense allocation, padded to a spanning tree.
+
+    The nonzero cells of ``alloc`` may be fewer than m + n - 1 (degenerate)
+    or the allocation may come from a method that drops zero cells; the
+    cheapest cells joining separate components are added with quantity 0.
+    """
+    alloc = np.asarray(alloc, dtype=float)
+    m, n = alloc.shape
+    parent = list(range(m + n))
+
+    def root(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    rows, cols = np.nonzero(alloc)
+    cells = []
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        a, b = root(i), root(m + j)
+        if a == b:
+            raise ValueError("allocation is not a basic solution (it has a cycle)")
+        parent[a] = b
+        cells.append((i, j, alloc[i, j]))
+
+    if len(cells) < m + n - 1:
+        for k in np.argsort(np.asarray(costs), axis=None, kind='stable').tolist():
+            i, j = divmod(k, n)
+            a, b = root(i), root(m + j)
+            if a != b:
+                parent[a] = b
+                cells.append((i, j, 0.0))
+                if len(cells) == m + n - 1:
+                    break
+    return cell_arrays(cells)
+
+
+def modi(costs, cells, maxiter=None, tol=1e-9, block=None):
+    """Improve a basic transportation solution to optimality (MODI method).
+
+    This is the network simplex specialised to the bipartite row/column
+    graph. ``cells`` is a spanning-tree cell list as returned by the
+    heuristics above (use ``basis_cells`` for a dense ``alloc``); the tree
+    is kept with parent and depth links and the potentials u, v satisfy
+    u_i + v_j = c_ij on every basic cell. The cell with the most negative
+    c_ij - u_i - v_j enters (with ``block`` set, rows are priced that many
+    at a time), and its stepping-stone cycle is the entering cell plus the
+    tree path between its row and column, found by climbing the parent
+    links in O(m + n). After the pivot only the subtree cut off by the
+    leaving cell is re-linked and has its potentials shifted.
+
+    Degenerate pivots (zero quantities) are allowed. After m + n of them in
+    a row the pivots follow Bland's rule until one moves a positive amount:
+    the improving cell with the lowest row-major index enters, and ties in
+    the ratio test leave by the lowest index, so the method cannot cycle.
+    Returns an OptimizeResult with the optimal ``cells``, ``fun``, ``nit``
+    and the potentials ``u`` and ``v``.
+    """
+    costs = np.asarray(costs, dtype=float)
+    m, n = costs.shape
+    if maxiter is None:
+        maxiter = 50 * (m + n)
+    block = m if block is None else max(1, min(block, m))
+    rows, cols, qty = cells
+    if len(rows) != m + n - 1:
+        raise ValueError("cells must hold exactly m + n - 1 basic cells")
+
+    # Nodes 0..m-1 are rows, m..m+n-1 columns; amount[(i, j)] per basic cell
+    adjacent = [set() for _ in range(m + n)]
+    amount = {}
+    for i, j, q in zip(rows.tolist(), cols.tolist(), qty.tolist()):
+        adjacent[i].add(m + j)
+        adjacent[m + j].add(i)
+        amount[i, j] = q
+
+    parent = [-1] * (m + n)
+    depth = [0] * (m + n)
+
+    def hang(top, above):
+        """Re-link the subtree at top below node above; returns its nodes."""
+        parent[top] = above
+        depth[top] = depth[above] + 1 if above >= 0 else 0
+        nodes = [top]
+        stack = [top]
+        seen = {top}
+        while stack:
+            node = stack.pop()
+            for other in adjacent[node]:
+                if other != parent[node]:
+                    # Reaching a node twice means the cells contain a cycle
+                    if other in seen:
+                        raise ValueError("cells do not form a spanning tree (they contain a cycle)")
+                    seen.add(other)
+                    parent[other] = node
+                    depth[other] = depth[node] + 1
+                    nodes.append(other)
+                    stack.append(other)
+        return nodes
+
+    # Root the tree at row 0; potentials follow parents outward from it
+    potential = np.zeros(m + n)
+    nodes = hang(0, -1)
+    if len(nodes) != m + n:
+        raise ValueError("cells do not form a spanning tree")
+    for node in nodes[1:]:
+        above = parent[node]
+        cost = costs[node, above - m] if node < m else costs[above, node - m]
+        potential[node] = cost - potential[above]
+    u, v = potential[:m], potential[m:]
+
+    nit = 0
+    status = 0
+    degenerate = 0
+    start = 0
+    while True:
+        # Pricing: most negative reduced cost, or Bland's lowest index when
+        # stalling (scanning from row 0, not from where the last scan ended)
+        bland = degenerate > m + n
+        entering = None
+        for k in range(0, m, block):
+            lo = k if bland else (start + k) % m
+            hi = min(lo + block, m)
+            reduced = costs[lo:hi] - u[lo:hi, None] - v
+            if bland:
+                hits = np.flatnonzero(reduced < -tol)
+                pick = hits[0] if hits.size else 0
+            else:
+                pick = np.argmin(reduced)
+            if reduced.flat[pick] < -tol:
+                i, j = divmod(int(pick), n)
+                entering = (lo + i, j)
+                delta = reduced.flat[pick]
+                start = hi % m
+                break
+        if entering is None:
+            break
+        if nit >= maxiter:
+            status = 1
+            break
+
+        # Stepping-stone cycle: entering cell, then the tree path from its
+        # column back to its row with alternating -, + signs
+        i, j = entering
+        a, b = i, m + j
+        up_a, up_b = [a], [b]
+        while a != b:
+            if depth[a] >= depth[b]:
+                a = parent[a]
+                up_a.append(a)
+            else:
+                b = parent[b]
+                up_b.append(b)
+        path = up_b + up_a[-2::-1]
+        steps = [(x, y - m) if x < m else (y, x - m)
+                 for x, y in zip(path[:-1], path[1:])]
+
+        minus = range(0, len(steps), 2)
+        theta = min(amount[steps[k]] for k in minus)
+        if bland:
+            k = min((k for k in minus if amount[steps[k]] == theta), key=lambda k: steps[k])
+        else:
+            k = min(minus, key=lambda k: amount[steps[k]])
+        leaving = steps[k]
+        degenerate = degenerate + 1 if theta <= tol else 0
+        for cell in steps[0::2]:
+            amount[cell] -= theta
+        for cell in steps[1::2]:
+            amount[cell] += theta
+        del amount[leaving]
+        amount[entering] = theta
+
+        # Swap the edges; the side of the leaving cell away from the root
+        # hangs from the entering cell now and its potentials shift
+        r, c = leaving
+        adjacent[r].discard(m + c)
+        adjacent[m + c].discard(r)
+        adjacent[i].add(m + j)
+        adjacent[m + j].add(i)
+        below, above = (m + j, i) if k < len(up_b) - 1 else (i, m + j)
+        subtree = np.array(hang(below, above))
+        shift = delta if below < m else -delta
+        potential[subtree[subtree < m]] += shift
+        potential[subtree[subtree >= m]] -= shift
+        nit += 1
+
+    cells = cell_arrays([(i, j, q) for (i, j), q in amount.items()])
+    return OptimizeResult(cells=cells, fun=total_cost(cells, costs), nit=nit,
+                          status=status, success=status == 0, u=u.copy(), v=v.copy())